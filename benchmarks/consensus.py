@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import timeit
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from betboard.core.consensus import league_consensus  # noqa: E402
+from betboard.models import Event, EventOdds, MarketOdds, OddsPrice  # noqa: E402
+
+NOW = datetime(2026, 10, 18, 17, 0, tzinfo=timezone.utc)
+
+
+def synthetic_league(events: int, books: int, seed: int = 0) -> list[EventOdds]:
+    rng = random.Random(seed)
+    league: list[EventOdds] = []
+    for index in range(events):
+        event = Event(
+            event_id=str(index),
+            league_key="americanfootball_nfl",
+            sport_title="NFL",
+            home_team=f"Home {index}",
+            away_team=f"Away {index}",
+            start_time=NOW,
+        )
+        markets: list[MarketOdds] = []
+        for book in range(books):
+            home = rng.choice([-150, -130, -120, -110, 100, 110, 125])
+            away = -home if abs(home) > 100 else -120
+            spread = (-110, rng.choice([-105, -110, -115]))
+            for market, point, outcomes in (
+                ("h2h", None, (event.home_team, event.away_team)),
+                ("spreads", -3.5, (event.home_team, event.away_team)),
+                ("totals", 44.5, ("Over", "Under")),
+            ):
+                prices = (home, away) if market == "h2h" else spread
+                markets.append(
+                    MarketOdds(
+                        market=market,
+                        book=f"book{book}",
+                        last_update=NOW,
+                        prices=tuple(
+                            OddsPrice(outcome=outcome, price=price)
+                            for outcome, price in zip(outcomes, prices)
+                        ),
+                        point=point,
+                    )
+                )
+        league.append(EventOdds(event=event, markets=tuple(markets)))
+    return league
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Time league-wide consensus against one call per event"
+    )
+    parser.add_argument("--events", type=int, default=60)
+    parser.add_argument("--books", type=int, default=12)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    league = synthetic_league(args.events, args.books)
+    runs = {
+        "league": lambda: league_consensus(league),
+        "per event": lambda: [league_consensus([odds]) for odds in league],
+    }
+    for name, run in runs.items():
+        best = min(timeit.repeat(run, number=1, repeat=args.repeat))
+        print(f"{name:10} {best * 1000:8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
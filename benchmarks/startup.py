@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+HEAVY_MODULES = ("textual", "requests", "feedparser")
+
+
+def _main_snippet(*argv: str) -> str:
+    return (
+        "import sys\n"
+        "from betboard.cli import main\n"
+        f"sys.argv = ['betboard', *{list(argv)!r}]\n"
+        "try:\n"
+        "    main()\n"
+        "except (SystemExit, Exception):\n"
+        "    pass\n"
+    )
+
+
+# Commands that would touch the network run against an empty HOME, so they
+# import everything they need and then stop at the missing config file.
+SUBCOMMANDS = {
+    "run": "import betboard.cli\nfrom betboard.ui.app import BetBoardApp\n",
+    "refresh": _main_snippet("refresh"),
+    "export": _main_snippet("export", "--all"),
+    "history": _main_snippet("history", "x"),
+    "replay": _main_snippet("replay"),
+    "serve": _main_snippet("serve"),
+    "news refresh": _main_snippet("news", "refresh"),
+    "news search": _main_snippet("news", "search", "x"),
+    "watchlist add": _main_snippet("watchlist", "add", "x", "--league", "NFL"),
+    "watchlist list": _main_snippet("watchlist", "list"),
+    "watchlist remove": _main_snippet("watchlist", "remove", "x"),
+}
+
+
+@dataclass(frozen=True)
+class ImportProfile:
+    command: str
+    total_us: int
+    heavy: tuple[str, ...]
+    slowest: tuple[tuple[int, str], ...]
+
+
+def profile_command(command: str, snippet: str, home: Path) -> ImportProfile:
+    env = dict(os.environ, HOME=str(home), PYTHONPATH=str(ROOT))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", snippet],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=home,
+    )
+    total = 0
+    loaded: set[str] = set()
+    top_level: list[tuple[int, str]] = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, raw_name = line[len("import time:"):].split("|")
+        name = raw_name.strip()
+        total += int(self_us)
+        loaded.add(name.split(".")[0])
+        if len(raw_name) - len(raw_name.lstrip()) == 1:
+            top_level.append((int(cumulative_us), name))
+    top_level.sort(reverse=True)
+    return ImportProfile(
+        command=command,
+        total_us=total,
+        heavy=tuple(module for module in HEAVY_MODULES if module in loaded),
+        slowest=tuple(top_level[:3]),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure `python -X importtime` cost per betboard subcommand"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=None)
+    parser.add_argument("commands", nargs="*", default=list(SUBCOMMANDS))
+    args = parser.parse_args()
+
+    over_budget: list[str] = []
+    with tempfile.TemporaryDirectory() as home:
+        for command in args.commands:
+            snippet = SUBCOMMANDS[command]
+            runs = [
+                profile_command(command, snippet, Path(home))
+                for _ in range(args.repeat)
+            ]
+            median_ms = statistics.median(run.total_us for run in runs) / 1000
+            last = runs[-1]
+            slowest = ", ".join(f"{name} {us / 1000:.1f}ms" for us, name in last.slowest)
+            heavy = ",".join(last.heavy) or "-"
+            print(f"{command:18} {median_ms:8.1f}ms  heavy={heavy:28} {slowest}")
+            if args.budget_ms is not None and median_ms > args.budget_ms:
+                over_budget.append(command)
+
+    if over_budget:
+        raise SystemExit(f"Over {args.budget_ms}ms import budget: {', '.join(over_budget)}")
+
+
+if __name__ == "__main__":
+    main()
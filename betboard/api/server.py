@@ -0,0 +1,353 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import socket
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from typing import Any, Callable
+from urllib.parse import parse_qs, urlsplit
+
+from betboard.config import AppConfig
+from betboard.core.arbitrage import scan_league
+from betboard.core.data import build_export_bundle, load_stored_league_data
+from betboard.core.feed import MovementBus, MovementFeed, Subscription
+from betboard.core.leagues import LeagueCatalog
+from betboard.core.normalization import build_odds_boards
+from betboard.core.serialization import to_json
+from betboard.models import Headline, MovementEvent
+from betboard.providers.base import NewsProvider
+from betboard.providers.resilience import CircuitOpenError
+from betboard.storage import db
+from betboard.storage.cache import CacheStore
+
+
+GZIP_MIN_BYTES = 512
+LEAGUE_RESOURCES = ("boards", "movements", "headlines", "opportunities", "bundle")
+STREAM_PATH = "/movements/stream"
+KEEPALIVE_SECONDS = 15.0
+MAX_STREAMS = 64
+
+
+@dataclass(frozen=True)
+class Response:
+    body: bytes
+    etag: str
+    gzipped: bytes | None = None
+
+
+class ServeState:
+    def __init__(
+        self,
+        config: AppConfig,
+        provider_name: str,
+        news: NewsProvider | None,
+        db_path: Path | None = None,
+    ) -> None:
+        self.config = config
+        self.provider_name = provider_name
+        self._news = news
+        self._connections = db.ConnectionManager(db_path)
+        self._headlines: CacheStore[list[Headline]] = CacheStore()
+        self._responses: dict[str, tuple[Any, Response]] = {}
+        self._lock = threading.Lock()
+        self.bus = MovementBus(db.latest_movement_id(self.conn()))
+        self.feed = MovementFeed(self.bus, self._connections.connection)
+
+    def conn(self) -> sqlite3.Connection:
+        return self._connections.connection()
+
+    def close(self) -> None:
+        self.feed.stop()
+        self._connections.close()
+
+    def league_key(self, league: str) -> str:
+        catalog = LeagueCatalog(
+            self.conn(), None, self.config.caching.sports_ttl_minutes
+        )
+        return catalog.resolve(self.config, league)[0]
+
+    def headlines(self, league_key: str) -> list[Headline]:
+        cached = self._headlines.get(league_key)
+        if cached is not None or self._news is None:
+            return cached or []
+        try:
+            headlines = self._news.fetch_headlines(league_key, limit=5)
+        except CircuitOpenError:
+            stale = self._headlines.get_stale(league_key)
+            return stale or db.recent_headlines(self.conn(), league_key, 5)
+        db.store_headlines(self.conn(), league_key, headlines)
+        self._headlines.set(league_key, headlines, self.config.caching.news_ttl_minutes)
+        return headlines
+
+    def respond(self, path: str, version: Any, build: Callable[[], Any]) -> Response:
+        with self._lock:
+            cached = self._responses.get(path)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        body = to_json(build(), indent=None).encode()
+        response = Response(
+            body=body,
+            etag=f'"{hashlib.sha1(body).hexdigest()}"',
+            gzipped=gzip.compress(body) if len(body) >= GZIP_MIN_BYTES else None,
+        )
+        with self._lock:
+            self._responses[path] = (version, response)
+        return response
+
+    def route(self, path: str) -> Response | None:
+        parts = [part for part in path.split("/") if part]
+        if parts == ["watchlist"]:
+            watchlist = db.list_watchlist(self.conn())
+            return self.respond(path, tuple(watchlist), lambda: watchlist)
+        if parts == ["leagues"]:
+            catalog = LeagueCatalog(
+                self.conn(), None, self.config.caching.sports_ttl_minutes
+            )
+            mapping = catalog.league_map(self.config)
+            return self.respond(path, tuple(mapping.items()), lambda: mapping)
+        if len(parts) != 3 or parts[0] != "leagues" or parts[2] not in LEAGUE_RESOURCES:
+            return None
+
+        league_key = self.league_key(parts[1])
+        resource = parts[2]
+        conn = self.conn()
+        headlines = self.headlines(league_key) if resource in {"headlines", "bundle"} else []
+        version = (
+            db.data_versions(conn).get(league_key),
+            tuple(headlines),
+            tuple(db.list_watchlist(conn)) if resource == "bundle" else (),
+        )
+
+        def build() -> Any:
+            if resource == "movements":
+                return db.list_movements(conn, league_key)
+            if resource == "headlines":
+                return headlines
+            stored = load_stored_league_data(
+                conn, self.provider_name, league_key, self.config.oddsapi.markets
+            )
+            event_odds = list(stored.event_odds) if stored else []
+            if resource == "boards":
+                return build_odds_boards(event_odds)
+            if resource == "opportunities":
+                return scan_league(event_odds)
+            return build_export_bundle(conn, league_key, event_odds, headlines)
+
+        return self.respond(path, version, build)
+
+
+class MovementStream(threading.Thread):
+    # Live SSE connections run on their own thread so that idle subscribers
+    # don't hold the request pool.
+    def __init__(
+        self, server: BetBoardServer, sock: socket.socket, subscription: Subscription
+    ) -> None:
+        super().__init__(name="movement-stream", daemon=True)
+        self.cursor = -1
+        self._server = server
+        self._socket = sock
+        self._subscription = subscription
+
+    def run(self) -> None:
+        try:
+            while True:
+                item = self._subscription.get(timeout=KEEPALIVE_SECONDS)
+                if item is None:
+                    self._socket.sendall(b": keep-alive\n\n")
+                elif item[0] > self.cursor:
+                    self.cursor = item[0]
+                    self._socket.sendall(_event_bytes(*item))
+        except (OSError, EOFError):
+            pass
+        finally:
+            self.close()
+            self._server.shutdown_request(self._socket)
+
+    def close(self) -> None:
+        self._server.release_stream(self)
+        self._subscription.close()
+        try:
+            self._socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+
+class BetBoardRequestHandler(BaseHTTPRequestHandler):
+    server: BetBoardServer
+    protocol_version = "HTTP/1.1"
+    timeout = 15
+    stream: MovementStream | None = None
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        path = url.path.rstrip("/") or "/"
+        if path == STREAM_PATH:
+            self._stream_movements(parse_qs(url.query))
+            return
+        try:
+            response = self.server.state.route(path)
+        except ValueError as exc:
+            self._send_error(HTTPStatus.NOT_FOUND, str(exc))
+            return
+        except Exception as exc:
+            self._send_error(HTTPStatus.INTERNAL_SERVER_ERROR, str(exc))
+            return
+        if response is None:
+            self._send_error(HTTPStatus.NOT_FOUND, f"Unknown path {path}")
+            return
+
+        use_gzip = response.gzipped is not None and "gzip" in self.headers.get(
+            "Accept-Encoding", ""
+        )
+        etag = response.etag[:-1] + '-gz"' if use_gzip else response.etag
+        if etag in _parse_etags(self.headers.get("If-None-Match", "")):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.send_header("Vary", "Accept-Encoding")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body = response.gzipped if use_gzip and response.gzipped else response.body
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Vary", "Accept-Encoding")
+        self.send_header("Cache-Control", "no-cache")
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _stream_movements(self, params: dict[str, list[str]]) -> None:
+        state = self.server.state
+        try:
+            league_keys = [state.league_key(league) for league in params.get("league", [])]
+            cursor = int(
+                self.headers.get("Last-Event-ID") or params.get("cursor", ["-1"])[0]
+            )
+        except ValueError as exc:
+            self._send_error(HTTPStatus.BAD_REQUEST, str(exc))
+            return
+
+        stream = self.server.open_stream(self.request, league_keys)
+        if stream is None:
+            self._send_error(HTTPStatus.SERVICE_UNAVAILABLE, "Too many open streams")
+            return
+        self.close_connection = True
+        try:
+            self.send_response(HTTPStatus.OK)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            stream.cursor = self._send_backlog(cursor, league_keys)
+            self.wfile.flush()
+            self.stream = stream
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            if self.stream is None:
+                stream.close()
+
+    def _send_backlog(self, cursor: int, league_keys: list[str]) -> int:
+        if cursor < 0:
+            return self.server.state.bus.cursor
+        while True:
+            batch = db.movements_since(self.server.state.conn(), cursor, league_keys)
+            if not batch:
+                return cursor
+            for movement_id, movement in batch:
+                self._send_event(movement_id, movement)
+            cursor = batch[-1][0]
+
+    def _send_event(self, movement_id: int, movement: MovementEvent) -> None:
+        self.wfile.write(_event_bytes(movement_id, movement))
+
+    def _send_error(self, status: HTTPStatus, message: str) -> None:
+        body = to_json({"error": message}, indent=None).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class BetBoardServer(HTTPServer):
+    allow_reuse_address = True
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        state: ServeState,
+        workers: int = 8,
+        verbose: bool = False,
+        max_streams: int = MAX_STREAMS,
+    ) -> None:
+        super().__init__(address, BetBoardRequestHandler)
+        self.state = state
+        self.verbose = verbose
+        self.max_streams = max_streams
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="serve")
+        self._streams: set[MovementStream] = set()
+        self._streams_lock = threading.Lock()
+        state.feed.start()
+
+    def open_stream(
+        self, sock: socket.socket, league_keys: list[str]
+    ) -> MovementStream | None:
+        with self._streams_lock:
+            if len(self._streams) >= self.max_streams:
+                return None
+            stream = MovementStream(self, sock, self.state.bus.subscribe(league_keys))
+            self._streams.add(stream)
+        return stream
+
+    def release_stream(self, stream: MovementStream) -> None:
+        with self._streams_lock:
+            self._streams.discard(stream)
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        self._pool.submit(self._process_request_thread, request, client_address)
+
+    def _process_request_thread(self, request: Any, client_address: Any) -> None:
+        stream: MovementStream | None = None
+        try:
+            stream = self.RequestHandlerClass(request, client_address, self).stream
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            # A stream takes over the socket once its headers and backlog are out.
+            if stream is None:
+                self.shutdown_request(request)
+            else:
+                stream.start()
+
+    def server_close(self) -> None:
+        super().server_close()
+        with self._streams_lock:
+            streams = list(self._streams)
+        for stream in streams:
+            stream.close()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self.state.close()
+
+
+def _event_bytes(movement_id: int, movement: MovementEvent) -> bytes:
+    data = to_json(movement, indent=None)
+    return f"id: {movement_id}\nevent: movement\ndata: {data}\n\n".encode()
+
+
+def _parse_etags(header: str) -> set[str]:
+    return {tag.strip().removeprefix("W/") for tag in header.split(",") if tag.strip()}
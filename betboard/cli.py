@@ -1,21 +1,22 @@
 from __future__ import annotations
 
 import argparse
-import json
-from dataclasses import asdict, is_dataclass
+import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING
 
-from betboard.config import AppConfig, ensure_ufc_key, load_config, odds_api_key
-from betboard.core.movement import detect_notable_moves
-from betboard.core.normalization import build_odds_board
-from betboard.core.serialization import event_odds_to_payload, payload_to_event_odds
-from betboard.models import ExportBundle, MovementEvent, OddsSnapshot, WatchlistItem
-from betboard.providers.espn_rss import EspnRssProvider
-from betboard.providers.oddsapi import OddsApiProvider
-from betboard.storage import db
-from betboard.ui.app import BetBoardApp
+if TYPE_CHECKING:
+    import sqlite3
+
+    from betboard.config import AppConfig
+    from betboard.core.feed import MovementBus
+    from betboard.providers.base import OddsProvider
+
+# Subcommand handlers import their dependencies locally so that cheap commands
+# such as `watchlist list` never pay for Textual, requests or feedparser.
+
+LEAGUE_HELP = "NFL, CFB, UFC or any sport key from the catalogue"
 
 
 def main() -> None:
@@ -25,38 +26,114 @@ def main() -> None:
     sub.add_parser("run")
 
     refresh = sub.add_parser("refresh")
-    refresh.add_argument("--league", choices=["NFL", "CFB", "UFC"], default=None)
+    refresh.add_argument("--league", metavar="LEAGUE", help=LEAGUE_HELP, default=None)
     refresh.add_argument("--force", action="store_true")
+    refresh.add_argument(
+        "--interval",
+        type=int,
+        default=None,
+        metavar="SECONDS",
+        help="keep running as a resident ingester, refreshing every SECONDS",
+    )
 
     export = sub.add_parser("export")
-    export.add_argument("--league", choices=["NFL", "CFB", "UFC"])
+    export.add_argument("--league", metavar="LEAGUE", help=LEAGUE_HELP)
     export.add_argument("--all", action="store_true")
     export.add_argument("--format", default="json", choices=["json"])
     export.add_argument("--output-dir", default=None)
 
+    history = sub.add_parser("history")
+    history.add_argument("event_id")
+    history.add_argument("--market", default=None)
+    history.add_argument("--book", default=None)
+    history.add_argument("--outcome", default=None)
+    history.add_argument("--hours", type=int, default=None)
+
+    replay = sub.add_parser("replay")
+    replay.add_argument(
+        "--league", action="append", metavar="LEAGUE", help="sport key; repeatable"
+    )
+    replay.add_argument(
+        "--rules",
+        action="append",
+        default=[],
+        metavar="NAME:KEY=VALUE,...",
+        help="rule set to compare against [movement], e.g. tight:h2h_cents=10",
+    )
+    replay.add_argument("--since", type=datetime.fromisoformat, default=None)
+    replay.add_argument("--until", type=datetime.fromisoformat, default=None)
+    replay.add_argument("--workers", type=int, default=None)
+
+    serve = sub.add_parser("serve")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--workers", type=int, default=8)
+    serve.add_argument("--max-streams", type=int, default=64)
+    serve.add_argument("--verbose", action="store_true")
+    serve.add_argument(
+        "--ingest-interval",
+        type=int,
+        default=None,
+        metavar="SECONDS",
+        help="also run the ingester in-process, pushing movements straight to streams",
+    )
+
+    news = sub.add_parser("news")
+    news_sub = news.add_subparsers(dest="news_command")
+    news_refresh = news_sub.add_parser("refresh")
+    news_refresh.add_argument("--league", metavar="LEAGUE", help=LEAGUE_HELP)
+    news_search = news_sub.add_parser("search")
+    news_search.add_argument("query")
+    news_search.add_argument("--league", metavar="LEAGUE", help=LEAGUE_HELP)
+    news_search.add_argument("--limit", type=int, default=20)
+
     watchlist = sub.add_parser("watchlist")
     watchlist_sub = watchlist.add_subparsers(dest="watchlist_command")
     watchlist_add = watchlist_sub.add_parser("add")
     watchlist_add.add_argument("event_id")
-    watchlist_add.add_argument("--league", required=True, choices=["NFL", "CFB", "UFC"])
+    watchlist_add.add_argument(
+        "--league", required=True, metavar="LEAGUE", help=LEAGUE_HELP
+    )
     watchlist_sub.add_parser("list")
     watchlist_remove = watchlist_sub.add_parser("remove")
     watchlist_remove.add_argument("event_id")
 
     args = parser.parse_args()
+    try:
+        _dispatch(parser, args)
+    finally:
+        _close_connections()
+
 
+def _dispatch(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
     if args.command == "run":
-        BetBoardApp().run()
+        _run()
         return
 
     if args.command == "refresh":
-        _refresh(args.league, args.force)
+        _refresh(args.league, args.force, args.interval)
         return
 
     if args.command == "export":
         _export(args)
         return
 
+    if args.command == "history":
+        _history(args)
+        return
+
+    if args.command == "replay":
+        _replay(args)
+        return
+
+    if args.command == "serve":
+        _serve(args)
+        return
+
+    if args.command == "news":
+        _handle_news(args)
+        return
+
     if args.command == "watchlist":
         _handle_watchlist(args)
         return
@@ -64,80 +141,57 @@ def main() -> None:
     parser.print_help()
 
 
-def _refresh(league: str | None, force: bool) -> None:
+def _close_connections() -> None:
+    db = sys.modules.get("betboard.storage.db")
+    if db is not None:
+        db.close_all()
+
+
+def _run() -> None:
+    from betboard.ui.app import BetBoardApp
+
+    BetBoardApp().run()
+
+
+def _refresh(league: str | None, force: bool, interval: int | None) -> None:
+    from betboard.config import load_config
+    from betboard.core.ingest import ingest_leagues, run_ingester
+    from betboard.storage import db
+
     config = load_config()
-    conn = db.connect()
+    conn = db.connection()
     provider = _odds_provider(config)
     if provider is None:
         raise SystemExit("Odds provider not enabled or missing API key")
-    config = ensure_ufc_key(config, provider)
-    leagues = _resolve_leagues(config, league)
+    leagues = _resolve_leagues(config, conn, provider, league)
 
-    for league_key in leagues:
-        event_odds = provider.get_odds(
-            league_key=league_key,
-            markets=config.oddsapi.markets,
-            regions=config.oddsapi.regions,
-            books_filter=config.books.allow or None,
-        )
-        for market in config.oddsapi.markets:
-            payload = [
-                event_odds_to_payload(odds)
-                for odds in event_odds
-                if any(m.market == market for m in odds.markets)
-            ]
-            snapshot = OddsSnapshot(
-                provider=provider.name,
-                league_key=league_key,
-                market=market,
-                fetched_at=datetime.utcnow(),
-                payload={"items": payload},
-            )
-            prev_payload = db.get_event_snapshot_payload(
-                conn, provider.name, league_key, market
-            )
-            db.add_snapshot(conn, snapshot)
-            if prev_payload:
-                _detect_and_store_movements(
-                    conn, prev_payload, snapshot.payload, league_key
-                )
-
-
-def _detect_and_store_movements(
-    conn: Any,
-    prev_payload: dict[str, Any],
-    curr_payload: dict[str, Any],
-    league_key: str,
-) -> None:
-    prev_items = {
-        item["event"]["event_id"]: payload_to_event_odds(item)
-        for item in prev_payload.get("items", [])
-    }
-    movements: list[MovementEvent] = []
-    for item in curr_payload.get("items", []):
-        current = payload_to_event_odds(item)
-        previous = prev_items.get(current.event.event_id)
-        if not previous:
-            continue
-        movements.extend(detect_notable_moves(previous, current))
-    if movements:
-        db.record_movement_events(conn, movements)
+    if interval:
+        run_ingester(conn, config, provider, leagues, interval)
+        return
+    ingest_leagues(conn, config, provider, leagues)
 
 
 def _export(args: argparse.Namespace) -> None:
+    from betboard.config import load_config
+    from betboard.core.data import build_export_bundle
+    from betboard.core.serialization import to_json
+    from betboard.providers.espn_rss import EspnRssProvider
+    from betboard.storage import db
+
     config = load_config()
     provider = _odds_provider(config)
     if provider is None:
         raise SystemExit("Odds provider not enabled or missing API key")
-    config = ensure_ufc_key(config, provider)
     if not args.all and not args.league:
         raise SystemExit("Provide --league or --all")
 
-    leagues = _resolve_leagues(config, args.league) if args.league else _resolve_leagues(config, None)
+    conn = db.connection()
+    leagues = _resolve_leagues(config, conn, provider, args.league)
     output_dir = Path(args.output_dir).expanduser() if args.output_dir else None
     if output_dir:
         output_dir.mkdir(parents=True, exist_ok=True)
 
+    news = EspnRssProvider().fetch_many(leagues, limit=5)
     for league_key in leagues:
         event_odds = provider.get_odds(
             league_key=league_key,
@@ -145,27 +199,9 @@ def _export(args: argparse.Namespace) -> None:
             regions=config.oddsapi.regions,
             books_filter=config.books.allow or None,
         )
-        odds_boards = tuple(build_odds_board(odds) for odds in event_odds)
-
-        news_provider = EspnRssProvider()
-        headlines = tuple(news_provider.fetch_headlines(league_key, limit=5))
-
-        conn = db.connect()
-        movements = tuple(db.list_movements(conn, league_key))
-        watchlist_items = tuple(
-            item for item in db.list_watchlist(conn) if item.league_key == league_key
-        )
-
-        bundle = ExportBundle(
-            league_key=league_key,
-            events=tuple(odds.event for odds in event_odds),
-            odds=odds_boards,
-            movements=movements,
-            headlines=headlines,
-            watchlist=watchlist_items,
-        )
+        bundle = build_export_bundle(conn, league_key, event_odds, news[league_key])
 
-        payload = _to_json(bundle)
+        payload = to_json(bundle)
         if output_dir:
             suffix = _league_suffix(league_key)
             (output_dir / f"{suffix}.json").write_text(payload)
@@ -173,15 +209,152 @@ def _export(args: argparse.Namespace) -> None:
             print(payload)
 
 
+def _history(args: argparse.Namespace) -> None:
+    from datetime import timedelta
+
+    from betboard.core.history import decimal_odds, group_history
+    from betboard.storage import db
+    from betboard.ui.formatting import sparkline
+
+    since = datetime.utcnow() - timedelta(hours=args.hours) if args.hours else None
+    points = db.price_history(
+        db.connection(), args.event_id, args.market, args.book, args.outcome, since
+    )
+    if not points:
+        raise SystemExit(f"No line history for {args.event_id}")
+    for (market, book, outcome), line in group_history(points).items():
+        trend = sparkline([decimal_odds(point.price) for point in line], width=24)
+        first, last = line[0], line[-1]
+        point = "" if last.point is None else f" {last.point:+.1f}"
+        print(
+            f"{market:7} {book:14} {outcome:24} {trend:24} "
+            f"{first.price:+} -> {last.price:+}{point} ({len(line)} points)"
+        )
+
+
+def _replay(args: argparse.Namespace) -> None:
+    from betboard.config import load_config
+    from betboard.core.replay import parse_rules, replay
+
+    movement = load_config().movement
+    rule_sets = {"config": movement}
+    try:
+        rule_sets.update(parse_rules(spec, movement) for spec in args.rules)
+    except ValueError as exc:
+        raise SystemExit(str(exc)) from exc
+    report = replay(
+        rule_sets, args.league, workers=args.workers, since=args.since, until=args.until
+    )
+    if not report.by_league:
+        raise SystemExit("No stored odds snapshots to replay")
+    leagues = sorted(report.by_league)
+    print(f"{'rule set':16} {'alerts':>8}  " + "  ".join(leagues))
+    for name, total in report.alerts.items():
+        counts = "  ".join(
+            f"{report.by_league[league][name]:>{len(league)}}" for league in leagues
+        )
+        print(f"{name:16} {total:>8}  {counts}")
+    print(f"{report.comparisons} snapshot comparisons replayed")
+
+
+def _serve(args: argparse.Namespace) -> None:
+    import threading
+
+    from betboard.api.server import BetBoardServer, ServeState
+    from betboard.config import load_config
+    from betboard.providers.espn_rss import EspnRssProvider
+    from betboard.providers.merged import odds_provider_name
+    from betboard.storage import db
+
+    config = load_config()
+    state = ServeState(config, odds_provider_name(config), EspnRssProvider())
+    if args.ingest_interval:
+        provider = _odds_provider(config)
+        if provider is None:
+            raise SystemExit("Odds provider not enabled or missing API key")
+        leagues = _resolve_leagues(config, db.connection(), provider, None)
+        threading.Thread(
+            target=_ingest_in_background,
+            args=(config, provider, leagues, args.ingest_interval, state.bus),
+            name="ingester",
+            daemon=True,
+        ).start()
+
+    server = BetBoardServer(
+        (args.host, args.port),
+        state,
+        workers=args.workers,
+        verbose=args.verbose,
+        max_streams=args.max_streams,
+    )
+    host, port = server.server_address[:2]
+    print(f"Serving BetBoard API on http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def _ingest_in_background(
+    config: AppConfig,
+    provider: OddsProvider,
+    leagues: list[str],
+    interval: int,
+    bus: MovementBus,
+) -> None:
+    from betboard.core.ingest import run_ingester
+    from betboard.storage import db
+
+    run_ingester(db.connection(), config, provider, leagues, interval, bus)
+
+
+def _handle_news(args: argparse.Namespace) -> None:
+    from betboard.storage import db
+
+    conn = db.connection()
+    if args.news_command == "refresh":
+        from betboard.config import load_config
+        from betboard.core.ingest import ingest_headlines
+        from betboard.providers.espn_rss import EspnRssProvider
+
+        config = load_config()
+        leagues = _resolve_leagues(config, conn, None, args.league)
+        added = ingest_headlines(conn, EspnRssProvider(), leagues)
+        for league_key, count in added.items():
+            print(f"{league_key}: {count} new headlines")
+        return
+
+    if args.news_command == "search":
+        league_key = None
+        if args.league:
+            from betboard.config import load_config
+
+            league_key = _resolve_leagues(load_config(), conn, None, args.league)[0]
+        for headline in db.search_headlines(conn, args.query, league_key, args.limit):
+            published = (
+                headline.published_at.astimezone().strftime("%b %d %H:%M")
+                if headline.published_at
+                else "--"
+            )
+            print(f"{published:12} {headline.title}\n{'':12} {headline.url}")
+        return
+
+    raise SystemExit("Unknown news command")
+
+
 def _handle_watchlist(args: argparse.Namespace) -> None:
-    conn = db.connect()
+    from betboard.storage import db
+
+    conn = db.connection()
     if args.watchlist_command == "add":
+        from betboard.config import load_config
+        from betboard.models import WatchlistItem
+
         config = load_config()
         provider = _odds_provider(config)
-        if provider is None:
-            raise SystemExit("Odds provider not enabled or missing API key")
-        config = ensure_ufc_key(config, provider)
-        league_key = _resolve_leagues(config, args.league)[0]
+        league_key = _resolve_leagues(config, conn, provider, args.league)[0]
         item = WatchlistItem(
             event_id=args.event_id,
             league_key=league_key,
@@ -205,24 +378,28 @@ def _handle_watchlist(args: argparse.Namespace) -> None:
     raise SystemExit("Unknown watchlist command")
 
 
-def _odds_provider(config: AppConfig) -> OddsApiProvider | None:
-    if not config.oddsapi.enabled:
-        return None
-    key = odds_api_key(config)
-    if not key:
-        return None
-    return OddsApiProvider(key)
+def _odds_provider(config: AppConfig) -> OddsProvider | None:
+    from betboard.core.singleflight import CoalescingOddsProvider
+    from betboard.providers.merged import build_odds_provider
+
+    provider = build_odds_provider(config)
+    return CoalescingOddsProvider(provider) if provider else None
 
 
-def _resolve_leagues(config: AppConfig, league: str | None) -> list[str]:
-    mapping = {
-        "NFL": config.leagues.nfl_key,
-        "CFB": config.leagues.cfb_key,
-        "UFC": config.leagues.ufc_key or "ufc",
-    }
-    if league:
-        return [mapping[league]]
-    return [mapping["NFL"], mapping["CFB"], mapping["UFC"]]
+def _resolve_leagues(
+    config: AppConfig,
+    conn: sqlite3.Connection,
+    provider: OddsProvider | None,
+    league: str | None,
+) -> list[str]:
+    from betboard.core.leagues import LeagueCatalog
+
+    source = provider if hasattr(provider, "list_sports") else None
+    catalog = LeagueCatalog(conn, source, config.caching.sports_ttl_minutes)
+    try:
+        return catalog.resolve(config, league)
+    except ValueError as exc:
+        raise SystemExit(str(exc)) from exc
 
 
 def _league_suffix(league_key: str) -> str:
@@ -234,14 +411,3 @@ def _league_suffix(league_key: str) -> str:
         return "ufc"
     return league_key.replace("/", "_")
 
-
-def _to_json(value: Any) -> str:
-    return json.dumps(value, default=_json_default, indent=2)
-
-
-def _json_default(value: Any) -> Any:
-    if isinstance(value, datetime):
-        return value.isoformat()
-    if is_dataclass(value):
-        return asdict(value)
-    raise TypeError(f"Type not serializable: {type(value)!r}")
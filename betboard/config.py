@@ -13,6 +13,8 @@ except ModuleNotFoundError:  # pragma: no cover - Python < 3.11 fallback
 
 DEFAULT_CONFIG_PATH = Path.home() / ".betboard" / "config.toml"
 
+RULE_SELECTORS = frozenset({"league", "market", "book"})
+
 
 @dataclass(frozen=True)
 class OddsApiConfig:
@@ -24,6 +26,14 @@ class OddsApiConfig:
     markets: list[str]
 
 
+@dataclass(frozen=True)
+class TheRundownConfig:
+    enabled: bool
+    api_key_env: str
+    api_key: str
+    days_ahead: int
+
+
 @dataclass(frozen=True)
 class LeagueConfig:
     nfl_key: str
@@ -36,6 +46,7 @@ class CachingConfig:
     events_ttl_minutes: int
     odds_ttl_minutes: int
     news_ttl_minutes: int
+    sports_ttl_minutes: int
 
 
 @dataclass(frozen=True)
@@ -49,14 +60,33 @@ class BooksConfig:
     allow: list[str]
 
 
+Settings = tuple[tuple[str, Any], ...]
+
+
+@dataclass(frozen=True)
+class MovementRuleConfig:
+    league: str | None
+    market: str | None
+    book: str | None
+    settings: Settings
+
+
+@dataclass(frozen=True)
+class MovementConfig:
+    defaults: Settings = ()
+    rules: tuple[MovementRuleConfig, ...] = ()
+
+
 @dataclass(frozen=True)
 class AppConfig:
     refresh_ui_seconds: int
     oddsapi: OddsApiConfig
+    therundown: TheRundownConfig
     leagues: LeagueConfig
     caching: CachingConfig
     watchlist: WatchlistConfig
     books: BooksConfig
+    movement: MovementConfig = MovementConfig()
 
 
 def _get_table(config: dict[str, Any], name: str) -> dict[str, Any]:
@@ -78,6 +108,24 @@ def load_config(path: Path | None = None) -> AppConfig:
     caching = _get_table(data, "caching")
     watchlist = _get_table(data, "watchlist")
     books = _get_table(data, "books")
+    therundown = data.get("therundown", {})
+    movement = data.get("movement", {})
+    movement_config = MovementConfig(
+        defaults=_settings(movement, exclude={"rules"}),
+        rules=tuple(
+            MovementRuleConfig(
+                league=rule.get("league"),
+                market=rule.get("market"),
+                book=rule.get("book"),
+                settings=_settings(rule, exclude=RULE_SELECTORS),
+            )
+            for rule in movement.get("rules", [])
+        ),
+    )
+    # Imported here because the movement module imports this one for its types.
+    from betboard.core.movement import MovementRuleBook, rules_from_settings
+
+    MovementRuleBook(rules_from_settings(movement_config.defaults), movement_config.rules)
 
     return AppConfig(
         refresh_ui_seconds=int(app.get("refresh_ui_seconds", 30)),
@@ -89,6 +137,12 @@ def load_config(path: Path | None = None) -> AppConfig:
             odds_format=str(oddsapi.get("odds_format", "american")),
             markets=list(oddsapi.get("markets", ["h2h", "spreads", "totals"])),
         ),
+        therundown=TheRundownConfig(
+            enabled=bool(therundown.get("enabled", False)),
+            api_key_env=str(therundown.get("api_key_env", "THERUNDOWN_API_KEY")),
+            api_key=str(therundown.get("api_key", "")),
+            days_ahead=int(therundown.get("days_ahead", 7)),
+        ),
         leagues=LeagueConfig(
             nfl_key=str(leagues.get("nfl_key", "americanfootball_nfl")),
             cfb_key=str(leagues.get("cfb_key", "americanfootball_ncaaf")),
@@ -98,6 +152,7 @@ def load_config(path: Path | None = None) -> AppConfig:
             events_ttl_minutes=int(caching.get("events_ttl_minutes", 720)),
             odds_ttl_minutes=int(caching.get("odds_ttl_minutes", 360)),
             news_ttl_minutes=int(caching.get("news_ttl_minutes", 120)),
+            sports_ttl_minutes=int(caching.get("sports_ttl_minutes", 1440)),
         ),
         watchlist=WatchlistConfig(
             odds_ttl_minutes_within_24h=int(
@@ -108,6 +163,15 @@ def load_config(path: Path | None = None) -> AppConfig:
             ),
         ),
         books=BooksConfig(allow=list(books.get("allow", []))),
+        movement=movement_config,
+    )
+
+
+def _settings(table: dict[str, Any], exclude: set[str] | frozenset[str]) -> Settings:
+    return tuple(
+        (key, tuple(value) if isinstance(value, list) else value)
+        for key, value in table.items()
+        if key not in exclude
     )
 
 
@@ -117,69 +181,7 @@ def odds_api_key(config: AppConfig) -> str | None:
     return os.getenv(config.oddsapi.api_key_env)
 
 
-def ensure_ufc_key(
-    config: AppConfig, provider: Any, path: Path | None = None
-) -> AppConfig:
-    if config.leagues.ufc_key:
-        return config
-    sports = provider.list_sports()
-    key = _discover_ufc_key(sports)
-    if not key:
-        return config
-    config_path = path or DEFAULT_CONFIG_PATH
-    _write_ufc_key(config_path, key)
-    return AppConfig(
-        refresh_ui_seconds=config.refresh_ui_seconds,
-        oddsapi=config.oddsapi,
-        leagues=LeagueConfig(
-            nfl_key=config.leagues.nfl_key,
-            cfb_key=config.leagues.cfb_key,
-            ufc_key=key,
-        ),
-        caching=config.caching,
-        watchlist=config.watchlist,
-        books=config.books,
-    )
-
-
-def _discover_ufc_key(sports: list[dict[str, Any]]) -> str | None:
-    candidates = []
-    for sport in sports:
-        key = str(sport.get("key", ""))
-        title = str(sport.get("title", "")).lower()
-        group = str(sport.get("group", "")).lower()
-        active = bool(sport.get("active", False))
-        if "ufc" in title or "ufc" in key:
-            candidates.append((active, key))
-        elif "mma" in key or "mma" in group or "mma" in title:
-            candidates.append((active, key))
-    if not candidates:
-        return None
-    candidates.sort(key=lambda item: (not item[0], item[1]))
-    return candidates[0][1]
-
-
-def _write_ufc_key(path: Path, key: str) -> None:
-    if not path.exists():
-        return
-    lines = path.read_text().splitlines()
-    out: list[str] = []
-    in_leagues = False
-    replaced = False
-    for line in lines:
-        stripped = line.strip()
-        if stripped.startswith("[") and stripped.endswith("]"):
-            if in_leagues and not replaced:
-                out.append(f"ufc_key = \"{key}\"")
-                replaced = True
-            in_leagues = stripped == "[leagues]"
-            out.append(line)
-            continue
-        if in_leagues and stripped.startswith("ufc_key"):
-            out.append(f"ufc_key = \"{key}\"")
-            replaced = True
-            continue
-        out.append(line)
-    if in_leagues and not replaced:
-        out.append(f"ufc_key = \"{key}\"")
-    path.write_text("\n".join(out) + "\n")
+def therundown_api_key(config: AppConfig) -> str | None:
+    if config.therundown.api_key:
+        return config.therundown.api_key
+    return os.getenv(config.therundown.api_key_env)
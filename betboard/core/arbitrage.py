@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from typing import Sequence
+
+from betboard.models import Event, EventOdds, Opportunity, OpportunityLeg, outcome_point
+
+MAX_MIDDLE_COST = 0.05
+POINT_MARKETS = {"spreads": None, "totals": ("Over", "Under")}
+
+BestLegs = dict[tuple[str, float | None], tuple[float, OpportunityLeg]]
+
+
+def scan_league(
+    event_odds: Sequence[EventOdds], max_middle_cost: float = MAX_MIDDLE_COST
+) -> list[Opportunity]:
+    opportunities: list[Opportunity] = []
+    for odds in event_odds:
+        for market, best in _book_layout(odds).items():
+            if market == "h2h":
+                found = _arbitrage(odds.event, market, best)
+                if found is not None:
+                    opportunities.append(found)
+            elif market in POINT_MARKETS:
+                opportunities.extend(_middles(odds.event, market, best, max_middle_cost))
+    opportunities.sort(key=lambda item: (item.kind != "arb", -item.margin))
+    return opportunities
+
+
+def decimal_price(price: int) -> float:
+    return 1 + price / 100 if price > 0 else 1 + 100 / -price
+
+
+def _book_layout(odds: EventOdds) -> dict[str, BestLegs]:
+    # Best price per (outcome, line) for each market; every scan works off this.
+    home = odds.event.home_team
+    layout: dict[str, BestLegs] = {}
+    for market in odds.markets:
+        best = layout.setdefault(market.market, {})
+        for price in market.prices:
+            if not price.price:
+                continue
+            point = outcome_point(market.market, market.point, price.outcome, home)
+            key = (price.outcome, point)
+            payout = decimal_price(price.price)
+            current = best.get(key)
+            if current is None or payout > current[0]:
+                best[key] = (
+                    payout,
+                    OpportunityLeg(
+                        book=market.book,
+                        outcome=price.outcome,
+                        price=price.price,
+                        point=point,
+                    ),
+                )
+    return layout
+
+
+def _arbitrage(event: Event, market: str, best: BestLegs) -> Opportunity | None:
+    if len(best) < 2:
+        return None
+    stake = sum(1 / payout for payout, _ in best.values())
+    if stake >= 1:
+        return None
+    return Opportunity(
+        event_id=event.event_id,
+        market=market,
+        kind="arb",
+        legs=tuple(leg for _, leg in best.values()),
+        margin=1 / stake - 1,
+    )
+
+
+def _middles(
+    event: Event,
+    market: str,
+    best: BestLegs,
+    max_middle_cost: float,
+) -> list[Opportunity]:
+    first, second = POINT_MARKETS[market] or (event.home_team, event.away_team)
+    first_legs = [value for (outcome, _), value in best.items() if outcome == first]
+    second_legs = [value for (outcome, _), value in best.items() if outcome == second]
+    arb: Opportunity | None = None
+    middle: Opportunity | None = None
+    for first_payout, first_leg in first_legs:
+        for second_payout, second_leg in second_legs:
+            if first_leg.point is None or second_leg.point is None:
+                continue
+            # Spreads: home +a and away +b both cover when a + b > 0. Totals: over
+            # a and under b both win when b > a.
+            if market == "spreads":
+                width = first_leg.point + second_leg.point
+            else:
+                width = second_leg.point - first_leg.point
+            margin = 1 / (1 / first_payout + 1 / second_payout) - 1
+            if width < 0 or (width == 0 and margin <= 0):
+                continue
+            if width > 0 and margin < -max_middle_cost:
+                continue
+            found = Opportunity(
+                event_id=event.event_id,
+                market=market,
+                kind="arb" if width == 0 else "middle",
+                legs=(first_leg, second_leg),
+                margin=margin,
+                width=width or None,
+            )
+            if found.kind == "arb":
+                if arb is None or found.margin > arb.margin:
+                    arb = found
+            elif middle is None or (width, margin) > (middle.width, middle.margin):
+                middle = found
+    return [item for item in (arb, middle) if item is not None]
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from typing import Sequence
+
+from betboard.models import BookEdge, EventOdds, FairPrice, outcome_point
+
+LineKey = tuple[int, str, float | None, str]
+
+
+def league_consensus(
+    event_odds: Sequence[EventOdds],
+) -> list[tuple[tuple[FairPrice, ...], tuple[BookEdge, ...]]]:
+    # Plain Python over the whole league at once: de-vig each book's market,
+    # then average the no-vig probabilities per (event, market, point, outcome).
+    quotes: list[tuple[LineKey, str, int, float]] = []
+    totals: dict[LineKey, list[float]] = {}
+    for index, odds in enumerate(event_odds):
+        home = odds.event.home_team
+        for market in odds.markets:
+            priced = [price for price in market.prices if price.price]
+            implied = [_implied(price.price) for price in priced]
+            overround = sum(implied)
+            for price, probability in zip(priced, implied):
+                point = outcome_point(market.market, market.point, price.outcome, home)
+                line = (index, market.market, point, price.outcome)
+                quotes.append((line, market.book, price.price, probability))
+                # A one-sided market has no vig to remove and would skew the
+                # consensus, but its price can still be scored against it.
+                if len(priced) > 1:
+                    total = totals.setdefault(line, [0.0, 0])
+                    total[0] += probability / overround
+                    total[1] += 1
+
+    fair: dict[LineKey, float] = {}
+    fair_prices: list[list[FairPrice]] = [[] for _ in event_odds]
+    for line, (total, count) in totals.items():
+        index, market, point, outcome = line
+        fair[line] = probability = total / count
+        fair_prices[index].append(
+            FairPrice(
+                market=market,
+                outcome=outcome,
+                point=point,
+                probability=probability,
+                price=fair_american(probability),
+                books=int(count),
+            )
+        )
+
+    # Every quoted price is scored against the consensus, including books
+    # that sit below it, so callers can rank or filter the edges themselves.
+    edges: list[list[BookEdge]] = [[] for _ in event_odds]
+    for line, book, price, probability in quotes:
+        consensus = fair.get(line)
+        if consensus is None:
+            continue
+        index, market, point, outcome = line
+        edges[index].append(
+            BookEdge(
+                market=market,
+                outcome=outcome,
+                book=book,
+                price=price,
+                point=point,
+                edge=consensus / probability - 1,
+            )
+        )
+    return [(tuple(f), tuple(e)) for f, e in zip(fair_prices, edges)]
+
+
+def fair_american(probability: float) -> int:
+    if probability <= 0 or probability >= 1:
+        return 0
+    if probability >= 0.5:
+        return -round(100 * probability / (1 - probability))
+    return round(100 * (1 - probability) / probability)
+
+
+def _implied(price: int) -> float:
+    return 100 / (price + 100) if price > 0 else -price / (100 - price)
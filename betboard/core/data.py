@@ -1,15 +1,31 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Sequence
+import sqlite3
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Sequence
 
 from betboard.config import AppConfig
-from betboard.models import EventOdds, Headline, MovementEvent
-from betboard.providers.espn_rss import EspnRssProvider
-from betboard.providers.oddsapi import OddsApiProvider
+from betboard.core.arbitrage import scan_league
+from betboard.core.linking import link_headlines
+from betboard.core.normalization import build_odds_boards
+from betboard.core.serialization import payload_to_event_odds
+from betboard.models import (
+    Event,
+    EventOdds,
+    ExportBundle,
+    Headline,
+    MarketOdds,
+    MovementEvent,
+    Opportunity,
+)
+from betboard.providers.resilience import CircuitOpenError
 from betboard.storage import db
 from betboard.storage.cache import CacheStore
 
+if TYPE_CHECKING:
+    from betboard.providers.base import OddsProvider
+
 
 @dataclass
 class LeagueData:
@@ -17,39 +33,150 @@ class LeagueData:
     event_odds: Sequence[EventOdds]
     headlines: Sequence[Headline]
     movements: Sequence[MovementEvent]
+    stored_at: datetime | None = None
+    event_headlines: dict[str, list[Headline]] = field(default_factory=dict)
+    opportunities: Sequence[Opportunity] = ()
 
 
 def fetch_league_data(
     config: AppConfig,
-    provider: OddsApiProvider,
+    provider: OddsProvider,
     league_key: str,
     cache: CacheStore,
     force: bool = False,
 ) -> LeagueData:
     odds_key = f"odds:{league_key}"
-    news_key = f"news:{league_key}"
 
     event_odds = None if force else cache.get(odds_key)
     if event_odds is None:
-        event_odds = provider.get_odds(
+        try:
+            event_odds = provider.get_odds(
+                league_key=league_key,
+                markets=config.oddsapi.markets,
+                regions=config.oddsapi.regions,
+                books_filter=config.books.allow or None,
+            )
+        except CircuitOpenError:
+            event_odds = cache.get_stale(odds_key)
+            if event_odds is None:
+                raise
+        else:
+            cache.set(odds_key, event_odds, config.caching.odds_ttl_minutes)
+
+    headlines = _cached_headlines(config, league_key, cache, force)
+
+    conn = db.connection()
+    movements = db.list_movements(conn, league_key)
+
+    return LeagueData(
+        league_key=league_key,
+        event_odds=event_odds,
+        headlines=headlines,
+        movements=movements,
+        event_headlines=link_headlines(
+            conn, league_key, [odds.event for odds in event_odds]
+        ),
+        opportunities=scan_league(event_odds),
+    )
+
+
+def reload_league_data(
+    config: AppConfig,
+    provider_name: str,
+    league_key: str,
+    cache: CacheStore,
+    force: bool = False,
+) -> LeagueData:
+    conn = db.connection()
+    stored = load_stored_league_data(
+        conn, provider_name, league_key, config.oddsapi.markets
+    )
+    headlines = _cached_headlines(config, league_key, cache, force)
+    if stored is None:
+        return LeagueData(
             league_key=league_key,
-            markets=config.oddsapi.markets,
-            regions=config.oddsapi.regions,
-            books_filter=config.books.allow or None,
+            event_odds=[],
+            headlines=headlines,
+            movements=db.list_movements(conn, league_key),
         )
-        cache.set(odds_key, event_odds, config.caching.odds_ttl_minutes)
+    stored.headlines = headlines
+    stored.event_headlines = link_headlines(
+        conn, league_key, [odds.event for odds in stored.event_odds]
+    )
+    stored.opportunities = scan_league(stored.event_odds)
+    return stored
+
 
+def _cached_headlines(
+    config: AppConfig, league_key: str, cache: CacheStore, force: bool
+) -> Sequence[Headline]:
+    news_key = f"news:{league_key}"
     headlines = None if force else cache.get(news_key)
     if headlines is None:
-        headlines = EspnRssProvider().fetch_headlines(league_key, limit=5)
+        from betboard.providers.espn_rss import EspnRssProvider
+
+        conn = db.connection()
+        try:
+            headlines = EspnRssProvider().fetch_headlines(league_key, limit=5)
+        except CircuitOpenError:
+            return cache.get_stale(news_key) or db.recent_headlines(conn, league_key, 5)
+        db.store_headlines(conn, league_key, headlines)
         cache.set(news_key, headlines, config.caching.news_ttl_minutes)
+    return headlines
 
-    conn = db.connect()
-    movements = db.list_movements(conn, league_key)
 
+def load_stored_league_data(
+    conn: sqlite3.Connection,
+    provider_name: str,
+    league_key: str,
+    markets: Sequence[str],
+) -> LeagueData | None:
+    events: dict[str, Event] = {}
+    event_markets: dict[str, dict[tuple[str, str], MarketOdds]] = {}
+    fetched: list[datetime] = []
+    for market in markets:
+        snapshot = db.latest_snapshot(conn, provider_name, league_key, market)
+        if snapshot is None:
+            continue
+        fetched.append(snapshot.fetched_at)
+        for item in snapshot.payload.get("items", []):
+            odds = payload_to_event_odds(item)
+            event_id = odds.event.event_id
+            events.setdefault(event_id, odds.event)
+            merged = event_markets.setdefault(event_id, {})
+            for market_odds in odds.markets:
+                if market_odds.market == market:
+                    merged[(market_odds.market, market_odds.book)] = market_odds
+    if not fetched:
+        return None
     return LeagueData(
         league_key=league_key,
-        event_odds=event_odds,
-        headlines=headlines,
-        movements=movements,
+        event_odds=[
+            EventOdds(event=event, markets=tuple(event_markets[event_id].values()))
+            for event_id, event in events.items()
+        ],
+        headlines=db.recent_headlines(conn, league_key, 5),
+        movements=db.list_movements(conn, league_key),
+        stored_at=min(fetched),
+        event_headlines=db.linked_headlines(conn, league_key),
+    )
+
+
+def build_export_bundle(
+    conn: sqlite3.Connection,
+    league_key: str,
+    event_odds: Sequence[EventOdds],
+    headlines: Sequence[Headline],
+) -> ExportBundle:
+    return ExportBundle(
+        league_key=league_key,
+        events=tuple(odds.event for odds in event_odds),
+        odds=tuple(build_odds_boards(event_odds)),
+        movements=tuple(db.list_movements(conn, league_key)),
+        headlines=tuple(headlines),
+        watchlist=tuple(
+            item for item in db.list_watchlist(conn) if item.league_key == league_key
+        ),
+        lines=tuple(db.line_aggregates(conn, league_key=league_key)),
+        opportunities=tuple(scan_league(event_odds)),
     )
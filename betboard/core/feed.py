@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import queue
+import sqlite3
+import threading
+from typing import Callable
+
+from betboard.models import MovementEvent
+from betboard.storage import db
+
+CursorMovement = tuple[int, MovementEvent]
+
+
+class Subscription:
+    def __init__(self, bus: MovementBus, league_keys: frozenset[str] | None) -> None:
+        self.league_keys = league_keys
+        self._bus = bus
+        self._queue: queue.Queue[CursorMovement | None] = queue.Queue()
+
+    def get(self, timeout: float) -> CursorMovement | None:
+        try:
+            item = self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+        if item is None:
+            raise EOFError("movement bus closed")
+        return item
+
+    def close(self) -> None:
+        self._bus.unsubscribe(self)
+        self._queue.put(None)
+
+    def _offer(self, item: CursorMovement | None) -> None:
+        if item is None or self.league_keys is None or item[1].league_key in self.league_keys:
+            self._queue.put(item)
+
+
+class MovementBus:
+    def __init__(self, cursor: int = 0) -> None:
+        self._cursor = cursor
+        self._subscribers: list[Subscription] = []
+        self._lock = threading.Lock()
+
+    @property
+    def cursor(self) -> int:
+        with self._lock:
+            return self._cursor
+
+    @property
+    def has_subscribers(self) -> bool:
+        with self._lock:
+            return bool(self._subscribers)
+
+    def subscribe(self, league_keys: list[str] | None = None) -> Subscription:
+        subscription = Subscription(self, frozenset(league_keys) if league_keys else None)
+        with self._lock:
+            self._subscribers.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            if subscription in self._subscribers:
+                self._subscribers.remove(subscription)
+
+    def publish(self, movements: list[CursorMovement]) -> None:
+        with self._lock:
+            fresh = [item for item in movements if item[0] > self._cursor]
+            if not fresh:
+                return
+            self._cursor = max(item[0] for item in fresh)
+            subscribers = list(self._subscribers)
+        for item in fresh:
+            for subscription in subscribers:
+                subscription._offer(item)
+
+    def close(self) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers)
+            self._subscribers.clear()
+        for subscription in subscribers:
+            subscription._offer(None)
+
+
+class MovementFeed:
+    def __init__(
+        self,
+        bus: MovementBus,
+        connect: Callable[[], sqlite3.Connection],
+        poll_seconds: float = 1.0,
+    ) -> None:
+        self.bus = bus
+        self._connect = connect
+        self._poll_seconds = poll_seconds
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._versions: dict[str, int] | None = None
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="movement-feed", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self.bus.close()
+
+    def poll(self, conn: sqlite3.Connection) -> None:
+        versions = db.data_versions(conn)
+        if versions == self._versions:
+            return
+        self._versions = versions
+        while True:
+            batch = db.movements_since(conn, self.bus.cursor)
+            if not batch:
+                return
+            self.bus.publish(batch)
+
+    def _run(self) -> None:
+        conn = self._connect()
+        while not self._stop.wait(self._poll_seconds):
+            if self.bus.has_subscribers:
+                self.poll(conn)
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Iterable, Mapping
+
+from betboard.models import LinePoint, outcome_point
+
+LineKey = tuple[str, str, str]
+
+
+def line_changes(
+    previous: Mapping[str, Any] | None,
+    current: Mapping[str, Any],
+    observed_at: datetime,
+) -> list[tuple[str, LinePoint]]:
+    last: dict[tuple[str, str, str, str], tuple[int, float | None]] = {}
+    for event_id, market, book, outcome, price, point in _rows(previous or {}):
+        last[(event_id, market, book, outcome)] = (price, point)
+
+    changes: list[tuple[str, LinePoint]] = []
+    for event_id, market, book, outcome, price, point in _rows(current):
+        if last.get((event_id, market, book, outcome)) == (price, point):
+            continue
+        changes.append(
+            (
+                event_id,
+                LinePoint(
+                    observed_at=observed_at,
+                    market=market,
+                    book=book,
+                    outcome=outcome,
+                    price=price,
+                    point=point,
+                ),
+            )
+        )
+    return changes
+
+
+def group_history(points: Iterable[LinePoint]) -> dict[LineKey, list[LinePoint]]:
+    grouped: dict[LineKey, list[LinePoint]] = {}
+    for point in points:
+        grouped.setdefault((point.market, point.book, point.outcome), []).append(point)
+    return grouped
+
+
+def price_trends(points: Iterable[LinePoint]) -> dict[LineKey, list[float]]:
+    return {
+        key: [decimal_odds(point.price) for point in line]
+        for key, line in group_history(points).items()
+    }
+
+
+def decimal_odds(price: int) -> float:
+    # American odds jump from -100 to +100; decimal odds keep trends continuous.
+    if price > 0:
+        return 1 + price / 100
+    return 1 + 100 / abs(price) if price else 1.0
+
+
+def _rows(
+    payload: Mapping[str, Any],
+) -> Iterable[tuple[str, str, str, str, int, float | None]]:
+    for item in payload.get("items", []):
+        event_id = item["event"]["event_id"]
+        home = item["event"].get("home_team", "")
+        for market in item["markets"]:
+            for price in market["prices"]:
+                yield (
+                    event_id,
+                    market["market"],
+                    market["book"],
+                    price["outcome"],
+                    int(price["price"]),
+                    outcome_point(
+                        market["market"], market.get("point"), price["outcome"], home
+                    ),
+                )
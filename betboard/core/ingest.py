@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import time
+from datetime import datetime
+from typing import Any, Sequence
+
+from betboard.config import AppConfig
+from betboard.core.feed import MovementBus
+from betboard.core.history import line_changes
+from betboard.core.linking import link_headlines
+from betboard.core.movement import (
+    DEFAULT_RULE_BOOK,
+    MovementRuleBook,
+    compile_rules,
+    detect_notable_moves,
+)
+from betboard.core.serialization import (
+    SNAPSHOT_VERSION,
+    partition_by_market,
+    payload_to_event_odds,
+)
+from betboard.models import EventOdds, MovementEvent, OddsSnapshot
+from betboard.providers.base import NewsProvider, OddsProvider
+from betboard.storage import db
+
+HEADLINE_LIMIT = 25
+
+
+def ingest_league(
+    conn: sqlite3.Connection,
+    config: AppConfig,
+    provider: OddsProvider,
+    league_key: str,
+    bus: MovementBus | None = None,
+) -> int:
+    event_odds = provider.get_odds(
+        league_key=league_key,
+        markets=config.oddsapi.markets,
+        regions=config.oddsapi.regions,
+        books_filter=config.books.allow or None,
+    )
+    return store_league_odds(conn, config, provider.name, league_key, event_odds, bus)
+
+
+def ingest_leagues(
+    conn: sqlite3.Connection,
+    config: AppConfig,
+    provider: OddsProvider,
+    leagues: Sequence[str],
+    bus: MovementBus | None = None,
+) -> dict[str, int]:
+    get_odds_bulk = getattr(provider, "get_odds_bulk", None)
+    if get_odds_bulk is None or len(leagues) < 2:
+        return {
+            league_key: ingest_league(conn, config, provider, league_key, bus)
+            for league_key in leagues
+        }
+    by_league = get_odds_bulk(
+        league_keys=list(leagues),
+        markets=config.oddsapi.markets,
+        regions=config.oddsapi.regions,
+        books_filter=config.books.allow or None,
+    )
+    versions: dict[str, int] = {}
+    for league_key in leagues:
+        event_odds = by_league.get(league_key, [])
+        if isinstance(event_odds, Exception):
+            print(f"{league_key}: ingest failed: {event_odds}")
+            continue
+        versions[league_key] = store_league_odds(
+            conn, config, provider.name, league_key, event_odds, bus
+        )
+    return versions
+
+
+def store_league_odds(
+    conn: sqlite3.Connection,
+    config: AppConfig,
+    provider_name: str,
+    league_key: str,
+    event_odds: Sequence[EventOdds],
+    bus: MovementBus | None = None,
+) -> int:
+    partitions = partition_by_market(event_odds, config.oddsapi.markets)
+    start_times = {odds.event.event_id: odds.event.start_time for odds in event_odds}
+    rules = compile_rules(config.movement)
+    for market, items in partitions.items():
+        snapshot = OddsSnapshot(
+            provider=provider_name,
+            league_key=league_key,
+            market=market,
+            fetched_at=datetime.utcnow(),
+            payload={"version": SNAPSHOT_VERSION, "items": items},
+        )
+        prev_payload = db.get_event_snapshot_payload(
+            conn, provider_name, league_key, market
+        )
+        if prev_payload and prev_payload.get("version") != SNAPSHOT_VERSION:
+            prev_payload = None
+        db.add_snapshot(conn, snapshot)
+        changes = line_changes(prev_payload, snapshot.payload, snapshot.fetched_at)
+        if changes:
+            db.record_line_history(conn, league_key, changes)
+            db.update_line_aggregates(conn, league_key, changes, start_times)
+        if prev_payload:
+            detect_and_store_movements(
+                conn, prev_payload, snapshot.payload, league_key, bus, rules
+            )
+    link_headlines(conn, league_key, [odds.event for odds in event_odds])
+    return db.bump_data_version(conn, league_key)
+
+
+def detect_and_store_movements(
+    conn: sqlite3.Connection,
+    prev_payload: dict[str, Any],
+    curr_payload: dict[str, Any],
+    league_key: str,
+    bus: MovementBus | None = None,
+    rules: MovementRuleBook = DEFAULT_RULE_BOOK,
+) -> list[MovementEvent]:
+    prev_items = {
+        item["event"]["event_id"]: payload_to_event_odds(item)
+        for item in prev_payload.get("items", [])
+    }
+    movements: list[MovementEvent] = []
+    for item in curr_payload.get("items", []):
+        current = payload_to_event_odds(item)
+        previous = prev_items.get(current.event.event_id)
+        if not previous:
+            continue
+        movements.extend(detect_notable_moves(previous, current, rules))
+    if movements:
+        ids = db.record_movement_events(conn, movements)
+        if bus is not None:
+            bus.publish(list(zip(ids, movements)))
+    return movements
+
+
+def run_ingester(
+    conn: sqlite3.Connection,
+    config: AppConfig,
+    provider: OddsProvider,
+    leagues: Sequence[str],
+    interval_seconds: int,
+    bus: MovementBus | None = None,
+) -> None:
+    name = f"{provider.name}:{os.getpid()}"
+    try:
+        while True:
+            started = time.monotonic()
+            db.heartbeat_ingester(conn, name, ttl_seconds=interval_seconds * 2 + 30)
+            for batch in _batches(provider, leagues):
+                try:
+                    ingest_leagues(conn, config, provider, batch, bus)
+                except Exception as exc:
+                    print(f"{', '.join(batch)}: ingest failed: {exc}")
+            elapsed = time.monotonic() - started
+            time.sleep(max(0.0, interval_seconds - elapsed))
+    finally:
+        db.clear_ingester(conn, name)
+
+
+def _batches(provider: OddsProvider, leagues: Sequence[str]) -> list[list[str]]:
+    if hasattr(provider, "get_odds_bulk"):
+        return [list(leagues)]
+    return [[league_key] for league_key in leagues]
+
+
+def ingest_headlines(
+    conn: sqlite3.Connection,
+    news: NewsProvider,
+    league_keys: Sequence[str],
+    limit: int = HEADLINE_LIMIT,
+) -> dict[str, int]:
+    fetch_many = getattr(news, "fetch_many", None)
+    if fetch_many is not None:
+        fetched = fetch_many(league_keys, limit)
+    else:
+        fetched = {key: news.fetch_headlines(key, limit) for key in league_keys}
+    return {
+        league_key: db.store_headlines(conn, league_key, headlines)
+        for league_key, headlines in fetched.items()
+    }
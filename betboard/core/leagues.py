@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from typing import Any, Protocol
+
+from betboard.config import AppConfig
+from betboard.storage import db
+
+
+LEAGUE_NAMES = ("NFL", "CFB", "UFC")
+UFC_FALLBACK_KEY = "ufc"
+
+
+class SportsSource(Protocol):
+    def list_sports(self) -> list[dict[str, Any]]:
+        raise NotImplementedError
+
+
+class LeagueCatalog:
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        source: SportsSource | None,
+        ttl_minutes: int,
+    ) -> None:
+        self._conn = conn
+        self._source = source
+        self._ttl = timedelta(minutes=ttl_minutes)
+        self._sports: list[dict[str, Any]] | None = None
+        self._fetched_at: datetime | None = None
+
+    def sports(self) -> list[dict[str, Any]]:
+        if self._sports is None:
+            self._sports, self._fetched_at = db.list_sports_catalog(self._conn)
+        if self._is_stale() and self._source is not None:
+            self._reload()
+        return self._sports
+
+    def has_key(self, league_key: str) -> bool:
+        return any(sport["key"] == league_key for sport in self.sports())
+
+    def league_key(self, config: AppConfig, name: str) -> str:
+        if name == "NFL":
+            return config.leagues.nfl_key
+        if name == "CFB":
+            return config.leagues.cfb_key
+        return config.leagues.ufc_key or self._ufc_key()
+
+    def league_map(self, config: AppConfig) -> dict[str, str]:
+        return {name: self.league_key(config, name) for name in LEAGUE_NAMES}
+
+    def resolve(self, config: AppConfig, league: str | None) -> list[str]:
+        if not league:
+            return list(self.league_map(config).values())
+        if league.upper() in LEAGUE_NAMES:
+            return [self.league_key(config, league.upper())]
+        if self.has_key(league):
+            return [league]
+        raise ValueError(f"Unknown league {league!r}")
+
+    def _is_stale(self) -> bool:
+        if self._fetched_at is None:
+            return True
+        return datetime.now(timezone.utc) - self._fetched_at > self._ttl
+
+    def _reload(self) -> None:
+        assert self._source is not None
+        try:
+            sports = self._source.list_sports()
+        except Exception:
+            self._source = None
+            return
+        fetched_at = datetime.now(timezone.utc)
+        db.replace_sports_catalog(self._conn, sports, fetched_at)
+        self._sports, self._fetched_at = db.list_sports_catalog(self._conn)
+
+    def _ufc_key(self) -> str:
+        return discover_ufc_key(self.sports()) or UFC_FALLBACK_KEY
+
+
+def discover_ufc_key(sports: list[dict[str, Any]]) -> str | None:
+    candidates = []
+    for sport in sports:
+        key = str(sport.get("key", ""))
+        title = str(sport.get("title", "")).lower()
+        group = str(sport.get("group", "")).lower()
+        active = bool(sport.get("active", False))
+        if "ufc" in title or "ufc" in key:
+            candidates.append((active, key))
+        elif "mma" in key or "mma" in group or "mma" in title:
+            candidates.append((active, key))
+    if not candidates:
+        return None
+    candidates.sort(key=lambda item: (not item[0], item[1]))
+    return candidates[0][1]
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import re
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Iterable, Sequence
+
+from betboard.models import Event, Headline
+from betboard.storage import db
+
+LINK_WINDOW = 100
+# Stories count for a game from a week before kickoff until a day after it, so
+# last week's coverage of the same teams doesn't attach to this week's game.
+LINK_BEFORE = timedelta(days=7)
+LINK_AFTER = timedelta(days=1)
+
+ALIASES = {
+    "49ers": ("niners",),
+    "buccaneers": ("bucs",),
+    "cardinals": ("cards",),
+    "jaguars": ("jags",),
+    "patriots": ("pats",),
+}
+
+# Mascots spanning two words; everything before the mascot is the location.
+TWO_WORD_MASCOTS = frozenset(
+    {
+        ("black", "knights"),
+        ("blue", "devils"),
+        ("blue", "jackets"),
+        ("blue", "jays"),
+        ("blue", "raiders"),
+        ("crimson", "tide"),
+        ("demon", "deacons"),
+        ("fighting", "illini"),
+        ("fighting", "irish"),
+        ("golden", "bears"),
+        ("golden", "eagles"),
+        ("golden", "flashes"),
+        ("golden", "gophers"),
+        ("golden", "hurricane"),
+        ("golden", "knights"),
+        ("green", "wave"),
+        ("horned", "frogs"),
+        ("maple", "leafs"),
+        ("mean", "green"),
+        ("nittany", "lions"),
+        ("ragin", "cajuns"),
+        ("rainbow", "warriors"),
+        ("red", "raiders"),
+        ("red", "sox"),
+        ("red", "wings"),
+        ("red", "wolves"),
+        ("scarlet", "knights"),
+        ("sun", "devils"),
+        ("tar", "heels"),
+        ("thundering", "herd"),
+        ("trail", "blazers"),
+        ("white", "sox"),
+        ("yellow", "jackets"),
+    }
+)
+
+# A one-word location followed by one of these names another school or city:
+# "Georgia Tech", "Michigan State", "Kansas City", "Texas A&M".
+QUALIFIERS = frozenset(
+    {"atlantic", "christian", "city", "international", "southern", "st", "state", "tech"}
+)
+
+TokenKey = tuple[str, ...]
+
+
+class TeamIndex:
+    def __init__(self, events: Iterable[Event]) -> None:
+        teams: dict[TokenKey, set[str]] = {}
+        events_by_team: dict[str, set[str]] = {}
+        self._starts: dict[str, datetime] = {}
+        self._locations: set[TokenKey] = set()
+        for event in events:
+            self._starts[event.event_id] = event.start_time
+            for team in (event.home_team, event.away_team):
+                events_by_team.setdefault(team, set()).add(event.event_id)
+                keys, location = _team_keys(team)
+                for key in keys:
+                    teams.setdefault(key, set()).add(team)
+                if location is not None:
+                    self._locations.add(location)
+        # Keys shared by different teams ("new york", "tigers") say nothing about
+        # which game a story is about, but still claim their words when matching.
+        self._index: dict[TokenKey, frozenset[str]] = {
+            key: frozenset(events_by_team[next(iter(names))])
+            if len(names) == 1
+            else frozenset()
+            for key, names in teams.items()
+        }
+        self._longest = max((len(key) for key in self._index), default=0)
+
+    def match(self, text: str) -> set[str]:
+        # Leftmost-longest: "georgia tech" wins over "georgia" at the same word.
+        tokens = _tokens(text)
+        found: set[str] = set()
+        start = 0
+        while start < len(tokens):
+            for size in range(min(self._longest, len(tokens) - start), 0, -1):
+                key = tuple(tokens[start : start + size])
+                event_ids = self._index.get(key)
+                if event_ids is None:
+                    continue
+                if key in self._locations and _qualified(tokens, start + size):
+                    continue
+                found.update(event_ids)
+                start += size
+                break
+            else:
+                start += 1
+        return found
+
+    def link(self, headlines: Sequence[Headline]) -> dict[str, list[Headline]]:
+        linked: dict[str, list[Headline]] = {}
+        for headline in headlines:
+            if headline.published_at is None:
+                continue
+            for event_id in self.match(headline.title):
+                start = self._starts[event_id]
+                if start - LINK_BEFORE <= headline.published_at <= start + LINK_AFTER:
+                    linked.setdefault(event_id, []).append(headline)
+        return linked
+
+
+def link_headlines(
+    conn: sqlite3.Connection, league_key: str, events: Iterable[Event]
+) -> dict[str, list[Headline]]:
+    events = list(events)
+    headlines = db.recent_headlines(conn, league_key, LINK_WINDOW)
+    linked = TeamIndex(events).link(headlines)
+    db.prune_headline_links(conn, league_key, [event.event_id for event in events])
+    db.store_headline_links(conn, league_key, linked)
+    return linked
+
+
+def _team_keys(team: str) -> tuple[set[TokenKey], TokenKey | None]:
+    tokens = _tokens(team)
+    if not tokens:
+        return set(), None
+    keys = {tuple(tokens)}
+    size = 2 if len(tokens) > 2 and tuple(tokens[-2:]) in TWO_WORD_MASCOTS else 1
+    mascot, location = tuple(tokens[-size:]), tuple(tokens[:-size])
+    if size > 1 or len(mascot[0]) >= 3:
+        keys.add(mascot)
+    if len(location) > 1 or (location and len(location[0]) >= 3):
+        keys.add(location)
+    else:
+        location = ()
+    keys.update((alias,) for alias in ALIASES.get(mascot[-1], ()))
+    return keys, location or None
+
+
+def _qualified(tokens: list[str], end: int) -> bool:
+    following = tokens[end : end + 2]
+    return bool(following) and (following[0] in QUALIFIERS or following == ["a", "m"])
+
+
+def _tokens(text: str) -> list[str]:
+    return re.findall(r"[a-z0-9]+", text.lower())
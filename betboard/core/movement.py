@@ -1,28 +1,114 @@
 from __future__ import annotations
 
-from dataclasses import asdict
+from dataclasses import asdict, dataclass, fields
 from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Callable, Iterator, Mapping
 
-from betboard.models import EventOdds, MovementEvent
+from betboard.config import MovementConfig, MovementRuleConfig
+from betboard.models import EventOdds, MovementEvent, outcome_point
+
+PriceKey = tuple[str, str, str]
+IndexedPrice = dict[str, float | None]
+Check = Callable[[IndexedPrice, IndexedPrice], bool]
+
+
+@dataclass(frozen=True)
+class MovementRules:
+    h2h_cents: float = 15
+    point_delta: float = 1.0
+    flag_sign_flip: bool = True
+    probability_delta: float = 0.0
+    key_numbers: tuple[float, ...] = ()
+
+    def is_notable(self, market: str, prev: IndexedPrice, curr: IndexedPrice) -> bool:
+        return _compile(self, market)(prev, curr)
+
+
+DEFAULT_RULES = MovementRules()
+
+
+class MovementRuleBook:
+    def __init__(
+        self,
+        defaults: MovementRules = DEFAULT_RULES,
+        overrides: tuple[MovementRuleConfig, ...] = (),
+    ) -> None:
+        self.defaults = defaults
+        # Most specific last so that its settings win when merged in order.
+        self._overrides = sorted(
+            overrides,
+            key=lambda rule: sum(
+                value is not None for value in (rule.league, rule.market, rule.book)
+            ),
+        )
+        self._checks: dict[tuple[str, str, str], Check] = {}
+        for rule in self._overrides:
+            rules_from_settings(rule.settings, defaults)
+
+    def rules_for(self, league_key: str, market: str, book: str) -> MovementRules:
+        settings: dict[str, Any] = {}
+        for rule in self._overrides:
+            if (
+                rule.league in (None, league_key)
+                and rule.market in (None, market)
+                and rule.book in (None, book)
+            ):
+                settings.update(rule.settings)
+        return rules_from_settings(settings, self.defaults)
+
+    def check(self, league_key: str, market: str, book: str) -> Check:
+        key = (league_key, market, book)
+        check = self._checks.get(key)
+        if check is None:
+            check = self._checks[key] = _compile(
+                self.rules_for(league_key, market, book), market
+            )
+        return check
+
+
+DEFAULT_RULE_BOOK = MovementRuleBook()
+
+
+@lru_cache(maxsize=16)
+def compile_rules(config: MovementConfig) -> MovementRuleBook:
+    return MovementRuleBook(rules_from_settings(config.defaults), config.rules)
+
+
+def rules_from_settings(
+    settings: Mapping[str, Any] | tuple[tuple[str, Any], ...],
+    base: MovementRules = DEFAULT_RULES,
+) -> MovementRules:
+    values = dict(settings)
+    names = {field.name for field in fields(MovementRules)}
+    unknown = set(values) - names
+    if unknown:
+        raise ValueError(f"Unknown movement rule setting: {', '.join(sorted(unknown))}")
+    if "key_numbers" in values:
+        values["key_numbers"] = tuple(float(value) for value in values["key_numbers"])
+    if not isinstance(values.get("flag_sign_flip", True), bool):
+        raise ValueError("Movement rule setting flag_sign_flip must be true or false")
+    for name in ("h2h_cents", "point_delta", "probability_delta"):
+        if name in values:
+            values[name] = float(values[name])
+    return MovementRules(**{**asdict(base), **values})
 
 
 def detect_notable_moves(
-    previous: EventOdds, current: EventOdds
+    previous: EventOdds,
+    current: EventOdds,
+    rules: MovementRuleBook = DEFAULT_RULE_BOOK,
 ) -> list[MovementEvent]:
-    prev_map = _index_prices(previous)
-    curr_map = _index_prices(current)
+    league_key = current.event.league_key
     moves: list[MovementEvent] = []
 
-    for key, curr in curr_map.items():
-        prev = prev_map.get(key)
-        if not prev:
-            continue
+    for key, prev, curr in price_changes(previous, current):
         market, book, outcome = key
         delta = curr["price"] - prev["price"]
-        if _is_notable(market, prev["price"], curr["price"], prev["point"], curr["point"]):
+        if rules.check(league_key, market, book)(prev, curr):
             moves.append(
                 MovementEvent(
-                    league_key=current.event.league_key,
+                    league_key=league_key,
                     event_id=current.event.event_id,
                     created_at=datetime.now(timezone.utc),
                     details={
@@ -38,31 +124,93 @@ def detect_notable_moves(
     return moves
 
 
-def _index_prices(event_odds: EventOdds) -> dict[tuple[str, str, str], dict[str, float]]:
-    indexed: dict[tuple[str, str, str], dict[str, float]] = {}
+def price_changes(
+    previous: EventOdds, current: EventOdds
+) -> Iterator[tuple[PriceKey, IndexedPrice, IndexedPrice]]:
+    prev_map = _index_prices(previous)
+    for key, curr in _index_prices(current).items():
+        prev = prev_map.get(key)
+        if prev:
+            yield key, prev, curr
+
+
+def implied_probability(price: float) -> float:
+    if price > 0:
+        return 100 / (price + 100)
+    return -price / (-price + 100)
+
+
+def _index_prices(event_odds: EventOdds) -> dict[PriceKey, IndexedPrice]:
+    indexed: dict[PriceKey, IndexedPrice] = {}
+    home = event_odds.event.home_team
     for market in event_odds.markets:
         for price in market.prices:
+            point = outcome_point(market.market, market.point, price.outcome, home)
             indexed[(market.market, market.book, price.outcome)] = {
                 "price": float(price.price),
-                "point": float(market.point) if market.point is not None else None,
+                "point": float(point) if point is not None else None,
             }
     return indexed
 
 
-def _is_notable(
-    market: str,
-    prev_price: float,
-    curr_price: float,
-    prev_point: float | None,
-    curr_point: float | None,
-) -> bool:
+@lru_cache(maxsize=1024)
+def _compile(rules: MovementRules, market: str) -> Check:
+    # Only the checks a market's rules enable end up in its dispatch list, so
+    # the per-price cost is a few comparisons rather than the whole rule set.
+    checks: list[Check] = []
     if market == "h2h":
-        if abs(curr_price - prev_price) >= 15:
-            return True
-        if (prev_price < 0 <= curr_price) or (prev_price > 0 >= curr_price):
-            return True
+        checks.append(_price_check(rules.h2h_cents))
+        if rules.flag_sign_flip:
+            checks.append(_sign_flip)
     if market in {"spreads", "totals"}:
-        if prev_point is None or curr_point is None:
-            return False
-        return abs(curr_point - prev_point) >= 1.0
+        checks.append(_point_check(rules.point_delta))
+    if market == "spreads" and rules.key_numbers:
+        checks.append(_key_number_check(rules.key_numbers))
+    if rules.probability_delta > 0:
+        checks.append(_probability_check(rules.probability_delta))
+
+    if not checks:
+        return _never
+    if len(checks) == 1:
+        return checks[0]
+    return lambda prev, curr: any(check(prev, curr) for check in checks)
+
+
+def _never(prev: IndexedPrice, curr: IndexedPrice) -> bool:
     return False
+
+
+def _sign_flip(prev: IndexedPrice, curr: IndexedPrice) -> bool:
+    prev_price, curr_price = prev["price"], curr["price"]
+    return (prev_price < 0 <= curr_price) or (prev_price > 0 >= curr_price)
+
+
+def _price_check(cents: float) -> Check:
+    return lambda prev, curr: abs(curr["price"] - prev["price"]) >= cents
+
+
+def _point_check(delta: float) -> Check:
+    def check(prev: IndexedPrice, curr: IndexedPrice) -> bool:
+        if prev["point"] is None or curr["point"] is None:
+            return False
+        return abs(curr["point"] - prev["point"]) >= delta
+
+    return check
+
+
+def _key_number_check(key_numbers: tuple[float, ...]) -> Check:
+    def check(prev: IndexedPrice, curr: IndexedPrice) -> bool:
+        if prev["point"] is None or curr["point"] is None or prev["point"] == curr["point"]:
+            return False
+        # Moving onto or off a key number counts as crossing it.
+        low, high = sorted((abs(prev["point"]), abs(curr["point"])))
+        return any(low <= number <= high for number in key_numbers)
+
+    return check
+
+
+def _probability_check(delta: float) -> Check:
+    return lambda prev, curr: (
+        abs(implied_probability(curr["price"]) - implied_probability(prev["price"]))
+        >= delta
+    )
@@ -1,20 +1,46 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Iterable
+from typing import Iterable, Sequence
 
-from betboard.models import BestLines, EventOdds, OddsBoard, OddsPrice
+from betboard.core.consensus import league_consensus
+from betboard.models import (
+    BestLines,
+    BookEdge,
+    EventOdds,
+    FairPrice,
+    OddsBoard,
+    OddsPrice,
+    outcome_point,
+)
+
+
+def build_odds_boards(event_odds: Sequence[EventOdds]) -> list[OddsBoard]:
+    return [
+        _best_lines_board(odds, fair_prices, edges)
+        for odds, (fair_prices, edges) in zip(event_odds, league_consensus(event_odds))
+    ]
 
 
 def build_odds_board(event_odds: EventOdds) -> OddsBoard:
+    return build_odds_boards([event_odds])[0]
+
+
+def _best_lines_board(
+    event_odds: EventOdds,
+    fair_prices: tuple[FairPrice, ...] = (),
+    edges: tuple[BookEdge, ...] = (),
+) -> OddsBoard:
     best_lines: list[BestLines] = []
     last_updates: list[datetime] = []
 
+    home = event_odds.event.home_team
     for market in event_odds.markets:
         last_updates.append(market.last_update)
         for price in market.prices:
+            point = outcome_point(market.market, market.point, price.outcome, home)
             existing = _find_line(best_lines, market.market, price.outcome)
-            if existing is None or _is_better(price, market.point, existing):
+            if existing is None or _is_better(price, point, existing):
                 if existing:
                     best_lines.remove(existing)
                 best_lines.append(
@@ -23,7 +49,7 @@ def build_odds_board(event_odds: EventOdds) -> OddsBoard:
                         outcome=price.outcome,
                         price=price.price,
                         book=market.book,
-                        point=market.point,
+                        point=point,
                     )
                 )
 
@@ -31,6 +57,8 @@ def build_odds_board(event_odds: EventOdds) -> OddsBoard:
         event=event_odds.event,
         best_lines=tuple(best_lines),
         last_update=max(last_updates) if last_updates else None,
+        fair_prices=fair_prices,
+        edges=edges,
     )
 
 
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from datetime import datetime
+from pathlib import Path
+
+from betboard.config import MovementConfig
+from betboard.core.movement import compile_rules, price_changes, rules_from_settings
+from betboard.core.serialization import SNAPSHOT_VERSION, payload_to_event_odds
+from betboard.models import EventOdds, OddsSnapshot
+from betboard.storage import db
+
+
+@dataclass(frozen=True)
+class ReplayTask:
+    league_key: str
+    rule_sets: dict[str, MovementConfig]
+    db_path: Path | None = None
+    since: datetime | None = None
+    until: datetime | None = None
+    # Start of the whole replay; a shard's first comparison per stream reaches
+    # back to the last snapshot before `since`, but never past this.
+    floor: datetime | None = None
+
+
+@dataclass(frozen=True)
+class ReplayResult:
+    league_key: str
+    alerts: dict[str, int]
+    comparisons: int
+
+
+@dataclass(frozen=True)
+class ReplayReport:
+    alerts: dict[str, int]
+    by_league: dict[str, dict[str, int]]
+    comparisons: int
+
+
+def replay(
+    rule_sets: dict[str, MovementConfig],
+    leagues: list[str] | None = None,
+    db_path: Path | None = None,
+    workers: int | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+) -> ReplayReport:
+    conn = db.connection(db_path)
+    leagues = leagues or db.snapshot_leagues(conn)
+    workers = max(1, workers or os.cpu_count() or 1)
+    # Split each league into time ranges so a single busy league still spreads
+    # across the pool, and every snapshot is read and decoded by one shard.
+    shards = max(1, -(-workers // max(1, len(leagues))))
+    tasks: list[ReplayTask] = []
+    for league_key in leagues:
+        times = db.snapshot_times(conn, league_key, since, until) if shards > 1 else []
+        count = min(shards, len(times)) or 1
+        cuts = [times[len(times) * shard // count] for shard in range(1, count)]
+        bounds = [since, *cuts, until]
+        tasks.extend(
+            ReplayTask(league_key, rule_sets, db_path, start, end, since)
+            for start, end in zip(bounds, bounds[1:])
+        )
+    if workers == 1:
+        results = [replay_partition(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(replay_partition, tasks))
+
+    by_league: dict[str, Counter[str]] = {league_key: Counter() for league_key in leagues}
+    comparisons = 0
+    for result in results:
+        by_league[result.league_key].update(result.alerts)
+        comparisons += result.comparisons
+    totals: Counter[str] = sum(by_league.values(), Counter())
+    return ReplayReport(
+        alerts={name: totals[name] for name in rule_sets},
+        by_league={
+            league_key: {name: counts[name] for name in rule_sets}
+            for league_key, counts in by_league.items()
+        },
+        comparisons=comparisons,
+    )
+
+
+def replay_partition(task: ReplayTask) -> ReplayResult:
+    alerts: Counter[str] = Counter()
+    comparisons = 0
+    rule_books = [(name, compile_rules(config)) for name, config in task.rule_sets.items()]
+    # Ingest compares each snapshot with the latest one for the same provider and
+    # market, so replay keeps one previous snapshot per stream.
+    previous: dict[tuple[str, str], dict[str, EventOdds]] = {}
+    conn = db.connect(task.db_path)
+    try:
+        if task.since is not None and task.since != task.floor:
+            boundary = db.snapshots_before(
+                conn, task.league_key, task.since, task.floor
+            )
+            for snapshot in boundary:
+                previous[(snapshot.provider, snapshot.market)] = _decode(snapshot)
+        for snapshot in db.iter_snapshots(conn, task.league_key, task.since, task.until):
+            stream = (snapshot.provider, snapshot.market)
+            prior = previous.get(stream, {})
+            current = previous[stream] = _decode(snapshot)
+            for event_id, odds in current.items():
+                before = prior.get(event_id)
+                if before is None:
+                    continue
+                comparisons += 1
+                for (market, book, _), prev, curr in price_changes(before, odds):
+                    for name, rules in rule_books:
+                        if rules.check(task.league_key, market, book)(prev, curr):
+                            alerts[name] += 1
+    finally:
+        conn.close()
+    return ReplayResult(task.league_key, dict(alerts), comparisons)
+
+
+def parse_rules(spec: str, base: MovementConfig) -> tuple[str, MovementConfig]:
+    name, _, settings = spec.partition(":")
+    if not name:
+        raise ValueError(f"Rule set needs a name: {spec!r}")
+    values: list[tuple[str, object]] = []
+    for setting in filter(None, settings.split(",")):
+        key, _, value = (part.strip() for part in setting.partition("="))
+        if key == "flag_sign_flip":
+            values.append((key, value.lower() in {"1", "true", "yes", "on"}))
+        elif key == "key_numbers":
+            numbers = filter(None, value.split("/"))
+            values.append((key, tuple(float(number) for number in numbers)))
+        else:
+            values.append((key, value))
+    rules_from_settings(values)
+    return name, replace(base, defaults=base.defaults + tuple(values))
+
+
+def _decode(snapshot: OddsSnapshot) -> dict[str, EventOdds]:
+    # Ingest never compares across snapshot versions, so neither does replay.
+    if snapshot.payload.get("version") != SNAPSHOT_VERSION:
+        return {}
+    return {
+        item["event"]["event_id"]: payload_to_event_odds(item)
+        for item in snapshot.payload.get("items", [])
+    }
@@ -1,33 +1,63 @@
 from __future__ import annotations
 
+import json
+from dataclasses import asdict, is_dataclass
 from datetime import datetime
-from typing import Any
+from typing import Any, Sequence
 
 from betboard.models import Event, EventOdds, MarketOdds, OddsPrice
 
+# Bumped when stored payloads change meaning. Version 2 snapshots keep the home
+# line as the spread point for every provider; older Odds API snapshots kept
+# whichever outcome came last, so they can't be compared with newer ones.
+SNAPSHOT_VERSION = 2
+
 
 def event_odds_to_payload(event_odds: EventOdds) -> dict[str, Any]:
     return {
-        "event": {
-            "event_id": event_odds.event.event_id,
-            "league_key": event_odds.event.league_key,
-            "sport_title": event_odds.event.sport_title,
-            "home_team": event_odds.event.home_team,
-            "away_team": event_odds.event.away_team,
-            "start_time": event_odds.event.start_time.isoformat(),
-        },
-        "markets": [
-            {
-                "market": market.market,
-                "book": market.book,
-                "last_update": market.last_update.isoformat(),
-                "point": market.point,
-                "prices": [
-                    {"outcome": price.outcome, "price": price.price}
-                    for price in market.prices
-                ],
-            }
-            for market in event_odds.markets
+        "event": _event_payload(event_odds.event),
+        "markets": [_market_payload(market) for market in event_odds.markets],
+    }
+
+
+def partition_by_market(
+    event_odds: Sequence[EventOdds], markets: Sequence[str]
+) -> dict[str, list[dict[str, Any]]]:
+    partitions: dict[str, list[dict[str, Any]]] = {market: [] for market in markets}
+    for odds in event_odds:
+        event = _event_payload(odds.event)
+        items: dict[str, dict[str, Any]] = {}
+        for market in odds.markets:
+            partition = partitions.get(market.market)
+            if partition is None:
+                continue
+            item = items.get(market.market)
+            if item is None:
+                item = items[market.market] = {"event": event, "markets": []}
+                partition.append(item)
+            item["markets"].append(_market_payload(market))
+    return partitions
+
+
+def _event_payload(event: Event) -> dict[str, Any]:
+    return {
+        "event_id": event.event_id,
+        "league_key": event.league_key,
+        "sport_title": event.sport_title,
+        "home_team": event.home_team,
+        "away_team": event.away_team,
+        "start_time": event.start_time.isoformat(),
+    }
+
+
+def _market_payload(market: MarketOdds) -> dict[str, Any]:
+    return {
+        "market": market.market,
+        "book": market.book,
+        "last_update": market.last_update.isoformat(),
+        "point": market.point,
+        "prices": [
+            {"outcome": price.outcome, "price": price.price} for price in market.prices
         ],
     }
 
@@ -57,3 +87,15 @@ def payload_to_event_odds(payload: dict[str, Any]) -> EventOdds:
             )
         )
     return EventOdds(event=event, markets=tuple(markets))
+
+
+def to_json(value: Any, indent: int | None = 2) -> str:
+    return json.dumps(value, default=_json_default, indent=indent)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if is_dataclass(value):
+        return asdict(value)
+    raise TypeError(f"Type not serializable: {type(value)!r}")
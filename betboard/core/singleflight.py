@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from typing import Any, Callable, Generic, TypeVar
+
+from betboard.core.serialization import event_odds_to_payload, payload_to_event_odds
+from betboard.models import EventOdds
+from betboard.providers.base import OddsProvider, get_odds_each
+from betboard.storage import db
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    def __init__(self) -> None:
+        self._calls: dict[str, Future[Any]] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, fetch: Callable[[], T]) -> T:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = Future()
+                self._calls[key] = call
+        if not leader:
+            return call.result()
+        try:
+            result = fetch()
+        except BaseException as exc:
+            call.set_exception(exc)
+            raise
+        else:
+            call.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+
+class SharedFlight(Generic[T]):
+    def __init__(
+        self,
+        connect: Callable[[], sqlite3.Connection],
+        encode: Callable[[T], Any],
+        decode: Callable[[Any], T],
+        lease_seconds: float = 60.0,
+        poll_seconds: float = 0.1,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._connect = connect
+        self._encode = encode
+        self._decode = decode
+        self._lease_seconds = lease_seconds
+        self._poll_seconds = poll_seconds
+        self._sleep = sleep
+
+    def do(self, key: str, fetch: Callable[[], T]) -> T:
+        conn = self._connect()
+        owner = uuid.uuid4().hex
+        waited_on: str | None = None
+        while True:
+            state = db.flight_state(conn, key)
+            if state is not None:
+                flight_owner, done, result = state
+                if done and flight_owner == waited_on:
+                    return self._decode(result)
+                if not done:
+                    waited_on = flight_owner
+                    self._sleep(self._poll_seconds)
+                    continue
+            if db.acquire_flight(conn, key, owner, self._lease_seconds):
+                break
+        try:
+            value = fetch()
+        except BaseException:
+            db.release_flight(conn, key, owner)
+            raise
+        db.complete_flight(conn, key, owner, self._encode(value))
+        return value
+
+
+class CoalescingOddsProvider:
+    def __init__(
+        self,
+        provider: OddsProvider,
+        connect: Callable[[], sqlite3.Connection] = db.connection,
+        local: SingleFlight | None = None,
+    ) -> None:
+        self._provider = provider
+        self.name = provider.name
+        self._local = local or SingleFlight()
+        self._shared: SharedFlight[list[EventOdds]] = SharedFlight(
+            connect,
+            encode=lambda odds: [event_odds_to_payload(item) for item in odds],
+            decode=lambda payload: [payload_to_event_odds(item) for item in payload],
+        )
+        # Bulk support is detected with hasattr, so only offer it when the
+        # wrapped provider has it. Bulk fetches fan out to the per-league
+        # flights, so they coalesce with single-league callers too.
+        if hasattr(provider, "get_odds_bulk"):
+            self.get_odds_bulk = self._get_odds_bulk
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._provider, name)
+
+    def get_odds(
+        self,
+        league_key: str,
+        markets: list[str],
+        regions: str,
+        books_filter: list[str] | None,
+    ) -> list[EventOdds]:
+        key = "|".join(
+            (
+                self.name,
+                "odds",
+                league_key,
+                ",".join(markets),
+                regions,
+                ",".join(books_filter or []),
+            )
+        )
+
+        def fetch() -> list[EventOdds]:
+            return self._provider.get_odds(league_key, markets, regions, books_filter)
+
+        return self._local.do(key, lambda: self._shared.do(key, fetch))
+
+    def _get_odds_bulk(
+        self,
+        league_keys: list[str],
+        markets: list[str],
+        regions: str,
+        books_filter: list[str] | None,
+    ) -> dict[str, list[EventOdds] | Exception]:
+        return get_odds_each(self.get_odds, league_keys, markets, regions, books_filter)
@@ -45,6 +45,7 @@ class Headline:
     url: str
     published_at: datetime | None
     source: str
+    guid: str = ""
 
 
 @dataclass
@@ -72,6 +73,33 @@ class MovementEvent:
     details: Mapping[str, Any]
 
 
+@dataclass(frozen=True)
+class LinePoint:
+    observed_at: datetime
+    market: str
+    book: str
+    outcome: str
+    price: int
+    point: float | None = None
+
+
+@dataclass(frozen=True)
+class LineAggregate:
+    event_id: str
+    league_key: str
+    market: str
+    book: str
+    outcome: str
+    open_price: int
+    open_point: float | None
+    current_price: int
+    current_point: float | None
+    best_price: int
+    close_price: int | None
+    close_point: float | None
+    updated_at: datetime
+
+
 @dataclass
 class BestLines:
     market: str
@@ -81,11 +109,51 @@ class BestLines:
     point: float | None = None
 
 
+@dataclass(frozen=True)
+class FairPrice:
+    market: str
+    outcome: str
+    point: float | None
+    probability: float
+    price: int
+    books: int
+
+
+@dataclass(frozen=True)
+class BookEdge:
+    market: str
+    outcome: str
+    book: str
+    price: int
+    point: float | None
+    edge: float
+
+
+@dataclass(frozen=True)
+class OpportunityLeg:
+    book: str
+    outcome: str
+    price: int
+    point: float | None
+
+
+@dataclass(frozen=True)
+class Opportunity:
+    event_id: str
+    market: str
+    kind: str
+    legs: tuple[OpportunityLeg, ...]
+    margin: float
+    width: float | None = None
+
+
 @dataclass
 class OddsBoard:
     event: Event
     best_lines: tuple[BestLines, ...]
     last_update: datetime | None
+    fair_prices: tuple[FairPrice, ...] = field(default_factory=tuple)
+    edges: tuple[BookEdge, ...] = field(default_factory=tuple)
 
 
 @dataclass
@@ -96,6 +164,17 @@ class ExportBundle:
     movements: tuple[MovementEvent, ...] = field(default_factory=tuple)
     headlines: tuple[Headline, ...] = field(default_factory=tuple)
     watchlist: tuple[WatchlistItem, ...] = field(default_factory=tuple)
+    lines: tuple[LineAggregate, ...] = field(default_factory=tuple)
+    opportunities: tuple[Opportunity, ...] = field(default_factory=tuple)
+
+
+def outcome_point(
+    market: str, point: float | None, outcome: str, home_team: str
+) -> float | None:
+    # Spread markets carry the home line; the other side takes the opposite.
+    if market == "spreads" and point is not None and outcome != home_team:
+        return -point
+    return point
 
 
 def best_price(prices: Iterable[OddsPrice]) -> OddsPrice | None:
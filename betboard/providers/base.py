@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Protocol
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Protocol
 
 from betboard.models import Event, EventOdds, Headline
 
@@ -21,6 +22,25 @@ class OddsProvider(Protocol):
         raise NotImplementedError
 
 
+def get_odds_each(
+    get_odds: Callable[[str, list[str], str, list[str] | None], list[EventOdds]],
+    league_keys: list[str],
+    markets: list[str],
+    regions: str,
+    books_filter: list[str] | None,
+) -> dict[str, list[EventOdds] | Exception]:
+    def fetch(league_key: str) -> list[EventOdds] | Exception:
+        try:
+            return get_odds(league_key, markets, regions, books_filter)
+        except Exception as exc:
+            return exc
+
+    if not league_keys:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(8, len(league_keys))) as pool:
+        return dict(zip(league_keys, pool.map(fetch, league_keys)))
+
+
 class NewsProvider(Protocol):
     name: str
 
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
-
-import feedparser
+from typing import Any, Iterable, Iterator
+from xml.etree.ElementTree import Element, ParseError, XMLPullParser
 
 from betboard.models import Headline
+from betboard.providers.resilience import HEDGE_PERCENTILE, ResilientClient
 
 
 RSS_FEEDS = {
@@ -16,24 +18,103 @@ RSS_FEEDS = {
 
 FALLBACK_FEED = "https://www.espn.com/espn/rss/news"
 
+CHUNK_SIZE = 8192
+
+# Shared so that breaker state and latency history survive the short-lived
+# provider instances created per refresh.
+DEFAULT_CLIENT = ResilientClient(hedge_percentile=HEDGE_PERCENTILE)
+
 
 class EspnRssProvider:
     name = "espn_rss"
 
+    def __init__(self, client: ResilientClient | None = None) -> None:
+        self.client = client or DEFAULT_CLIENT
+
     def fetch_headlines(self, league_key: str, limit: int) -> list[Headline]:
-        url = RSS_FEEDS.get(league_key, FALLBACK_FEED)
-        feed = feedparser.parse(url)
-        headlines: list[Headline] = []
-        for entry in feed.entries[:limit]:
-            headlines.append(
-                Headline(
-                    title=entry.get("title", ""),
-                    url=entry.get("link", ""),
-                    published_at=_parse_time(entry.get("published")),
-                    source="ESPN",
-                )
-            )
-        return headlines
+        return self._fetch_feed(RSS_FEEDS.get(league_key, FALLBACK_FEED), limit)
+
+    def fetch_many(
+        self, league_keys: Iterable[str], limit: int
+    ) -> dict[str, list[Headline]]:
+        urls = {key: RSS_FEEDS.get(key, FALLBACK_FEED) for key in league_keys}
+        unique = list(dict.fromkeys(urls.values()))
+        if not unique:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(8, len(unique))) as pool:
+            pages = pool.map(lambda url: self._fetch_feed(url, limit), unique)
+            feeds = dict(zip(unique, pages))
+        return {key: feeds[url] for key, url in urls.items()}
+
+    def _fetch_feed(self, url: str, limit: int) -> list[Headline]:
+        response = self.client.get(url, timeout=(5, 15), stream=True)
+        chunks = response.iter_content(CHUNK_SIZE)
+        received: list[bytes] = []
+
+        def record() -> Iterator[bytes]:
+            for chunk in chunks:
+                received.append(chunk)
+                yield chunk
+
+        try:
+            return parse_headlines(record(), limit)
+        except ParseError:
+            import feedparser
+
+            feed = feedparser.parse(b"".join(received) + b"".join(chunks))
+            return [_entry_headline(entry) for entry in feed.entries[:limit]]
+        finally:
+            response.close()
+
+
+def parse_headlines(chunks: Iterable[bytes], limit: int) -> list[Headline]:
+    # Stops reading the body once `limit` items are parsed; ESPN feeds carry
+    # dozens of items and only the first few are shown.
+    parser = XMLPullParser(events=("end",))
+    headlines: list[Headline] = []
+    for chunk in chunks:
+        parser.feed(chunk)
+        for _, element in parser.read_events():
+            if _local_name(element.tag) not in {"item", "entry"}:
+                continue
+            headlines.append(_element_headline(element))
+            element.clear()
+            if len(headlines) >= limit:
+                return headlines
+    parser.close()
+    return headlines
+
+
+def _element_headline(element: Element) -> Headline:
+    fields: dict[str, str] = {}
+    for child in element:
+        name = _local_name(child.tag)
+        if name == "link" and child.get("href"):
+            fields.setdefault("link", child.get("href", ""))
+        elif name in {"title", "link", "guid", "id", "pubDate", "published", "updated"}:
+            fields.setdefault(name, (child.text or "").strip())
+    published = fields.get("pubDate") or fields.get("published") or fields.get("updated")
+    return Headline(
+        title=fields.get("title", ""),
+        url=fields.get("link", ""),
+        published_at=_parse_time(published),
+        source="ESPN",
+        guid=fields.get("guid") or fields.get("id", ""),
+    )
+
+
+def _entry_headline(entry: Any) -> Headline:
+    return Headline(
+        title=entry.get("title", ""),
+        url=entry.get("link", ""),
+        published_at=_parse_time(entry.get("published")),
+        source="ESPN",
+        guid=entry.get("id", ""),
+    )
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
 
 
 def _parse_time(value: str | None) -> datetime | None:
@@ -41,8 +122,11 @@ def _parse_time(value: str | None) -> datetime | None:
         return None
     try:
         parsed = parsedate_to_datetime(value)
-        if parsed.tzinfo is None:
-            return parsed.replace(tzinfo=timezone.utc)
-        return parsed
-    except Exception:
-        return None
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from datetime import timedelta
+from typing import Any, Callable, Sequence, TypeVar
+
+from betboard.config import AppConfig, odds_api_key, therundown_api_key
+from betboard.models import Event, EventOdds, MarketOdds, OddsPrice
+from betboard.providers.base import OddsProvider
+from betboard.providers.resilience import CircuitOpenError
+
+T = TypeVar("T")
+
+MATCH_WINDOW = timedelta(hours=3)
+
+# Spellings that differ between feeds, keyed by the normalized name. Teams are
+# matched on their full name only: mascots repeat across college football
+# ("Bulldogs", "Tigers") and can't tell two games at one kickoff apart.
+TEAM_ALIASES = {
+    "kc chiefs": "kansas city chiefs",
+    "la chargers": "los angeles chargers",
+    "la rams": "los angeles rams",
+    "ny giants": "new york giants",
+    "ny jets": "new york jets",
+    "miami fl hurricanes": "miami hurricanes",
+    "miami oh redhawks": "miami ohio redhawks",
+    "ole miss rebels": "mississippi rebels",
+    "lsu tigers": "louisiana state tigers",
+    "usc trojans": "southern california trojans",
+    "ucf knights": "central florida knights",
+}
+
+
+class EventIndex:
+    def __init__(self, window: timedelta = MATCH_WINDOW) -> None:
+        self._window = window
+        self._events: dict[frozenset[str], list[Event]] = {}
+
+    def add(self, event: Event) -> None:
+        self._events.setdefault(_matchup_key(event), []).append(event)
+
+    def match(self, event: Event) -> Event | None:
+        candidates = [
+            candidate
+            for candidate in self._events.get(_matchup_key(event), [])
+            if abs(candidate.start_time - event.start_time) <= self._window
+        ]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda c: abs(c.start_time - event.start_time))
+
+
+class MergedOddsProvider:
+    def __init__(self, providers: Sequence[OddsProvider]) -> None:
+        if not providers:
+            raise ValueError("No odds providers to merge")
+        self.providers = list(providers)
+        self.name = "+".join(provider.name for provider in self.providers)
+
+    def list_events(self, league_key: str, hours: int) -> list[Event]:
+        results = self._fan_out(lambda p: p.list_events(league_key, hours))
+        index = EventIndex()
+        events: list[Event] = []
+        for provider_events in results:
+            unmatched = [event for event in provider_events if index.match(event) is None]
+            for event in unmatched:
+                index.add(event)
+            events.extend(unmatched)
+        return events
+
+    def get_odds(
+        self,
+        league_key: str,
+        markets: list[str],
+        regions: str,
+        books_filter: list[str] | None,
+    ) -> list[EventOdds]:
+        results = self._fan_out(
+            lambda p: p.get_odds(league_key, markets, regions, books_filter)
+        )
+        return merge_event_odds(results)
+
+    def list_sports(self) -> list[dict[str, Any]]:
+        for provider in self.providers:
+            list_sports = getattr(provider, "list_sports", None)
+            if list_sports is not None:
+                return list_sports()
+        raise NotImplementedError("No provider lists sports")
+
+    def _fan_out(self, call: Callable[[OddsProvider], T]) -> list[T]:
+        with ThreadPoolExecutor(max_workers=len(self.providers)) as pool:
+            futures = [pool.submit(call, provider) for provider in self.providers]
+        results: list[T] = []
+        errors: list[BaseException] = []
+        for future in futures:
+            error = future.exception()
+            if error is None:
+                results.append(future.result())
+            else:
+                errors.append(error)
+        if not results:
+            # Only surface the breaker error when every provider is merely open
+            # so that callers fall back to stale odds; real failures win.
+            unavailable = [e for e in errors if isinstance(e, CircuitOpenError)]
+            if len(unavailable) == len(errors):
+                raise min(unavailable, key=lambda error: error.retry_in)
+            raise next(e for e in errors if not isinstance(e, CircuitOpenError))
+        return results
+
+
+def merge_event_odds(results: Sequence[Sequence[EventOdds]]) -> list[EventOdds]:
+    index = EventIndex()
+    merged: dict[str, dict[tuple[str, str], MarketOdds]] = {}
+    events: dict[str, Event] = {}
+    for provider_odds in results:
+        added: list[Event] = []
+        for odds in provider_odds:
+            primary = index.match(odds.event)
+            if primary is None:
+                primary = odds.event
+                added.append(primary)
+                events[primary.event_id] = primary
+                merged[primary.event_id] = {}
+            books = merged[primary.event_id]
+            for market in odds.markets:
+                market = _align_outcomes(market, odds.event, primary)
+                key = (market.market, market.book)
+                existing = books.get(key)
+                if existing is None or market.last_update > existing.last_update:
+                    books[key] = market
+        # Events only match across providers, never within one provider's feed.
+        for event in added:
+            index.add(event)
+    return [
+        EventOdds(event=event, markets=tuple(merged[event_id].values()))
+        for event_id, event in events.items()
+    ]
+
+
+def build_odds_provider(config: AppConfig) -> OddsProvider | None:
+    providers: list[OddsProvider] = []
+    key = odds_api_key(config) if config.oddsapi.enabled else None
+    if key:
+        from betboard.providers.oddsapi import OddsApiProvider
+
+        providers.append(OddsApiProvider(key))
+    key = therundown_api_key(config) if config.therundown.enabled else None
+    if key:
+        from betboard.providers.therundown import TheRundownProvider
+
+        providers.append(TheRundownProvider(key, config.therundown.days_ahead))
+    if not providers:
+        return None
+    if len(providers) == 1:
+        return providers[0]
+    return MergedOddsProvider(providers)
+
+
+def odds_provider_name(config: AppConfig) -> str:
+    names = []
+    if config.oddsapi.enabled and odds_api_key(config):
+        names.append("oddsapi")
+    if config.therundown.enabled and therundown_api_key(config):
+        names.append("therundown")
+    return "+".join(names) or "oddsapi"
+
+
+def _align_outcomes(market: MarketOdds, source: Event, target: Event) -> MarketOdds:
+    if source is target:
+        return market
+    names = {_team_key(team): team for team in (target.home_team, target.away_team)}
+    prices = tuple(
+        OddsPrice(
+            outcome=names.get(_team_key(price.outcome), price.outcome), price=price.price
+        )
+        for price in market.prices
+    )
+    point = market.point
+    # Spread points are home lines; a feed with home and away the other way round
+    # quotes the target's away line.
+    flipped = _team_key(source.home_team) != _team_key(target.home_team)
+    if market.market == "spreads" and point is not None and flipped:
+        point = -point
+    return replace(market, prices=prices, point=point)
+
+
+def _matchup_key(event: Event) -> frozenset[str]:
+    return frozenset((_team_key(event.home_team), _team_key(event.away_team)))
+
+
+def _team_key(name: str) -> str:
+    key = " ".join(re.findall(r"[a-z0-9]+", name.lower()))
+    return TEAM_ALIASES.get(key, key)
@@ -3,25 +3,27 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Any
 
-import requests
-
 from betboard.models import Event, EventOdds, MarketOdds, OddsPrice
+from betboard.providers.base import get_odds_each
+from betboard.providers.resilience import ResilientClient
+
+CONNECT_TIMEOUT = 5
 
 
 class OddsApiProvider:
     name = "oddsapi"
 
-    def __init__(self, api_key: str) -> None:
+    def __init__(self, api_key: str, client: ResilientClient | None = None) -> None:
         if not api_key:
             raise ValueError("Missing Odds API key")
         self.api_key = api_key
+        self.client = client or ResilientClient()
         self.base_url = "https://api.the-odds-api.com/v4"
 
     def list_events(self, league_key: str, hours: int) -> list[Event]:
         url = f"{self.base_url}/sports/{league_key}/events"
         params = {"apiKey": self.api_key}
-        response = requests.get(url, params=params, timeout=15)
-        response.raise_for_status()
+        response = self.client.get(url, params=params, timeout=(CONNECT_TIMEOUT, 15))
         data = response.json()
         cutoff = datetime.now(tz=timezone.utc)
         events: list[Event] = []
@@ -47,24 +49,53 @@ class OddsApiProvider:
         markets: list[str],
         regions: str,
         books_filter: list[str] | None,
+        commence_from: datetime | None = None,
+        commence_to: datetime | None = None,
+        event_ids: list[str] | None = None,
     ) -> list[EventOdds]:
-        url = f"{self.base_url}/sports/{league_key}/odds"
+        data = self._fetch_odds(
+            league_key, markets, regions, commence_from, commence_to, event_ids
+        )
+        return [_parse_event_odds(league_key, raw, books_filter) for raw in data]
+
+    def get_odds_bulk(
+        self,
+        league_keys: list[str],
+        markets: list[str],
+        regions: str,
+        books_filter: list[str] | None,
+    ) -> dict[str, list[EventOdds] | Exception]:
+        return get_odds_each(self.get_odds, league_keys, markets, regions, books_filter)
+
+    def _fetch_odds(
+        self,
+        sport: str,
+        markets: list[str],
+        regions: str,
+        commence_from: datetime | None,
+        commence_to: datetime | None,
+        event_ids: list[str] | None,
+    ) -> list[dict[str, Any]]:
+        url = f"{self.base_url}/sports/{sport}/odds"
         params = {
             "apiKey": self.api_key,
             "regions": regions,
             "markets": ",".join(markets),
             "oddsFormat": "american",
         }
-        response = requests.get(url, params=params, timeout=20)
-        response.raise_for_status()
-        data = response.json()
-        return [_parse_event_odds(league_key, raw, books_filter) for raw in data]
+        if commence_from:
+            params["commenceTimeFrom"] = _format_time(commence_from)
+        if commence_to:
+            params["commenceTimeTo"] = _format_time(commence_to)
+        if event_ids:
+            params["eventIds"] = ",".join(event_ids)
+        response = self.client.get(url, params=params, timeout=(CONNECT_TIMEOUT, 20))
+        return response.json()
 
     def list_sports(self) -> list[dict[str, Any]]:
         url = f"{self.base_url}/sports"
         params = {"apiKey": self.api_key}
-        response = requests.get(url, params=params, timeout=15)
-        response.raise_for_status()
+        response = self.client.get(url, params=params, timeout=(CONNECT_TIMEOUT, 15))
         return response.json()
 
 
@@ -97,7 +128,10 @@ def _parse_event_odds(
                 price = outcome.get("price")
                 if price is None:
                     continue
-                if outcome.get("point") is not None:
+                # Keep the home line for spreads, matching TheRundown.
+                if outcome.get("point") is not None and (
+                    point is None or outcome.get("name") == event.home_team
+                ):
                     point = float(outcome.get("point"))
                 prices.append(OddsPrice(outcome=str(outcome.get("name")), price=int(price)))
             markets.append(
@@ -116,3 +150,9 @@ def _parse_time(value: str | None) -> datetime | None:
     if not value:
         return None
     return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _format_time(value: datetime) -> str:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
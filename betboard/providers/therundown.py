@@ -1,18 +1,67 @@
 from __future__ import annotations
 
-from betboard.models import Event, EventOdds
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from betboard.models import Event, EventOdds, MarketOdds, OddsPrice
+from betboard.providers.resilience import ResilientClient
+
+SPORT_IDS = {
+    "americanfootball_ncaaf": 1,
+    "americanfootball_nfl": 2,
+    "baseball_mlb": 3,
+    "basketball_nba": 4,
+    "basketball_ncaab": 5,
+    "icehockey_nhl": 6,
+    "mma_mixed_martial_arts": 7,
+    "ufc": 7,
+    "basketball_wnba": 8,
+}
+
+# TheRundown affiliate names mapped onto The Odds API bookmaker keys so that
+# merged boards and `books.allow` use a single vocabulary.
+BOOK_KEYS = {
+    "betmgm": "betmgm",
+    "betonline": "betonlineag",
+    "betrivers": "betrivers",
+    "bovada": "bovada",
+    "caesars": "williamhill_us",
+    "draftkings": "draftkings",
+    "fanduel": "fanduel",
+    "lowvig": "lowvig",
+    "mybookie": "mybookieag",
+    "pinnacle": "pinnacle",
+    "pointsbet": "pointsbetus",
+    "unibet": "unibet_us",
+    "williamhill": "williamhill_us",
+}
+
+OFF_THE_BOARD = 0.0001
 
 
 class TheRundownProvider:
     name = "therundown"
 
-    def __init__(self, api_key: str) -> None:
+    def __init__(
+        self, api_key: str, days_ahead: int = 7, client: ResilientClient | None = None
+    ) -> None:
         if not api_key:
             raise ValueError("Missing TheRundown API key")
         self.api_key = api_key
+        self.days_ahead = days_ahead
+        self.client = client or ResilientClient()
+        self.base_url = "https://therundown.io/api/v1"
 
     def list_events(self, league_key: str, hours: int) -> list[Event]:
-        raise NotImplementedError("TheRundown provider is not wired in yet")
+        cutoff = datetime.now(tz=timezone.utc) + timedelta(hours=hours)
+        days = max(1, min(self.days_ahead, hours // 24 + 1))
+        return [
+            event
+            for raw in self._fetch_events(league_key, days)
+            if (event := _parse_event(league_key, raw)) and event.start_time <= cutoff
+        ]
 
     def get_odds(
         self,
@@ -21,4 +70,155 @@ class TheRundownProvider:
         regions: str,
         books_filter: list[str] | None,
     ) -> list[EventOdds]:
-        raise NotImplementedError("TheRundown provider is not wired in yet")
+        event_odds: list[EventOdds] = []
+        for raw in self._fetch_events(league_key, self.days_ahead):
+            odds = _parse_event_odds(league_key, raw, markets, books_filter)
+            if odds is not None:
+                event_odds.append(odds)
+        return event_odds
+
+    def _fetch_events(self, league_key: str, days: int) -> list[dict[str, Any]]:
+        sport_id = SPORT_IDS.get(league_key)
+        if sport_id is None:
+            return []
+        today = datetime.now(timezone.utc).date()
+        dates = [
+            (today + timedelta(days=offset)).isoformat() for offset in range(max(1, days))
+        ]
+        with ThreadPoolExecutor(max_workers=min(4, len(dates))) as pool:
+            pages = list(pool.map(lambda date: self._fetch_day(sport_id, date), dates))
+        seen: set[str] = set()
+        events: list[dict[str, Any]] = []
+        for page in pages:
+            for raw in page:
+                event_id = str(raw.get("event_id", ""))
+                if event_id and event_id not in seen:
+                    seen.add(event_id)
+                    events.append(raw)
+        return events
+
+    def _fetch_day(self, sport_id: int, date: str) -> list[dict[str, Any]]:
+        url = f"{self.base_url}/sports/{sport_id}/events/{date}"
+        headers = {"X-TheRundown-Key": self.api_key}
+        response = self.client.get(
+            url, headers=headers, params={"offset": "0"}, timeout=(5, 20)
+        )
+        return response.json().get("events", [])
+
+
+def _parse_event(league_key: str, raw: dict[str, Any]) -> Event | None:
+    home, away = _team_names(raw)
+    start_time = _parse_time(raw.get("event_date"))
+    if not home or not away or start_time is None:
+        return None
+    return Event(
+        event_id=str(raw.get("event_id")),
+        league_key=league_key,
+        sport_title=str(raw.get("sport_title") or ""),
+        home_team=home,
+        away_team=away,
+        start_time=start_time,
+    )
+
+
+def _parse_event_odds(
+    league_key: str,
+    raw: dict[str, Any],
+    markets: list[str],
+    books_filter: list[str] | None,
+) -> EventOdds | None:
+    event = _parse_event(league_key, raw)
+    if event is None:
+        return None
+    parsed: list[MarketOdds] = []
+    for line in (raw.get("lines") or {}).values():
+        affiliate = line.get("affiliate") or {}
+        book = _book_key(str(affiliate.get("affiliate_name") or "unknown"))
+        if books_filter and book not in books_filter:
+            continue
+        for market in markets:
+            market_odds = _parse_market(event, market, book, line)
+            if market_odds is not None:
+                parsed.append(market_odds)
+    return EventOdds(event=event, markets=tuple(parsed))
+
+
+def _parse_market(
+    event: Event, market: str, book: str, line: dict[str, Any]
+) -> MarketOdds | None:
+    if market == "h2h":
+        raw = line.get("moneyline") or {}
+        outcomes = [
+            (event.away_team, raw.get("moneyline_away")),
+            (event.home_team, raw.get("moneyline_home")),
+            ("Draw", raw.get("moneyline_draw")),
+        ]
+        point = None
+    elif market == "spreads":
+        raw = line.get("spread") or {}
+        outcomes = [
+            (event.away_team, raw.get("point_spread_away_money")),
+            (event.home_team, raw.get("point_spread_home_money")),
+        ]
+        point = _line_value(raw.get("point_spread_home"))
+    elif market == "totals":
+        raw = line.get("total") or {}
+        outcomes = [
+            ("Over", raw.get("total_over_money")),
+            ("Under", raw.get("total_under_money")),
+        ]
+        point = _line_value(raw.get("total_over"))
+    else:
+        return None
+
+    prices = tuple(
+        OddsPrice(outcome=outcome, price=int(value))
+        for outcome, raw_value in outcomes
+        if (value := _line_value(raw_value))
+    )
+    if not prices or (market != "h2h" and point is None):
+        return None
+    return MarketOdds(
+        market=market,
+        book=book,
+        last_update=_parse_time(raw.get("date_updated")) or datetime.now(timezone.utc),
+        prices=prices,
+        point=point,
+    )
+
+
+def _team_names(raw: dict[str, Any]) -> tuple[str | None, str | None]:
+    teams = raw.get("teams_normalized") or raw.get("teams") or []
+    home = next((team for team in teams if team.get("is_home")), None)
+    away = next((team for team in teams if team.get("is_away")), None)
+    return _team_name(home), _team_name(away)
+
+
+def _team_name(team: dict[str, Any] | None) -> str | None:
+    if not team:
+        return None
+    name = str(team.get("name") or "").strip()
+    mascot = str(team.get("mascot") or "").strip()
+    if mascot and not name.endswith(mascot):
+        name = f"{name} {mascot}"
+    return name or None
+
+
+def _book_key(affiliate_name: str) -> str:
+    normalized = re.sub(r"[^a-z0-9]", "", affiliate_name.lower())
+    return BOOK_KEYS.get(normalized, normalized)
+
+
+def _line_value(value: Any) -> float | None:
+    if value is None:
+        return None
+    number = float(value)
+    if abs(number) == OFF_THE_BOARD:
+        return None
+    return number
+
+
+def _parse_time(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
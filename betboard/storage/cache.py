@@ -23,10 +23,13 @@ class CacheStore(Generic[T]):
         if not entry:
             return None
         if entry.expires_at < datetime.now(timezone.utc):
-            self._entries.pop(key, None)
             return None
         return entry.value
 
+    def get_stale(self, key: str) -> T | None:
+        entry = self._entries.get(key)
+        return entry.value if entry else None
+
     def set(self, key: str, value: T, ttl_minutes: int) -> None:
         self._entries[key] = CacheEntry(
             value=value,
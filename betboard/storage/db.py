@@ -2,25 +2,92 @@ from __future__ import annotations
 
 import json
 import sqlite3
-from datetime import datetime
+import threading
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
-from betboard.models import MovementEvent, OddsSnapshot, WatchlistItem
+from betboard.models import (
+    Headline,
+    LineAggregate,
+    LinePoint,
+    MovementEvent,
+    OddsSnapshot,
+    WatchlistItem,
+)
 
 
 DEFAULT_DB_PATH = Path.home() / ".betboard" / "betboard.db"
 
+_schema_lock = threading.Lock()
+_ready_paths: set[Path] = set()
+_managers: dict[Path, ConnectionManager] = {}
+
 
 def connect(db_path: Path | None = None) -> sqlite3.Connection:
     path = db_path or DEFAULT_DB_PATH
-    path.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(path)
+    with _schema_lock:
+        if path not in _ready_paths:
+            path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path, cached_statements=256, check_same_thread=False)
     conn.row_factory = sqlite3.Row
-    _ensure_schema(conn)
+    conn.execute("PRAGMA busy_timeout = 5000")
+    with _schema_lock:
+        if path not in _ready_paths:
+            conn.execute("PRAGMA journal_mode = WAL")
+            _ensure_schema(conn)
+            _ready_paths.add(path)
     return conn
 
 
+class ConnectionManager:
+    def __init__(self, db_path: Path | None = None) -> None:
+        self.db_path = db_path or DEFAULT_DB_PATH
+        self._connections: dict[threading.Thread, sqlite3.Connection] = {}
+        self._lock = threading.Lock()
+
+    def connection(self) -> sqlite3.Connection:
+        thread = threading.current_thread()
+        with self._lock:
+            conn = self._connections.get(thread)
+            if conn is not None:
+                return conn
+            # Worker threads come and go; hand a finished thread's connection on
+            # instead of opening a new one per thread.
+            dead = next((t for t in self._connections if not t.is_alive()), None)
+            if dead is not None:
+                conn = self._connections.pop(dead)
+                conn.rollback()
+            else:
+                conn = connect(self.db_path)
+            self._connections[thread] = conn
+            return conn
+
+    def close(self) -> None:
+        with self._lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+        for conn in connections:
+            conn.close()
+
+
+def connection(db_path: Path | None = None) -> sqlite3.Connection:
+    path = db_path or DEFAULT_DB_PATH
+    with _schema_lock:
+        manager = _managers.get(path)
+        if manager is None:
+            manager = _managers[path] = ConnectionManager(path)
+    return manager.connection()
+
+
+def close_all() -> None:
+    with _schema_lock:
+        managers = list(_managers.values())
+        _managers.clear()
+    for manager in managers:
+        manager.close()
+
+
 def _ensure_schema(conn: sqlite3.Connection) -> None:
     conn.executescript(
         """
@@ -40,13 +107,131 @@ def _ensure_schema(conn: sqlite3.Connection) -> None:
         );
 
         CREATE TABLE IF NOT EXISTS movement_events (
+            id INTEGER PRIMARY KEY,
             league_key TEXT NOT NULL,
             event_id TEXT NOT NULL,
             created_at TEXT NOT NULL,
             details_json TEXT NOT NULL
         );
+
+        CREATE INDEX IF NOT EXISTS idx_odds_snapshots_latest
+            ON odds_snapshots (provider, league_key, market, fetched_at);
+
+        CREATE INDEX IF NOT EXISTS idx_odds_snapshots_league
+            ON odds_snapshots (league_key, fetched_at);
+
+        CREATE INDEX IF NOT EXISTS idx_movement_events_league
+            ON movement_events (league_key, created_at);
+
+        CREATE TABLE IF NOT EXISTS data_versions (
+            league_key TEXT PRIMARY KEY,
+            version INTEGER NOT NULL,
+            updated_at TEXT NOT NULL
+        );
+
+        CREATE TABLE IF NOT EXISTS ingesters (
+            name TEXT PRIMARY KEY,
+            heartbeat_at TEXT NOT NULL,
+            expires_at TEXT NOT NULL
+        );
+
+        CREATE TABLE IF NOT EXISTS line_history (
+            event_id TEXT NOT NULL,
+            league_key TEXT NOT NULL,
+            market TEXT NOT NULL,
+            book TEXT NOT NULL,
+            outcome TEXT NOT NULL,
+            price INTEGER NOT NULL,
+            point REAL,
+            observed_at TEXT NOT NULL
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_line_history_event
+            ON line_history (event_id, market, book, outcome, observed_at);
+
+        CREATE TABLE IF NOT EXISTS line_aggregates (
+            event_id TEXT NOT NULL,
+            league_key TEXT NOT NULL,
+            market TEXT NOT NULL,
+            book TEXT NOT NULL,
+            outcome TEXT NOT NULL,
+            start_time TEXT NOT NULL,
+            open_price INTEGER NOT NULL,
+            open_point REAL,
+            current_price INTEGER NOT NULL,
+            current_point REAL,
+            best_price INTEGER NOT NULL,
+            close_price INTEGER,
+            close_point REAL,
+            updated_at TEXT NOT NULL,
+            PRIMARY KEY (event_id, market, book, outcome)
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_line_aggregates_league
+            ON line_aggregates (league_key, event_id);
+
+        CREATE TABLE IF NOT EXISTS flights (
+            key TEXT PRIMARY KEY,
+            owner TEXT NOT NULL,
+            expires_at TEXT NOT NULL,
+            completed_at TEXT,
+            result_json TEXT
+        );
+
+        CREATE TABLE IF NOT EXISTS sports_catalog (
+            key TEXT PRIMARY KEY,
+            sport_group TEXT NOT NULL,
+            title TEXT NOT NULL,
+            active INTEGER NOT NULL,
+            fetched_at TEXT NOT NULL
+        );
+
+        CREATE TABLE IF NOT EXISTS headlines (
+            id INTEGER PRIMARY KEY,
+            key TEXT NOT NULL,
+            league_key TEXT NOT NULL,
+            title TEXT NOT NULL,
+            url TEXT NOT NULL,
+            published_at TEXT,
+            source TEXT NOT NULL,
+            first_seen_at TEXT NOT NULL,
+            UNIQUE (league_key, key)
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_headlines_recent
+            ON headlines (league_key, published_at);
+
+        CREATE TABLE IF NOT EXISTS headline_links (
+            league_key TEXT NOT NULL,
+            headline_key TEXT NOT NULL,
+            event_id TEXT NOT NULL,
+            PRIMARY KEY (league_key, event_id, headline_key)
+        );
         """
     )
+    try:
+        created = not _has_headline_index(conn)
+        conn.executescript(
+            """
+            CREATE VIRTUAL TABLE IF NOT EXISTS headlines_fts USING fts5(
+                title, content='headlines', content_rowid='id'
+            );
+
+            CREATE TRIGGER IF NOT EXISTS headlines_fts_insert AFTER INSERT ON headlines
+            BEGIN
+                INSERT INTO headlines_fts (rowid, title) VALUES (new.id, new.title);
+            END;
+            """
+        )
+        if created:
+            # Index headlines stored while this SQLite lacked FTS5.
+            with conn:
+                conn.execute(
+                    "INSERT INTO headlines_fts (headlines_fts) VALUES ('rebuild')"
+                )
+    except sqlite3.OperationalError:
+        # SQLite built without FTS5; search_headlines falls back to LIKE.
+        pass
 
 
 def upsert_watchlist(conn: sqlite3.Connection, item: WatchlistItem) -> None:
@@ -113,13 +298,86 @@ def latest_snapshot(
     ).fetchone()
     if not row:
         return None
-    return OddsSnapshot(
-        provider=row["provider"],
-        league_key=row["league_key"],
-        market=row["market"],
-        fetched_at=datetime.fromisoformat(row["fetched_at"]),
-        payload=json.loads(row["payload_json"]),
-    )
+    return _snapshot_from_row(row)
+
+
+def snapshot_leagues(conn: sqlite3.Connection) -> list[str]:
+    rows = conn.execute("SELECT DISTINCT league_key FROM odds_snapshots ORDER BY league_key")
+    return [row["league_key"] for row in rows]
+
+
+def iter_snapshots(
+    conn: sqlite3.Connection,
+    league_key: str,
+    since: datetime | None = None,
+    until: datetime | None = None,
+) -> Iterator[OddsSnapshot]:
+    query = "SELECT * FROM odds_snapshots WHERE league_key = ?"
+    params: list[Any] = [league_key]
+    if since is not None:
+        query += " AND fetched_at >= ?"
+        params.append(_utc_naive(since).isoformat())
+    if until is not None:
+        query += " AND fetched_at < ?"
+        params.append(_utc_naive(until).isoformat())
+    query += " ORDER BY fetched_at, rowid"
+    for row in conn.execute(query, params):
+        yield _snapshot_from_row(row)
+
+
+def snapshot_times(
+    conn: sqlite3.Connection,
+    league_key: str,
+    since: datetime | None = None,
+    until: datetime | None = None,
+) -> list[datetime]:
+    query = "SELECT DISTINCT fetched_at FROM odds_snapshots WHERE league_key = ?"
+    params: list[Any] = [league_key]
+    if since is not None:
+        query += " AND fetched_at >= ?"
+        params.append(_utc_naive(since).isoformat())
+    if until is not None:
+        query += " AND fetched_at < ?"
+        params.append(_utc_naive(until).isoformat())
+    query += " ORDER BY fetched_at"
+    rows = conn.execute(query, params)
+    return [datetime.fromisoformat(row["fetched_at"]) for row in rows]
+
+
+def snapshots_before(
+    conn: sqlite3.Connection,
+    league_key: str,
+    before: datetime,
+    since: datetime | None = None,
+) -> list[OddsSnapshot]:
+    # The latest snapshot per (provider, market) stream ahead of `before`.
+    query = """
+        SELECT * FROM odds_snapshots
+        WHERE rowid IN (
+            SELECT (
+                SELECT rowid FROM odds_snapshots AS latest
+                WHERE latest.provider = streams.provider
+                    AND latest.league_key = streams.league_key
+                    AND latest.market = streams.market
+                    AND latest.fetched_at < ?
+                    {floor}
+                ORDER BY latest.fetched_at DESC, latest.rowid DESC
+                LIMIT 1
+            )
+            FROM (
+                SELECT DISTINCT provider, league_key, market FROM odds_snapshots
+                WHERE league_key = ?
+            ) AS streams
+        )
+    """
+    params: list[Any] = [_utc_naive(before).isoformat()]
+    floor = ""
+    if since is not None:
+        floor = "AND latest.fetched_at >= ?"
+        params.append(_utc_naive(since).isoformat())
+    params.append(league_key)
+    rows = conn.execute(query.format(floor=floor), params)
+    return [_snapshot_from_row(row) for row in rows]
 
 
 def add_movement(conn: sqlite3.Connection, movement: MovementEvent) -> None:
@@ -148,22 +406,378 @@ def list_movements(conn: sqlite3.Connection, league_key: str) -> list[MovementEv
         """,
         (league_key,),
     ).fetchall()
+    return [_movement_from_row(row) for row in rows]
+
+
+def record_movement_events(
+    conn: sqlite3.Connection, movements: list[MovementEvent]
+) -> list[int]:
+    ids: list[int] = []
+    with conn:
+        for movement in movements:
+            cursor = conn.execute(
+                """
+                INSERT INTO movement_events (league_key, event_id, created_at, details_json)
+                VALUES (?, ?, ?, ?)
+                """,
+                (
+                    movement.league_key,
+                    movement.event_id,
+                    movement.created_at.isoformat(),
+                    json.dumps(movement.details),
+                ),
+            )
+            ids.append(int(cursor.lastrowid or 0))
+    return ids
+
+
+def movements_since(
+    conn: sqlite3.Connection,
+    after_id: int,
+    league_keys: list[str] | None = None,
+    limit: int = 500,
+) -> list[tuple[int, MovementEvent]]:
+    query = "SELECT * FROM movement_events WHERE id > ?"
+    params: list[Any] = [after_id]
+    if league_keys:
+        query += f" AND league_key IN ({', '.join('?' for _ in league_keys)})"
+        params.extend(league_keys)
+    query += " ORDER BY id LIMIT ?"
+    params.append(limit)
+    rows = conn.execute(query, params).fetchall()
+    return [(int(row["id"]), _movement_from_row(row)) for row in rows]
+
+
+def latest_movement_id(conn: sqlite3.Connection) -> int:
+    row = conn.execute("SELECT MAX(id) AS id FROM movement_events").fetchone()
+    return int(row["id"] or 0)
+
+
+def _snapshot_from_row(row: sqlite3.Row) -> OddsSnapshot:
+    return OddsSnapshot(
+        provider=row["provider"],
+        league_key=row["league_key"],
+        market=row["market"],
+        fetched_at=datetime.fromisoformat(row["fetched_at"]),
+        payload=json.loads(row["payload_json"]),
+    )
+
+
+def _movement_from_row(row: sqlite3.Row) -> MovementEvent:
+    return MovementEvent(
+        league_key=row["league_key"],
+        event_id=row["event_id"],
+        created_at=datetime.fromisoformat(row["created_at"]),
+        details=json.loads(row["details_json"]),
+    )
+
+
+def record_line_history(
+    conn: sqlite3.Connection, league_key: str, points: list[tuple[str, LinePoint]]
+) -> None:
+    with conn:
+        conn.executemany(
+            """
+            INSERT INTO line_history
+                (event_id, league_key, market, book, outcome, price, point, observed_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    event_id,
+                    league_key,
+                    point.market,
+                    point.book,
+                    point.outcome,
+                    point.price,
+                    point.point,
+                    point.observed_at.isoformat(),
+                )
+                for event_id, point in points
+            ],
+        )
+
+
+def update_line_aggregates(
+    conn: sqlite3.Connection,
+    league_key: str,
+    points: list[tuple[str, LinePoint]],
+    start_times: dict[str, datetime],
+) -> None:
+    rows = []
+    for event_id, point in points:
+        start_time = start_times.get(event_id)
+        if start_time is None:
+            continue
+        rows.append(
+            (
+                event_id,
+                league_key,
+                point.market,
+                point.book,
+                point.outcome,
+                _utc_naive(start_time).isoformat(),
+                point.price,
+                point.point,
+                _utc_naive(point.observed_at).isoformat(),
+            )
+        )
+    # The closing line is the last price seen before the start; SET expressions
+    # read the old row, so best/close compare against the previous values.
+    with conn:
+        conn.executemany(
+            """
+            INSERT INTO line_aggregates (
+                event_id, league_key, market, book, outcome, start_time,
+                open_price, open_point, current_price, current_point, best_price,
+                close_price, close_point, updated_at
+            )
+            VALUES (
+                ?1, ?2, ?3, ?4, ?5, ?6, ?7, ?8, ?7, ?8, ?7,
+                CASE WHEN ?9 <= ?6 THEN ?7 END,
+                CASE WHEN ?9 <= ?6 THEN ?8 END,
+                ?9
+            )
+            ON CONFLICT(event_id, market, book, outcome) DO UPDATE SET
+                start_time=excluded.start_time,
+                current_price=excluded.current_price,
+                current_point=excluded.current_point,
+                best_price=MAX(best_price, excluded.current_price),
+                close_price=CASE WHEN excluded.updated_at <= excluded.start_time
+                    THEN excluded.current_price ELSE close_price END,
+                close_point=CASE WHEN excluded.updated_at <= excluded.start_time
+                    THEN excluded.current_point ELSE close_point END,
+                updated_at=excluded.updated_at
+            """,
+            rows,
+        )
+
+
+def line_aggregates(
+    conn: sqlite3.Connection,
+    league_key: str | None = None,
+    event_id: str | None = None,
+) -> list[LineAggregate]:
+    query = "SELECT * FROM line_aggregates WHERE 1 = 1"
+    params: list[Any] = []
+    if league_key is not None:
+        query += " AND league_key = ?"
+        params.append(league_key)
+    if event_id is not None:
+        query += " AND event_id = ?"
+        params.append(event_id)
+    rows = conn.execute(query, params).fetchall()
     return [
-        MovementEvent(
-            league_key=row["league_key"],
+        LineAggregate(
             event_id=row["event_id"],
-            created_at=datetime.fromisoformat(row["created_at"]),
-            details=json.loads(row["details_json"]),
+            league_key=row["league_key"],
+            market=row["market"],
+            book=row["book"],
+            outcome=row["outcome"],
+            open_price=int(row["open_price"]),
+            open_point=row["open_point"],
+            current_price=int(row["current_price"]),
+            current_point=row["current_point"],
+            best_price=int(row["best_price"]),
+            close_price=row["close_price"],
+            close_point=row["close_point"],
+            updated_at=datetime.fromisoformat(row["updated_at"]),
         )
         for row in rows
     ]
 
 
-def record_movement_events(
-    conn: sqlite3.Connection, movements: list[MovementEvent]
+def _utc_naive(moment: datetime) -> datetime:
+    if moment.tzinfo is None:
+        return moment
+    return moment.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def price_history(
+    conn: sqlite3.Connection,
+    event_id: str,
+    market: str | None = None,
+    book: str | None = None,
+    outcome: str | None = None,
+    since: datetime | None = None,
+) -> list[LinePoint]:
+    query = "SELECT * FROM line_history WHERE event_id = ?"
+    params: list[Any] = [event_id]
+    for column, value in (("market", market), ("book", book), ("outcome", outcome)):
+        if value is not None:
+            query += f" AND {column} = ?"
+            params.append(value)
+    if since is not None:
+        query += " AND observed_at >= ?"
+        params.append(since.isoformat())
+    query += " ORDER BY market, book, outcome, observed_at"
+    rows = conn.execute(query, params).fetchall()
+    return [
+        LinePoint(
+            observed_at=datetime.fromisoformat(row["observed_at"]),
+            market=row["market"],
+            book=row["book"],
+            outcome=row["outcome"],
+            price=int(row["price"]),
+            point=row["point"],
+        )
+        for row in rows
+    ]
+
+
+def store_headlines(
+    conn: sqlite3.Connection, league_key: str, headlines: list[Headline]
+) -> int:
+    seen_at = datetime.utcnow().isoformat()
+    with conn:
+        cursor = conn.executemany(
+            """
+            INSERT OR IGNORE INTO headlines (
+                key, league_key, title, url, published_at, source, first_seen_at
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    headline.guid or headline.url,
+                    league_key,
+                    headline.title,
+                    headline.url,
+                    _utc_naive(headline.published_at).isoformat()
+                    if headline.published_at
+                    else None,
+                    headline.source,
+                    seen_at,
+                )
+                for headline in headlines
+                if headline.guid or headline.url
+            ],
+        )
+    return cursor.rowcount
+
+
+def recent_headlines(
+    conn: sqlite3.Connection, league_key: str, limit: int
+) -> list[Headline]:
+    rows = conn.execute(
+        """
+        SELECT * FROM headlines WHERE league_key = ?
+        ORDER BY published_at IS NULL, published_at DESC, first_seen_at DESC
+        LIMIT ?
+        """,
+        (league_key, limit),
+    ).fetchall()
+    return [_headline_from_row(row) for row in rows]
+
+
+def search_headlines(
+    conn: sqlite3.Connection,
+    query: str,
+    league_key: str | None = None,
+    limit: int = 20,
+) -> list[Headline]:
+    terms = query.split()
+    if not terms:
+        return []
+    if _has_headline_index(conn):
+        sql = """
+            SELECT headlines.* FROM headlines_fts
+            JOIN headlines ON headlines.id = headlines_fts.rowid
+            WHERE headlines_fts MATCH ?
+        """
+        params: list[Any] = [" ".join(_fts_phrase(term) for term in terms)]
+        order = "bm25(headlines_fts), headlines.published_at DESC"
+    else:
+        sql = "SELECT headlines.* FROM headlines WHERE 1 = 1"
+        sql += " AND title LIKE ?" * len(terms)
+        params = [f"%{term}%" for term in terms]
+        order = "headlines.published_at DESC"
+    if league_key is not None:
+        sql += " AND headlines.league_key = ?"
+        params.append(league_key)
+    # The same story can be stored under several leagues; keep its best match.
+    found: dict[str, Headline] = {}
+    for row in conn.execute(f"{sql} ORDER BY {order}", params):
+        found.setdefault(row["key"], _headline_from_row(row))
+        if len(found) >= limit:
+            break
+    return list(found.values())
+
+
+def store_headline_links(
+    conn: sqlite3.Connection, league_key: str, linked: dict[str, list[Headline]]
 ) -> None:
-    for movement in movements:
-        add_movement(conn, movement)
+    with conn:
+        conn.executemany(
+            """
+            INSERT OR IGNORE INTO headline_links (league_key, headline_key, event_id)
+            VALUES (?, ?, ?)
+            """,
+            [
+                (league_key, headline.guid or headline.url, event_id)
+                for event_id, headlines in linked.items()
+                for headline in headlines
+            ],
+        )
+
+
+def prune_headline_links(
+    conn: sqlite3.Connection, league_key: str, event_ids: list[str]
+) -> None:
+    placeholders = ",".join("?" * len(event_ids))
+    with conn:
+        conn.execute(
+            f"""
+            DELETE FROM headline_links
+            WHERE league_key = ? AND event_id NOT IN ({placeholders})
+            """,
+            [league_key, *event_ids],
+        )
+
+
+def linked_headlines(
+    conn: sqlite3.Connection, league_key: str, per_event: int = 5
+) -> dict[str, list[Headline]]:
+    rows = conn.execute(
+        """
+        SELECT headline_links.event_id, headlines.* FROM headline_links
+        JOIN headlines ON headlines.league_key = headline_links.league_key
+            AND headlines.key = headline_links.headline_key
+        WHERE headline_links.league_key = ?
+        ORDER BY headlines.published_at IS NULL, headlines.published_at DESC
+        """,
+        (league_key,),
+    )
+    linked: dict[str, list[Headline]] = {}
+    for row in rows:
+        headlines = linked.setdefault(row["event_id"], [])
+        if len(headlines) < per_event:
+            headlines.append(_headline_from_row(row))
+    return linked
+
+
+def _fts_phrase(term: str) -> str:
+    return '"' + term.replace('"', '""') + '"'
+
+
+def _has_headline_index(conn: sqlite3.Connection) -> bool:
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = 'headlines_fts'"
+    ).fetchone()
+    return row is not None
+
+
+def _headline_from_row(row: sqlite3.Row) -> Headline:
+    published_at = row["published_at"]
+    return Headline(
+        title=row["title"],
+        url=row["url"],
+        published_at=datetime.fromisoformat(published_at).replace(tzinfo=timezone.utc)
+        if published_at
+        else None,
+        source=row["source"],
+        guid=row["key"] if row["key"] != row["url"] else "",
+    )
 
 
 def get_event_snapshot_payload(
@@ -173,3 +787,162 @@ def get_event_snapshot_payload(
     if not snapshot:
         return None
     return snapshot.payload
+
+
+def replace_sports_catalog(
+    conn: sqlite3.Connection, sports: list[dict[str, Any]], fetched_at: datetime
+) -> None:
+    with conn:
+        conn.execute("DELETE FROM sports_catalog")
+        conn.executemany(
+            """
+            INSERT INTO sports_catalog (key, sport_group, title, active, fetched_at)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    str(sport.get("key", "")),
+                    str(sport.get("group", "")),
+                    str(sport.get("title", "")),
+                    int(bool(sport.get("active", False))),
+                    fetched_at.isoformat(),
+                )
+                for sport in sports
+                if sport.get("key")
+            ],
+        )
+
+
+def list_sports_catalog(
+    conn: sqlite3.Connection,
+) -> tuple[list[dict[str, Any]], datetime | None]:
+    rows = conn.execute("SELECT * FROM sports_catalog ORDER BY key").fetchall()
+    if not rows:
+        return [], None
+    sports = [
+        {
+            "key": row["key"],
+            "group": row["sport_group"],
+            "title": row["title"],
+            "active": bool(row["active"]),
+        }
+        for row in rows
+    ]
+    return sports, datetime.fromisoformat(rows[0]["fetched_at"])
+
+
+def bump_data_version(conn: sqlite3.Connection, league_key: str) -> int:
+    with conn:
+        conn.execute(
+            """
+            INSERT INTO data_versions (league_key, version, updated_at)
+            VALUES (?, 1, ?)
+            ON CONFLICT(league_key) DO UPDATE SET
+                version=version + 1,
+                updated_at=excluded.updated_at
+            """,
+            (league_key, datetime.now(timezone.utc).isoformat()),
+        )
+        row = conn.execute(
+            "SELECT version FROM data_versions WHERE league_key = ?", (league_key,)
+        ).fetchone()
+    return int(row["version"])
+
+
+def data_versions(conn: sqlite3.Connection) -> dict[str, int]:
+    rows = conn.execute("SELECT league_key, version FROM data_versions").fetchall()
+    return {row["league_key"]: int(row["version"]) for row in rows}
+
+
+def heartbeat_ingester(
+    conn: sqlite3.Connection, name: str, ttl_seconds: int
+) -> None:
+    now = datetime.now(timezone.utc)
+    conn.execute(
+        """
+        INSERT INTO ingesters (name, heartbeat_at, expires_at)
+        VALUES (?, ?, ?)
+        ON CONFLICT(name) DO UPDATE SET
+            heartbeat_at=excluded.heartbeat_at,
+            expires_at=excluded.expires_at
+        """,
+        (name, now.isoformat(), (now + timedelta(seconds=ttl_seconds)).isoformat()),
+    )
+    conn.commit()
+
+
+def clear_ingester(conn: sqlite3.Connection, name: str) -> None:
+    conn.execute("DELETE FROM ingesters WHERE name = ?", (name,))
+    conn.commit()
+
+
+def active_ingester(conn: sqlite3.Connection) -> str | None:
+    row = conn.execute(
+        """
+        SELECT name FROM ingesters
+        WHERE expires_at > ?
+        ORDER BY heartbeat_at DESC
+        LIMIT 1
+        """,
+        (datetime.now(timezone.utc).isoformat(),),
+    ).fetchone()
+    return row["name"] if row else None
+
+
+def acquire_flight(
+    conn: sqlite3.Connection, key: str, owner: str, lease_seconds: float
+) -> bool:
+    now = datetime.now(timezone.utc)
+    with conn:
+        cursor = conn.execute(
+            """
+            INSERT INTO flights (key, owner, expires_at, completed_at, result_json)
+            VALUES (?, ?, ?, NULL, NULL)
+            ON CONFLICT(key) DO UPDATE SET
+                owner=excluded.owner,
+                expires_at=excluded.expires_at,
+                completed_at=NULL,
+                result_json=NULL
+            WHERE flights.completed_at IS NOT NULL OR flights.expires_at <= ?
+            """,
+            (
+                key,
+                owner,
+                (now + timedelta(seconds=lease_seconds)).isoformat(),
+                now.isoformat(),
+            ),
+        )
+    return cursor.rowcount == 1
+
+
+def complete_flight(
+    conn: sqlite3.Connection, key: str, owner: str, result: Any
+) -> None:
+    conn.execute(
+        """
+        UPDATE flights SET completed_at = ?, result_json = ?
+        WHERE key = ? AND owner = ?
+        """,
+        (datetime.now(timezone.utc).isoformat(), json.dumps(result), key, owner),
+    )
+    conn.commit()
+
+
+def release_flight(conn: sqlite3.Connection, key: str, owner: str) -> None:
+    conn.execute("DELETE FROM flights WHERE key = ? AND owner = ?", (key, owner))
+    conn.commit()
+
+
+def flight_state(
+    conn: sqlite3.Connection, key: str
+) -> tuple[str, bool, Any] | None:
+    row = conn.execute(
+        "SELECT owner, expires_at, completed_at, result_json FROM flights WHERE key = ?",
+        (key,),
+    ).fetchone()
+    if not row:
+        return None
+    if row["completed_at"] is not None:
+        return row["owner"], True, json.loads(row["result_json"])
+    expired = row["expires_at"] <= datetime.now(timezone.utc).isoformat()
+    return (row["owner"], False, None) if not expired else None
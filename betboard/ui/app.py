@@ -1,26 +1,49 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import sqlite3
+from datetime import datetime
+from functools import partial
 from typing import Any
 
 from textual.app import App, ComposeResult
-from textual.containers import Horizontal
+from textual.containers import Horizontal, Vertical
 from textual.widgets import (
+    DataTable,
     Footer,
     Header,
-    ListItem,
-    ListView,
+    Input,
     Static,
     TabbedContent,
     TabPane,
 )
+from textual.worker import get_current_worker
 
-from betboard.config import AppConfig, ensure_ufc_key, load_config, odds_api_key
-from betboard.core.data import LeagueData, fetch_league_data
-from betboard.models import EventOdds
-from betboard.providers.oddsapi import OddsApiProvider
+from betboard.config import AppConfig, load_config
+from betboard.core.data import (
+    LeagueData,
+    fetch_league_data,
+    load_stored_league_data,
+    reload_league_data,
+)
+from betboard.core.history import price_trends
+from betboard.core.leagues import LeagueCatalog
+from betboard.core.singleflight import CoalescingOddsProvider
+from betboard.models import Event
+from betboard.providers.base import OddsProvider
+from betboard.providers.merged import build_odds_provider, odds_provider_name
+from betboard.storage import db
 from betboard.storage.cache import CacheStore
-from betboard.ui.formatting import format_event, format_odds, format_side_panel
+from betboard.ui.boards import BoardCache, LineContext
+from betboard.ui.formatting import (
+    format_age,
+    format_matchup,
+    format_side_panel,
+    format_start,
+)
+from betboard.ui.rows import Row, SortCell, compile_filter, diff_rows
+
+
+SORT_ORDERS = (("start", False), ("start", True), ("matchup", False))
 
 
 class BetBoardApp(App):
@@ -30,15 +53,29 @@ class BetBoardApp(App):
         ("2", "switch_tab('CFB')", "CFB"),
         ("3", "switch_tab('UFC')", "UFC"),
         ("r", "refresh", "Refresh"),
+        ("s", "cycle_sort", "Sort"),
+        ("/", "focus_filter", "Filter"),
     ]
 
     def __init__(self) -> None:
         super().__init__()
         self._config: AppConfig | None = None
-        self._provider: OddsApiProvider | None = None
+        self._provider: OddsProvider | None = None
+        self._provider_name = "oddsapi"
+        self._league_keys: dict[str, str] | None = None
+        self._watch_conn: sqlite3.Connection | None = None
+        self._ingester: str | None = None
+        self._seen_versions: dict[str, int] | None = None
         self._cache: CacheStore[Any] = CacheStore()
         self._league_data: dict[str, LeagueData] = {}
-        self._event_odds: dict[str, list[EventOdds]] = {}
+        self._boards = BoardCache(_line_context)
+        self._generations: dict[str, int] = {}
+        self._loaded_tabs: set[str] = set()
+        self._in_flight: set[str] = set()
+        self._rows: dict[str, list[Row]] = {}
+        self._filters: dict[str, str] = {}
+        self._updated_at: dict[str, str] = {}
+        self._sort_orders: dict[str, tuple[str, bool]] = {}
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -52,7 +89,16 @@ class BetBoardApp(App):
     def on_mount(self) -> None:
         self._populate_tabs()
         self._load_config()
+        self._watch_conn = db.connection()
+        self._ingester = db.active_ingester(self._watch_conn)
+        self.set_interval(1.0, self._poll_data_versions)
+        if self._config:
+            self.run_worker(
+                self._warm_start, name="warm-start", group="warm-start", thread=True
+            )
         self.call_after_refresh(self._refresh_all, False)
+        if self._config and self._config.refresh_ui_seconds > 0:
+            self.set_interval(self._config.refresh_ui_seconds, self._auto_refresh)
 
     def _populate_tabs(self) -> None:
         for tab_id, title in (
@@ -70,115 +116,377 @@ class BetBoardApp(App):
     def action_refresh(self) -> None:
         self._refresh_all(force=True)
 
+    def action_cycle_sort(self) -> None:
+        tab_id = self.query_one(TabbedContent).active
+        order = self._sort_orders.get(tab_id, SORT_ORDERS[0])
+        self._sort_orders[tab_id] = SORT_ORDERS[
+            (SORT_ORDERS.index(order) + 1) % len(SORT_ORDERS)
+        ]
+        self._sort_table(tab_id)
+
+    def action_focus_filter(self) -> None:
+        tab_id = self.query_one(TabbedContent).active
+        self.query_one(f"#filter-{tab_id}", Input).focus()
+
     def _load_config(self) -> None:
         try:
             self._config = load_config()
         except FileNotFoundError:
             self._config = None
             return
-        key = odds_api_key(self._config)
-        if not key:
-            self._provider = None
-            return
-        self._provider = OddsApiProvider(key)
-        self._config = ensure_ufc_key(self._config, self._provider)
+        provider = build_odds_provider(self._config)
+        self._provider = CoalescingOddsProvider(provider) if provider else None
+        self._provider_name = odds_provider_name(self._config)
 
     def _refresh_all(self, force: bool) -> None:
-        if not self._config or not self._provider:
+        if not self._config or not (self._provider or self._ingester):
             self._set_status(
                 "Missing config or ODDS_API_KEY. Check ~/.betboard/config.toml."
             )
             return
-        for tab_id, league_key in _league_map(self._config).items():
+        if self._league_keys is None:
+            self.run_worker(
+                partial(self._resolve_league_keys, force),
+                name="league-keys",
+                group="league-keys",
+                exclusive=True,
+                thread=True,
+            )
+            return
+        for tab_id, league_key in self._league_keys.items():
             self._refresh_league(tab_id, league_key, force)
 
-    def _refresh_league(self, tab_id: str, league_key: str, force: bool) -> None:
+    def _warm_start(self) -> None:
         assert self._config is not None
-        assert self._provider is not None
-        try:
-            league_data = fetch_league_data(
-                self._config, self._provider, league_key, self._cache, force=force
+        conn = db.connection()
+        catalog = LeagueCatalog(conn, None, self._config.caching.sports_ttl_minutes)
+        for tab_id, league_key in _league_map(self._config, catalog).items():
+            league_data = load_stored_league_data(
+                conn, self._provider_name, league_key, self._config.oddsapi.markets
             )
+            if league_data is not None:
+                self.call_from_thread(
+                    self._apply_stored_data, tab_id, league_key, league_data
+                )
+
+    def _apply_stored_data(
+        self, tab_id: str, league_key: str, league_data: LeagueData
+    ) -> None:
+        if tab_id in self._loaded_tabs or league_data.stored_at is None:
+            return
+        self._league_data[league_key] = league_data
+        self._boards.update(league_key, league_data.event_odds)
+        self._loaded_tabs.add(tab_id)
+        self._updated_at[tab_id] = (
+            f"Stored snapshot, {format_age(league_data.stored_at)} old"
+        )
+        self._update_tab(tab_id, league_key, league_data)
+
+    def _auto_refresh(self) -> None:
+        if not self._config or not self._provider or self._league_keys is None:
+            return
+        if self._ingester:
+            return
+        for tab_id, league_key in self._league_keys.items():
+            if tab_id not in self._in_flight:
+                self._refresh_league(tab_id, league_key, force=False)
+
+    def _poll_data_versions(self) -> None:
+        if self._watch_conn is None:
+            return
+        self._ingester = db.active_ingester(self._watch_conn)
+        versions = db.data_versions(self._watch_conn)
+        previous, self._seen_versions = self._seen_versions, versions
+        if previous is None or self._league_keys is None:
+            return
+        for tab_id, league_key in self._league_keys.items():
+            if versions.get(league_key) != previous.get(league_key):
+                self._refresh_league(tab_id, league_key, force=False, from_store=True)
+
+    def _resolve_league_keys(self, force: bool) -> None:
+        assert self._config is not None
+        source = self._provider if hasattr(self._provider, "list_sports") else None
+        catalog = LeagueCatalog(
+            db.connection(), source, self._config.caching.sports_ttl_minutes
+        )
+        league_keys = _league_map(self._config, catalog)
+        if not get_current_worker().is_cancelled:
+            self.call_from_thread(self._apply_league_keys, league_keys, force)
+
+    def _apply_league_keys(self, league_keys: dict[str, str], force: bool) -> None:
+        self._league_keys = league_keys
+        self._refresh_all(force)
+
+    def _refresh_league(
+        self, tab_id: str, league_key: str, force: bool, from_store: bool = False
+    ) -> None:
+        generation = self._generations.get(tab_id, 0) + 1
+        self._generations[tab_id] = generation
+        self._in_flight.add(tab_id)
+        self._set_tab_state(
+            tab_id,
+            " · ".join(
+                note for note in (self._updated_at.get(tab_id), "refreshing…") if note
+            ),
+            loading=True,
+        )
+        self.run_worker(
+            partial(
+                self._fetch_league,
+                tab_id,
+                league_key,
+                force,
+                from_store or self._ingester is not None,
+                generation,
+            ),
+            name=f"refresh-{tab_id}",
+            group=f"refresh-{tab_id}",
+            exclusive=True,
+            thread=True,
+        )
+
+    def _fetch_league(
+        self,
+        tab_id: str,
+        league_key: str,
+        force: bool,
+        from_store: bool,
+        generation: int,
+    ) -> None:
+        assert self._config is not None
+        worker = get_current_worker()
+        try:
+            if from_store or self._provider is None:
+                league_data = reload_league_data(
+                    self._config, self._provider_name, league_key, self._cache, force
+                )
+            else:
+                league_data = fetch_league_data(
+                    self._config, self._provider, league_key, self._cache, force=force
+                )
         except Exception as exc:
-            self._render_error(tab_id, f"Fetch error: {exc}")
-            self._set_status(f"{league_key}: fetch error")
+            if not worker.is_cancelled:
+                self.call_from_thread(
+                    self._apply_fetch_error, tab_id, league_key, generation, exc
+                )
             return
+        if not worker.is_cancelled:
+            self.call_from_thread(
+                self._apply_league_data, tab_id, league_key, generation, league_data
+            )
+
+    def _apply_league_data(
+        self, tab_id: str, league_key: str, generation: int, league_data: LeagueData
+    ) -> None:
+        if self._generations.get(tab_id) != generation:
+            return
+        self._in_flight.discard(tab_id)
         self._league_data[league_key] = league_data
-        self._event_odds[league_key] = list(league_data.event_odds)
+        changed = self._boards.update(league_key, league_data.event_odds)
+        self._loaded_tabs.add(tab_id)
+        if league_data.stored_at is not None:
+            self._updated_at[tab_id] = (
+                f"Ingested {format_age(league_data.stored_at)} ago"
+            )
+        else:
+            self._updated_at[tab_id] = f"Updated {datetime.now().strftime('%H:%M:%S')}"
         self._update_tab(tab_id, league_key, league_data)
         self._set_status(
             f"{league_key}: {len(league_data.event_odds)} events, {len(league_data.headlines)} headlines"
         )
+        if changed:
+            self.run_worker(
+                partial(self._boards.precompute, changed),
+                name=f"boards-{tab_id}",
+                group=f"boards-{tab_id}",
+                exclusive=True,
+                thread=True,
+            )
+
+    def _apply_fetch_error(
+        self, tab_id: str, league_key: str, generation: int, exc: Exception
+    ) -> None:
+        if self._generations.get(tab_id) != generation:
+            return
+        self._in_flight.discard(tab_id)
+        if tab_id in self._loaded_tabs:
+            self._set_tab_state(tab_id, f"Fetch error, showing previous data: {exc}")
+        else:
+            self._render_error(tab_id, f"Fetch error: {exc}")
+            self._set_tab_state(tab_id, "Fetch error")
+        self._set_status(f"{league_key}: fetch error")
+
+    def _set_tab_state(self, tab_id: str, message: str, loading: bool = False) -> None:
+        self.query_one(f"#state-{tab_id}", Static).update(message)
+        self.query_one(f"#events-{tab_id}", DataTable).loading = (
+            loading and tab_id not in self._loaded_tabs
+        )
 
     def _update_tab(self, tab_id: str, league_key: str, league_data: LeagueData) -> None:
-        list_view = self.query_one(f"#events-{tab_id}", ListView)
-        list_view.clear()
-        list_view.data = {"tab_id": tab_id}
-        for odds in league_data.event_odds:
-            list_view.append(ListItem(Static(format_event(odds.event))))
+        table = self.query_one(f"#events-{tab_id}", DataTable)
+        selected = self._selected_key(tab_id)
+        matches = compile_filter(self._filters.get(tab_id, ""))
+        cells = {
+            odds.event.event_id: _event_cells(odds.event)
+            for odds in league_data.event_odds
+            if matches(odds.event)
+        }
+        column, reverse = self._sort_orders.get(tab_id, SORT_ORDERS[0])
+        position = 0 if column == "start" else 1
+        ordered = sorted(cells, key=lambda key: cells[key][position], reverse=reverse)
+        target = [(key, tuple(cell.text for cell in cells[key])) for key in ordered]
+
+        diff = diff_rows(self._rows.get(tab_id, []), target)
+        for key in diff.removed:
+            table.remove_row(key)
+        for _, key in diff.inserted:
+            table.add_row(*cells[key], key=key)
+        for key in diff.changed:
+            start, matchup = cells[key]
+            table.update_cell(key, "start", start)
+            table.update_cell(key, "matchup", matchup)
+        if diff.inserted or diff.changed:
+            self._sort_table(tab_id, selected)
+        elif selected in cells:
+            table.move_cursor(row=table.get_row_index(selected))
+        self._rows[tab_id] = target
+
+        notes = [
+            self._updated_at.get(tab_id, ""),
+            f"{len(cells)} events",
+            "refreshing…" if tab_id in self._in_flight else "",
+        ]
         if not league_data.event_odds:
-            list_view.append(ListItem(Static("No events returned.")))
-        self._update_side_panels(tab_id, league_data)
+            notes[1] = "No events returned."
+        elif not cells:
+            notes[1] = "No events match the filter."
+        self._set_tab_state(tab_id, " · ".join(note for note in notes if note))
+        self._update_side_panels(tab_id, league_key, league_data)
 
-    def _update_side_panels(self, tab_id: str, league_data: LeagueData) -> None:
+    def _sort_table(self, tab_id: str, selected: str | None = None) -> None:
+        table = self.query_one(f"#events-{tab_id}", DataTable)
+        selected = selected or self._selected_key(tab_id)
+        column, reverse = self._sort_orders.get(tab_id, SORT_ORDERS[0])
+        table.sort(column, reverse=reverse)
+        labels = dict(self._rows.get(tab_id, []))
+        self._rows[tab_id] = [
+            (row.key.value, labels.get(row.key.value)) for row in table.ordered_rows
+        ]
+        if selected is not None and selected in table.rows:
+            table.move_cursor(row=table.get_row_index(selected))
+
+    def _selected_key(self, tab_id: str) -> str | None:
+        table = self.query_one(f"#events-{tab_id}", DataTable)
+        if not table.row_count:
+            return None
+        row_key, _ = table.coordinate_to_cell_key(table.cursor_coordinate)
+        return row_key.value
+
+    def _update_side_panels(
+        self, tab_id: str, league_key: str, league_data: LeagueData
+    ) -> None:
         odds_panel = self.query_one(f"#odds-{tab_id}", Static)
         news_panel = self.query_one(f"#news-{tab_id}", Static)
-        if league_data.event_odds:
-            odds_panel.update(format_odds(league_data.event_odds[0]))
-        else:
-            odds_panel.update("No odds available")
-        news_panel.update(
-            format_side_panel(league_data.headlines, league_data.movements)
-        )
+        selected = self._selected_key(tab_id) or ""
+        panel = self._boards.panel(selected)
+        odds_panel.update(panel if panel is not None else "No odds available")
+        news_panel.update(_news_panel(league_data, selected))
 
     def _set_status(self, message: str) -> None:
         status = self.query_one("#status", Static)
         status.update(message)
 
-    def on_list_view_selected(self, event: ListView.Selected) -> None:
-        list_view = event.list_view
-        tab_id = list_view.data.get("tab_id") if list_view.data else None
-        if not tab_id or not self._config:
-            return
-        league_key = _league_map(self._config).get(tab_id)
-        if not league_key:
-            return
-        items = self._event_odds.get(league_key, [])
-        if not items:
-            return
-        idx = list_view.index
-        if idx is None or idx >= len(items):
+    def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
+        tab_id = (event.data_table.id or "").removeprefix("events-")
+        event_id = event.row_key.value or ""
+        panel = self._boards.panel(event_id)
+        if panel is None:
             return
         odds_panel = self.query_one(f"#odds-{tab_id}", Static)
-        odds_panel.update(format_odds(items[idx]))
+        odds_panel.update(panel)
+        league_data = self._league_data.get((self._league_keys or {}).get(tab_id, ""))
+        if league_data is not None:
+            news_panel = self.query_one(f"#news-{tab_id}", Static)
+            news_panel.update(_news_panel(league_data, event_id))
+
+    def on_data_table_header_selected(self, event: DataTable.HeaderSelected) -> None:
+        tab_id = (event.data_table.id or "").removeprefix("events-")
+        column = event.column_key.value or "start"
+        current, reverse = self._sort_orders.get(tab_id, SORT_ORDERS[0])
+        self._sort_orders[tab_id] = (column, not reverse if column == current else False)
+        self._sort_table(tab_id)
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        tab_id = (event.input.id or "").removeprefix("filter-")
+        self._filters[tab_id] = event.value
+        league_key = (self._league_keys or {}).get(tab_id)
+        league_data = self._league_data.get(league_key or "")
+        if league_key and league_data:
+            self._update_tab(tab_id, league_key, league_data)
 
     def _render_error(self, tab_id: str, message: str) -> None:
-        list_view = self.query_one(f"#events-{tab_id}", ListView)
-        list_view.clear()
-        list_view.append(ListItem(Static(message)))
+        self.query_one(f"#events-{tab_id}", DataTable).clear()
+        self._rows.pop(tab_id, None)
         odds_panel = self.query_one(f"#odds-{tab_id}", Static)
         news_panel = self.query_one(f"#news-{tab_id}", Static)
         odds_panel.update(message)
         news_panel.update(message)
 
 
-def _build_placeholder(title: str, tab_id: str) -> Horizontal:
-    events = ListView(
-        ListItem(Static(f"{title} events will appear here")),
+def _build_placeholder(title: str, tab_id: str) -> Vertical:
+    events: DataTable[Any] = DataTable(
+        cursor_type="row",
+        zebra_stripes=True,
         classes="pane events",
         id=f"events-{tab_id}",
     )
-    events.data = {"tab_id": tab_id}
+    events.add_column("Start", key="start")
+    events.add_column("Matchup", key="matchup")
+    filter_input = Input(
+        placeholder=f"Filter {title}: team, mon..sun, today, >18:00, <21:30",
+        classes="event-filter",
+        id=f"filter-{tab_id}",
+    )
     odds = Static("Odds board", classes="pane", id=f"odds-{tab_id}")
     news = Static(
         "Movements + news", classes="pane", id=f"news-{tab_id}"
     )
-    return Horizontal(events, odds, news, classes="pane-row")
+    state = Static("", classes="tab-state", id=f"state-{tab_id}")
+    return Vertical(
+        filter_input, Horizontal(events, odds, news, classes="pane-row"), state
+    )
+
+
+def _news_panel(league_data: LeagueData, event_id: str) -> str:
+    return format_side_panel(
+        league_data.headlines,
+        league_data.movements,
+        league_data.opportunities,
+        league_data.event_headlines.get(event_id, [])[:5],
+    )
+
+
+def _event_cells(event: Event) -> tuple[SortCell, SortCell]:
+    matchup = format_matchup(event)
+    return (
+        SortCell((event.start_time, event.event_id), format_start(event)),
+        SortCell((matchup.lower(), event.start_time), matchup),
+    )
 
 
-def _league_map(config: AppConfig) -> dict[str, str]:
+def _league_map(config: AppConfig, catalog: LeagueCatalog) -> dict[str, str]:
     return {
-        "tab-nfl": config.leagues.nfl_key,
-        "tab-cfb": config.leagues.cfb_key,
-        "tab-ufc": config.leagues.ufc_key or "ufc",
+        f"tab-{name.lower()}": league_key
+        for name, league_key in catalog.league_map(config).items()
     }
+
+
+def _line_context(event_id: str) -> LineContext:
+    conn = db.connection()
+    return LineContext(
+        trends=price_trends(db.price_history(conn, event_id)),
+        aggregates={
+            (line.market, line.book, line.outcome): line
+            for line in db.line_aggregates(conn, event_id=event_id)
+        },
+    )
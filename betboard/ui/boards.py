@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Mapping, Sequence
+
+from betboard.core.normalization import build_odds_board
+from betboard.models import EventOdds, LineAggregate, OddsBoard
+from betboard.ui.formatting import format_odds_board
+
+LineKey = tuple[str, str, str]
+
+
+@dataclass(frozen=True)
+class LineContext:
+    trends: Mapping[LineKey, Sequence[float]] = field(default_factory=dict)
+    aggregates: Mapping[LineKey, LineAggregate] = field(default_factory=dict)
+
+
+class BoardCache:
+    def __init__(self, lines: Callable[[str], LineContext] | None = None) -> None:
+        self._lines = lines
+        self._lock = threading.Lock()
+        self._odds: dict[str, EventOdds] = {}
+        self._versions: dict[str, int] = {}
+        self._boards: dict[str, tuple[int, OddsBoard]] = {}
+        self._panels: dict[str, tuple[int, str]] = {}
+
+    def update(self, league_key: str, event_odds: Iterable[EventOdds]) -> list[str]:
+        changed: list[str] = []
+        with self._lock:
+            seen: set[str] = set()
+            for odds in event_odds:
+                event_id = odds.event.event_id
+                seen.add(event_id)
+                previous = self._odds.get(event_id)
+                if previous is odds or previous == odds:
+                    continue
+                self._odds[event_id] = odds
+                self._versions[event_id] = self._versions.get(event_id, 0) + 1
+                changed.append(event_id)
+            stale = [
+                event_id
+                for event_id, odds in self._odds.items()
+                if odds.event.league_key == league_key and event_id not in seen
+            ]
+            for event_id in stale:
+                del self._odds[event_id]
+                self._boards.pop(event_id, None)
+                self._panels.pop(event_id, None)
+        return changed
+
+    def version(self, event_id: str) -> int | None:
+        return self._versions.get(event_id) if event_id in self._odds else None
+
+    def board(self, event_id: str) -> OddsBoard | None:
+        odds = self._odds.get(event_id)
+        if odds is None:
+            return None
+        version = self._versions[event_id]
+        cached = self._boards.get(event_id)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        board = build_odds_board(odds)
+        with self._lock:
+            if self._versions.get(event_id) == version:
+                self._boards[event_id] = (version, board)
+        return board
+
+    def panel(self, event_id: str) -> str | None:
+        version = self.version(event_id)
+        cached = self._panels.get(event_id)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        board = self.board(event_id)
+        if board is None:
+            return None
+        context = self._lines(event_id) if self._lines else LineContext()
+        panel = format_odds_board(board, context.trends, context.aggregates)
+        with self._lock:
+            if self._versions.get(event_id) == version:
+                self._panels[event_id] = (version, panel)
+        return panel
+
+    def precompute(self, event_ids: Iterable[str]) -> None:
+        for event_id in event_ids:
+            self.panel(event_id)
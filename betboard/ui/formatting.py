@@ -1,16 +1,45 @@
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Iterable
+from datetime import datetime, timezone
+from typing import Iterable, Mapping, Sequence
 
 from betboard.core.normalization import build_odds_board
-from betboard.models import Event, EventOdds, Headline, MovementEvent, OddsBoard
+from betboard.models import (
+    Event,
+    EventOdds,
+    Headline,
+    LineAggregate,
+    MovementEvent,
+    OddsBoard,
+    Opportunity,
+)
+
+SPARK_BARS = "▁▂▃▄▅▆▇█"
 
 
 def format_event(event: Event) -> str:
-    local = event.start_time.astimezone()
-    when = local.strftime("%b %d %H:%M")
-    return f"{event.away_team} @ {event.home_team}  {when}"
+    return f"{format_matchup(event)}  {format_start(event)}"
+
+
+def format_matchup(event: Event) -> str:
+    return f"{event.away_team} @ {event.home_team}"
+
+
+def format_start(event: Event) -> str:
+    return event.start_time.astimezone().strftime("%a %b %d %H:%M")
+
+
+def format_age(moment: datetime, now: datetime | None = None) -> str:
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    seconds = max(0, int(((now or datetime.now(timezone.utc)) - moment).total_seconds()))
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m"
+    if seconds < 86400:
+        return f"{seconds // 3600}h"
+    return f"{seconds // 86400}d"
 
 
 def format_odds(event_odds: EventOdds) -> str:
@@ -18,17 +47,31 @@ def format_odds(event_odds: EventOdds) -> str:
     return format_odds_board(board)
 
 
-def format_odds_board(board: OddsBoard) -> str:
+def format_odds_board(
+    board: OddsBoard,
+    trends: Mapping[tuple[str, str, str], Sequence[float]] | None = None,
+    aggregates: Mapping[tuple[str, str, str], LineAggregate] | None = None,
+) -> str:
     if not board.best_lines:
         return "No odds available"
     lines = [
         "market | outcome | price | point | book",
         "-" * 48,
     ]
+    fair_prices = {
+        (fair.market, fair.point, fair.outcome): fair for fair in board.fair_prices
+    }
     for line in board.best_lines:
+        key = (line.market, line.book, line.outcome)
         point = "" if line.point is None else f"{line.point:+.1f}"
+        trend = (trends or {}).get(key, ())
+        aggregate = (aggregates or {}).get(key)
+        fair = fair_prices.get((line.market, line.point, line.outcome))
         lines.append(
             f"{line.market:7} | {line.outcome:8} | {line.price:>5} | {point:>5} | {line.book}"
+            + (f"  fair {fair.price:+}" if fair else "")
+            + (f"  open {aggregate.open_price:+}" if aggregate else "")
+            + (f"  {sparkline(trend)}" if len(trend) > 1 else "")
         )
     if board.last_update:
         lines.append("")
@@ -36,8 +79,19 @@ def format_odds_board(board: OddsBoard) -> str:
     return "\n".join(lines)
 
 
-def format_headlines(headlines: Iterable[Headline]) -> str:
-    lines = ["Headlines", "-" * 24]
+def sparkline(values: Sequence[float], width: int = 12) -> str:
+    values = list(values)[-width:]
+    if not values:
+        return ""
+    low, high = min(values), max(values)
+    if high == low:
+        return SPARK_BARS[len(SPARK_BARS) // 2] * len(values)
+    scale = (len(SPARK_BARS) - 1) / (high - low)
+    return "".join(SPARK_BARS[round((value - low) * scale)] for value in values)
+
+
+def format_headlines(headlines: Iterable[Headline], title: str = "Headlines") -> str:
+    lines = [title, "-" * 24]
     for headline in headlines:
         lines.append(f"- {headline.title}")
     return "\n".join(lines)
@@ -55,5 +109,31 @@ def format_movements(movements: Iterable[MovementEvent]) -> str:
     return "\n".join(lines)
 
 
-def format_side_panel(headlines: Iterable[Headline], movements: Iterable[MovementEvent]) -> str:
-    return f"{format_movements(movements)}\n\n{format_headlines(headlines)}"
+def format_opportunities(opportunities: Iterable[Opportunity]) -> str:
+    lines = ["Arbs + Middles", "-" * 24]
+    for item in list(opportunities)[:5]:
+        legs = " / ".join(
+            f"{leg.outcome}{'' if leg.point is None else f' {leg.point:+g}'}"
+            f" {leg.price:+} ({leg.book})"
+            for leg in item.legs
+        )
+        window = f" {item.width:g}pt" if item.width else ""
+        lines.append(f"- {item.kind}{window} {item.margin:+.1%} {item.market}: {legs}")
+    if len(lines) == 2:
+        lines.append("None right now")
+    return "\n".join(lines)
+
+
+def format_side_panel(
+    headlines: Iterable[Headline],
+    movements: Iterable[MovementEvent],
+    opportunities: Iterable[Opportunity] = (),
+    game_headlines: Sequence[Headline] = (),
+) -> str:
+    game = ""
+    if game_headlines:
+        game = f"{format_headlines(game_headlines, 'Game News')}\n\n"
+    return (
+        f"{game}{format_opportunities(opportunities)}\n\n"
+        f"{format_movements(movements)}\n\n{format_headlines(headlines)}"
+    )
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from datetime import date, time, timedelta
+from typing import Any, Callable, Sequence
+
+from betboard.models import Event
+
+
+Row = tuple[str, object]
+EventFilter = Callable[[Event], bool]
+
+WEEKDAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+
+
+@dataclass(frozen=True, order=True)
+class SortCell:
+    sort_key: Any
+    text: str = field(compare=False)
+
+    def __rich__(self) -> str:
+        return self.text
+
+
+@dataclass(frozen=True)
+class RowDiff:
+    removed: tuple[str, ...]
+    inserted: tuple[tuple[int, str], ...]
+    changed: tuple[str, ...]
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.removed or self.inserted or self.changed)
+
+
+def diff_rows(current: Sequence[Row], target: Sequence[Row]) -> RowDiff:
+    target_index = {key: index for index, (key, _) in enumerate(target)}
+    target_labels = dict(target)
+    kept = [key for key, _ in current if key in target_index]
+    stable = _longest_increasing(kept, target_index)
+
+    removed = tuple(key for key, _ in current if key not in stable)
+    inserted = tuple(
+        (index, key) for index, (key, _) in enumerate(target) if key not in stable
+    )
+    changed = tuple(
+        key for key, label in current if key in stable and target_labels[key] != label
+    )
+    return RowDiff(removed=removed, inserted=inserted, changed=changed)
+
+
+def _longest_increasing(keys: list[str], order: dict[str, int]) -> set[str]:
+    tails: list[int] = []
+    tail_positions: list[int] = []
+    parents: list[int] = [-1] * len(keys)
+    for position, key in enumerate(keys):
+        rank = order[key]
+        slot = bisect_left(tails, rank)
+        if slot == len(tails):
+            tails.append(rank)
+            tail_positions.append(position)
+        else:
+            tails[slot] = rank
+            tail_positions[slot] = position
+        parents[position] = tail_positions[slot - 1] if slot else -1
+    stable: set[str] = set()
+    position = tail_positions[-1] if tail_positions else -1
+    while position != -1:
+        stable.add(keys[position])
+        position = parents[position]
+    return stable
+
+
+def compile_filter(query: str) -> EventFilter:
+    checks = [_compile_token(token) for token in query.lower().split()]
+    if not checks:
+        return lambda event: True
+    return lambda event: all(check(event) for check in checks)
+
+
+def _compile_token(token: str) -> EventFilter:
+    if token[0] in "<>" and (bound := _parse_clock(token[1:])) is not None:
+        if token[0] == ">":
+            return lambda event: event.start_time.astimezone().time() >= bound
+        return lambda event: event.start_time.astimezone().time() <= bound
+    if token in ("today", "tomorrow"):
+        day = date.today() + timedelta(days=1 if token == "tomorrow" else 0)
+        return lambda event: event.start_time.astimezone().date() == day
+    weekday = next(
+        (index for index, name in enumerate(WEEKDAYS) if token in (name, name[:3])),
+        None,
+    )
+    if weekday is not None:
+        return lambda event: event.start_time.astimezone().weekday() == weekday
+    return lambda event: (
+        token in event.home_team.lower() or token in event.away_team.lower()
+    )
+
+
+def _parse_clock(value: str) -> time | None:
+    hours, _, minutes = value.partition(":")
+    try:
+        return time(int(hours), int(minutes or 0))
+    except ValueError:
+        return None
@@ -1,6 +1,60 @@
+from __future__ import annotations
+
 import sys
+from datetime import datetime, timezone
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+from betboard.config import AppConfig, load_config  # noqa: E402
+from betboard.models import Event, EventOdds, MarketOdds, OddsPrice  # noqa: E402
+
+
+class FakeProvider:
+    name = "fake"
+
+    def __init__(self) -> None:
+        self.prices = [-120, -90]
+
+    def get_odds(
+        self,
+        league_key: str,
+        markets: list[str],
+        regions: str,
+        books_filter: list[str] | None,
+    ) -> list[EventOdds]:
+        now = datetime(2026, 10, 18, 17, 0, tzinfo=timezone.utc)
+        return [
+            EventOdds(
+                event=Event(
+                    event_id="1",
+                    league_key=league_key,
+                    sport_title="NFL",
+                    home_team="Home",
+                    away_team="Away",
+                    start_time=now,
+                ),
+                markets=(
+                    MarketOdds(
+                        market="h2h",
+                        book="book1",
+                        last_update=now,
+                        prices=(OddsPrice(outcome="Home", price=self.prices.pop(0)),),
+                    ),
+                ),
+            )
+        ]
+
+
+@pytest.fixture
+def sample_config() -> AppConfig:
+    return load_config(ROOT / "config.sample.toml")
+
+
+@pytest.fixture
+def fake_provider() -> FakeProvider:
+    return FakeProvider()
@@ -0,0 +1,75 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from betboard.core.arbitrage import scan_league
+from betboard.models import Event, EventOdds, MarketOdds, OddsPrice
+
+NOW = datetime(2026, 10, 18, 17, 0, tzinfo=timezone.utc)
+
+
+def _market(market: str, book: str, point: float | None, **prices: int) -> MarketOdds:
+    return MarketOdds(
+        market=market,
+        book=book,
+        last_update=NOW,
+        prices=tuple(
+            OddsPrice(outcome=outcome, price=price) for outcome, price in prices.items()
+        ),
+        point=point,
+    )
+
+
+def _odds(*markets: MarketOdds) -> EventOdds:
+    event = Event(
+        event_id="1",
+        league_key="americanfootball_nfl",
+        sport_title="NFL",
+        home_team="Home",
+        away_team="Away",
+        start_time=NOW,
+    )
+    return EventOdds(event=event, markets=markets)
+
+
+def test_scan_finds_cross_book_moneyline_arbitrage() -> None:
+    (arb,) = scan_league(
+        [
+            _odds(
+                _market("h2h", "book1", None, Home=110, Away=-105),
+                _market("h2h", "book2", None, Home=-130, Away=120),
+            )
+        ]
+    )
+    assert arb.kind == "arb"
+    assert arb.margin == pytest.approx(1 / (1 / 2.1 + 1 / 2.2) - 1)
+    assert {(leg.outcome, leg.book) for leg in arb.legs} == {
+        ("Home", "book1"),
+        ("Away", "book2"),
+    }
+
+
+def test_scan_finds_spread_and_total_middles() -> None:
+    found = scan_league(
+        [
+            _odds(
+                _market("spreads", "book1", -2.5, Home=-110, Away=-110),
+                _market("spreads", "book2", -3.5, Home=-110, Away=-110),
+                _market("totals", "book1", 44.5, Over=-110, Under=-110),
+                _market("totals", "book2", 46.5, Over=-110, Under=-110),
+                _market("totals", "book3", 47.5, Over=-110, Under=-300),
+            )
+        ]
+    )
+    middles = {item.market: item for item in found}
+    assert [item.kind for item in found] == ["middle", "middle"]
+
+    spread = middles["spreads"]
+    assert spread.width == 1.0
+    assert [(leg.book, leg.point) for leg in spread.legs] == [
+        ("book1", -2.5),
+        ("book2", 3.5),
+    ]
+    total = middles["totals"]
+    assert total.width == 2.0
+    assert total.margin == pytest.approx(-1 / 22)
@@ -0,0 +1,48 @@
+from datetime import datetime, timezone
+
+from betboard.models import Event, EventOdds, MarketOdds, OddsPrice
+from betboard.ui.boards import BoardCache
+
+
+def _odds(event_id: str, price: int) -> EventOdds:
+    now = datetime(2026, 10, 18, 17, 0, tzinfo=timezone.utc)
+    return EventOdds(
+        event=Event(
+            event_id=event_id,
+            league_key="americanfootball_nfl",
+            sport_title="NFL",
+            home_team="Home",
+            away_team="Away",
+            start_time=now,
+        ),
+        markets=(
+            MarketOdds(
+                market="h2h",
+                book="book1",
+                last_update=now,
+                prices=(OddsPrice(outcome="Home", price=price),),
+            ),
+        ),
+    )
+
+
+def test_board_cache_reuses_unchanged_boards() -> None:
+    cache = BoardCache()
+    assert cache.update("americanfootball_nfl", [_odds("1", -110), _odds("2", 120)]) == ["1", "2"]
+    cache.precompute(["1", "2"])
+    board = cache.board("1")
+    panel = cache.panel("1")
+
+    assert cache.update("americanfootball_nfl", [_odds("1", -110), _odds("2", 130)]) == ["2"]
+    assert cache.board("1") is board
+    assert cache.panel("1") is panel
+    assert cache.version("2") == 2
+    assert "130" in (cache.panel("2") or "")
+
+
+def test_board_cache_drops_events_missing_from_league() -> None:
+    cache = BoardCache()
+    cache.update("americanfootball_nfl", [_odds("1", -110), _odds("2", 120)])
+    cache.update("americanfootball_nfl", [_odds("2", 120)])
+    assert cache.board("1") is None
+    assert cache.panel("2") is not None
@@ -0,0 +1,82 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _loaded_after(snippet: str, tmp_path: Path) -> set[str]:
+    script = (
+        f"{snippet}\n"
+        "import sys\n"
+        "print(' '.join(sorted({name.split('.')[0] for name in sys.modules})))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        env={"HOME": str(tmp_path), "PYTHONPATH": str(ROOT)},
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+def test_cli_import_is_lightweight(tmp_path: Path) -> None:
+    loaded = _loaded_after("import betboard.cli", tmp_path)
+    assert not loaded & {"textual", "requests", "feedparser", "sqlite3"}
+
+
+def test_watchlist_list_only_needs_sqlite(tmp_path: Path) -> None:
+    loaded = _loaded_after(
+        "import sys\n"
+        "from betboard.cli import main\n"
+        "sys.argv = ['betboard', 'watchlist', 'list']\n"
+        "main()",
+        tmp_path,
+    )
+    assert "sqlite3" in loaded
+    assert not loaded & {"textual", "requests", "feedparser"}
+
+
+def test_news_search_runs_without_a_config(tmp_path: Path) -> None:
+    loaded = _loaded_after(
+        "import sys\n"
+        "from betboard.cli import main\n"
+        "sys.argv = ['betboard', 'news', 'search', 'injury']\n"
+        "main()",
+        tmp_path,
+    )
+    assert not loaded & {"textual", "requests", "feedparser"}
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["refresh"],
+        ["export", "--all"],
+        ["history", "x"],
+        ["replay"],
+        ["serve"],
+        ["news", "refresh"],
+        ["news", "search", "x"],
+        ["watchlist", "add", "x", "--league", "NFL"],
+        ["watchlist", "list"],
+        ["watchlist", "remove", "x"],
+    ],
+)
+def test_subcommands_stop_before_heavy_imports(argv: list[str], tmp_path: Path) -> None:
+    # With an empty HOME each command stops at the missing config or data.
+    loaded = _loaded_after(
+        "import sys\n"
+        "from betboard.cli import main\n"
+        f"sys.argv = ['betboard', *{argv!r}]\n"
+        "try:\n"
+        "    main()\n"
+        "except (SystemExit, FileNotFoundError):\n"
+        "    pass\n",
+        tmp_path,
+    )
+    assert not loaded & {"textual", "requests", "feedparser"}
@@ -0,0 +1,103 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from betboard.core.consensus import fair_american
+from betboard.core.normalization import build_odds_boards
+from betboard.models import Event, EventOdds, MarketOdds, OddsPrice
+from betboard.ui.formatting import format_odds_board
+
+NOW = datetime(2026, 10, 18, 17, 0, tzinfo=timezone.utc)
+
+
+def _odds(event_id: str, *books: tuple[str, dict[str, int]]) -> EventOdds:
+    return EventOdds(
+        event=Event(
+            event_id=event_id,
+            league_key="americanfootball_nfl",
+            sport_title="NFL",
+            home_team="Home",
+            away_team="Away",
+            start_time=NOW,
+        ),
+        markets=tuple(
+            MarketOdds(
+                market="h2h",
+                book=book,
+                last_update=NOW,
+                prices=tuple(
+                    OddsPrice(outcome=outcome, price=price)
+                    for outcome, price in prices.items()
+                ),
+            )
+            for book, prices in books
+        ),
+    )
+
+
+def test_consensus_removes_vig_per_book_and_scores_edges() -> None:
+    first, second = build_odds_boards(
+        [
+            _odds(
+                "1",
+                ("book1", {"Home": -110, "Away": -110}),
+                ("book2", {"Home": 100, "Away": -120}),
+                ("book3", {"Home": 150}),
+            ),
+            _odds("2", ("book1", {"Home": -200, "Away": 170})),
+        ]
+    )
+
+    fair = {price.outcome: price for price in first.fair_prices}
+    assert fair["Home"].probability == pytest.approx((0.5 + 0.5 / (0.5 + 120 / 220)) / 2)
+    assert fair["Home"].probability + fair["Away"].probability == pytest.approx(1)
+    assert (fair["Home"].price, fair["Home"].books) == (104, 2)
+
+    edges = {(edge.book, edge.outcome): edge.edge for edge in first.edges}
+    assert set(edges) == {
+        ("book1", "Home"),
+        ("book1", "Away"),
+        ("book2", "Home"),
+        ("book2", "Away"),
+        ("book3", "Home"),
+    }
+    assert edges[("book2", "Home")] == pytest.approx(2 * fair["Home"].probability - 1)
+    assert edges[("book3", "Home")] == pytest.approx(2.5 * fair["Home"].probability - 1)
+    assert edges[("book1", "Home")] < 0
+    assert {price.outcome for price in second.fair_prices} == {"Home", "Away"}
+
+
+def test_fair_american_round_trips_even_money() -> None:
+    assert fair_american(0.5) == -100
+    assert fair_american(0.25) == 300
+
+
+def test_spread_boards_give_each_side_its_own_point() -> None:
+    (board,) = build_odds_boards(
+        [
+            EventOdds(
+                event=_odds("1").event,
+                markets=(
+                    MarketOdds(
+                        market="spreads",
+                        book="book1",
+                        last_update=NOW,
+                        prices=(
+                            OddsPrice(outcome="Home", price=-110),
+                            OddsPrice(outcome="Away", price=-110),
+                        ),
+                        point=-3.0,
+                    ),
+                ),
+            )
+        ]
+    )
+
+    points = {line.outcome: line.point for line in board.best_lines}
+    assert points == {"Home": -3.0, "Away": 3.0}
+    assert {(fair.outcome, fair.point) for fair in board.fair_prices} == {
+        ("Home", -3.0),
+        ("Away", 3.0),
+    }
+    rows = format_odds_board(board).splitlines()
+    assert any("Away" in row and "+3.0" in row and "fair -100" in row for row in rows)
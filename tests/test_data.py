@@ -0,0 +1,62 @@
+from datetime import datetime, timezone
+from pathlib import Path
+
+from betboard.core.data import load_stored_league_data
+from betboard.core.serialization import event_odds_to_payload
+from betboard.models import Event, EventOdds, MarketOdds, OddsPrice, OddsSnapshot
+from betboard.storage import db
+
+
+def _odds(market: str, price: int, point: float | None = None) -> EventOdds:
+    now = datetime(2026, 10, 18, 17, 0, tzinfo=timezone.utc)
+    return EventOdds(
+        event=Event(
+            event_id="1",
+            league_key="americanfootball_nfl",
+            sport_title="NFL",
+            home_team="Home",
+            away_team="Away",
+            start_time=now,
+        ),
+        markets=(
+            MarketOdds(
+                market=market,
+                book="book1",
+                last_update=now,
+                prices=(OddsPrice(outcome="Home", price=price),),
+                point=point,
+            ),
+        ),
+    )
+
+
+def test_load_stored_league_data_merges_latest_market_snapshots(tmp_path: Path) -> None:
+    conn = db.connect(tmp_path / "betboard.db")
+    for fetched_at, market, odds in (
+        (datetime(2026, 10, 18, 10, 0), "h2h", _odds("h2h", -110)),
+        (datetime(2026, 10, 18, 11, 0), "h2h", _odds("h2h", -120)),
+        (datetime(2026, 10, 18, 11, 0), "spreads", _odds("spreads", -110, -3.5)),
+    ):
+        db.add_snapshot(
+            conn,
+            OddsSnapshot(
+                provider="oddsapi",
+                league_key="americanfootball_nfl",
+                market=market,
+                fetched_at=fetched_at,
+                payload={"items": [event_odds_to_payload(odds)]},
+            ),
+        )
+
+    data = load_stored_league_data(
+        conn, "oddsapi", "americanfootball_nfl", ["h2h", "spreads", "totals"]
+    )
+
+    assert data is not None
+    assert data.stored_at == datetime(2026, 10, 18, 11, 0)
+    (event_odds,) = data.event_odds
+    assert {m.market: m.prices[0].price for m in event_odds.markets} == {
+        "h2h": -120,
+        "spreads": -110,
+    }
+    assert load_stored_league_data(conn, "oddsapi", "ufc", ["h2h"]) is None
@@ -0,0 +1,28 @@
+import threading
+from pathlib import Path
+
+from betboard.storage import db
+
+
+def test_connection_manager_reuses_connections_per_thread(tmp_path: Path) -> None:
+    manager = db.ConnectionManager(tmp_path / "betboard.db")
+    main = manager.connection()
+    assert manager.connection() is main
+
+    seen: list[object] = []
+
+    def worker() -> None:
+        seen.append(manager.connection())
+
+    first = threading.Thread(target=worker)
+    first.start()
+    first.join()
+    second = threading.Thread(target=worker)
+    second.start()
+    second.join()
+
+    assert seen[0] is not main
+    assert seen[1] is seen[0]
+    manager.close()
+    assert manager.connection() is not main
+    manager.close()
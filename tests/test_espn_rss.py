@@ -0,0 +1,69 @@
+from datetime import datetime, timezone
+from typing import Any, Iterator
+
+from betboard.providers.espn_rss import RSS_FEEDS, EspnRssProvider, parse_headlines
+from betboard.providers.resilience import ResilientClient
+
+
+def _feed(items: int) -> bytes:
+    body = "".join(
+        f"<item><title>Story {index}</title><link>https://espn.com/{index}</link>"
+        f"<pubDate>Sun, 18 Oct 2026 12:0{index % 10}:00 GMT</pubDate></item>"
+        for index in range(items)
+    )
+    return f'<?xml version="1.0"?><rss><channel>{body}</channel></rss>'.encode()
+
+
+class StreamResponse:
+    status_code = 200
+    headers: dict[str, str] = {}
+
+    def __init__(self, body: bytes) -> None:
+        self.body = body
+        self.read = 0
+        self.closed = False
+
+    def raise_for_status(self) -> None:
+        pass
+
+    def iter_content(self, chunk_size: int) -> Iterator[bytes]:
+        for start in range(0, len(self.body), 64):
+            self.read += 1
+            yield self.body[start : start + 64]
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_parse_headlines_stops_after_limit() -> None:
+    response = StreamResponse(_feed(200))
+    headlines = parse_headlines(response.iter_content(64), limit=3)
+
+    assert [headline.title for headline in headlines] == [
+        "Story 0",
+        "Story 1",
+        "Story 2",
+    ]
+    assert headlines[1].url == "https://espn.com/1"
+    assert headlines[1].published_at == datetime(
+        2026, 10, 18, 12, 1, tzinfo=timezone.utc
+    )
+    assert response.read < len(response.body) // 64 / 10
+
+
+def test_fetch_many_fetches_each_feed_once_and_closes_streams() -> None:
+    responses: list[StreamResponse] = []
+
+    def send(url: str, **kwargs: Any) -> StreamResponse:
+        assert kwargs["stream"] is True
+        responses.append(StreamResponse(_feed(10)))
+        return responses[-1]
+
+    provider = EspnRssProvider(ResilientClient(hedge_percentile=None, send=send))
+    leagues = [*RSS_FEEDS, "basketball_nba", "icehockey_nhl"]
+    headlines = provider.fetch_many(leagues, limit=2)
+
+    assert set(headlines) == set(leagues)
+    assert all(len(items) == 2 for items in headlines.values())
+    assert len(responses) == len(RSS_FEEDS) + 1
+    assert all(response.closed for response in responses)
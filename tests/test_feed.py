@@ -0,0 +1,69 @@
+from datetime import datetime, timezone
+from pathlib import Path
+
+from betboard.core.feed import MovementBus, MovementFeed
+from betboard.models import MovementEvent
+from betboard.storage import db
+
+
+def _movement(league_key: str, delta: int) -> MovementEvent:
+    return MovementEvent(
+        league_key=league_key,
+        event_id="1",
+        created_at=datetime(2026, 10, 18, 17, 0, tzinfo=timezone.utc),
+        details={"delta": delta},
+    )
+
+
+def test_movement_feed_publishes_new_rows_per_league(tmp_path: Path) -> None:
+    conn = db.connect(tmp_path / "betboard.db")
+    db.record_movement_events(conn, [_movement("americanfootball_nfl", 5)])
+    bus = MovementBus(db.latest_movement_id(conn))
+    feed = MovementFeed(bus, lambda: conn)
+    nfl = bus.subscribe(["americanfootball_nfl"])
+    everything = bus.subscribe()
+
+    feed.poll(conn)
+    assert nfl.get(timeout=0) is None
+
+    ids = db.record_movement_events(
+        conn, [_movement("mma_mixed_martial_arts", 10), _movement("americanfootball_nfl", 20)]
+    )
+    db.bump_data_version(conn, "americanfootball_nfl")
+    feed.poll(conn)
+
+    item = nfl.get(timeout=0)
+    assert item is not None and item[0] == ids[1]
+    assert nfl.get(timeout=0) is None
+    received = [everything.get(timeout=0) for _ in ids]
+    assert [item[0] for item in received if item] == ids
+
+    bus.publish([(ids[1], _movement("americanfootball_nfl", 20))])
+    assert nfl.get(timeout=0) is None
+
+
+def test_movements_since_resumes_from_cursor(tmp_path: Path) -> None:
+    conn = db.connect(tmp_path / "betboard.db")
+    ids = db.record_movement_events(
+        conn, [_movement("americanfootball_nfl", delta) for delta in (5, 10, 15)]
+    )
+    resumed = db.movements_since(conn, ids[0], ["americanfootball_nfl"])
+    assert [(movement_id, m.details["delta"]) for movement_id, m in resumed] == [
+        (ids[1], 10),
+        (ids[2], 15),
+    ]
+    assert db.movements_since(conn, ids[0], ["ufc"]) == []
+
+
+def test_movement_ids_survive_vacuum(tmp_path: Path) -> None:
+    conn = db.connect(tmp_path / "betboard.db")
+    ids = db.record_movement_events(
+        conn, [_movement("americanfootball_nfl", delta) for delta in (5, 10, 15)]
+    )
+    with conn:
+        conn.execute("DELETE FROM movement_events WHERE id = ?", (ids[0],))
+    conn.execute("VACUUM")
+
+    resumed = db.movements_since(conn, ids[1])
+    assert [movement_id for movement_id, _ in resumed] == [ids[2]]
+    assert db.latest_movement_id(conn) == ids[2]
@@ -0,0 +1,77 @@
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from betboard.config import AppConfig
+from betboard.core.history import decimal_odds, line_changes
+from betboard.core.ingest import ingest_league
+from betboard.models import LinePoint
+from betboard.storage import db
+from betboard.ui.formatting import sparkline
+
+
+def _payload(price: int) -> dict:
+    return {
+        "items": [
+            {
+                "event": {"event_id": "1"},
+                "markets": [
+                    {
+                        "market": "h2h",
+                        "book": "book1",
+                        "point": None,
+                        "prices": [
+                            {"outcome": "Home", "price": price},
+                            {"outcome": "Away", "price": 100},
+                        ],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+def test_line_changes_only_records_moved_prices() -> None:
+    observed = datetime(2026, 10, 18, 12, 0)
+    assert len(line_changes(None, _payload(-110), observed)) == 2
+    ((event_id, point),) = line_changes(_payload(-110), _payload(-120), observed)
+    assert (event_id, point.outcome, point.price) == ("1", "Home", -120)
+
+
+def test_ingest_builds_queryable_price_history(
+    tmp_path: Path, sample_config: AppConfig, fake_provider: Any
+) -> None:
+    config, provider = sample_config, fake_provider
+    conn = db.connect(tmp_path / "betboard.db")
+    provider.prices = [-120, -120, -90]
+    for _ in range(3):
+        ingest_league(conn, config, provider, "americanfootball_nfl")
+
+    history = db.price_history(conn, "1", market="h2h", book="book1", outcome="Home")
+    assert [point.price for point in history] == [-120, -90]
+    assert db.price_history(conn, "1", since=datetime(2100, 1, 1)) == []
+
+
+def test_sparkline_scales_decimal_odds() -> None:
+    values = [decimal_odds(price) for price in (-110, -105, 100, 120)]
+    assert sparkline(values) == "▁▂▃█"
+    assert sparkline([2.0, 2.0]) == "▅▅"
+
+
+def test_line_aggregates_track_open_best_and_close(tmp_path: Path) -> None:
+    conn = db.connect(tmp_path / "betboard.db")
+    start = datetime(2026, 10, 18, 17, 0)
+    for hour, price in ((12, -110), (15, 105), (16, -105), (18, -140)):
+        point = LinePoint(
+            observed_at=datetime(2026, 10, 18, hour),
+            market="h2h",
+            book="book1",
+            outcome="Home",
+            price=price,
+        )
+        db.update_line_aggregates(conn, "nfl", [("1", point)], {"1": start})
+
+    (line,) = db.line_aggregates(conn, league_key="nfl")
+    assert (line.open_price, line.best_price) == (-110, 105)
+    assert (line.current_price, line.close_price) == (-140, -105)
+    assert db.line_aggregates(conn, event_id="2") == []
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+
+from betboard.config import AppConfig
+from betboard.core.ingest import ingest_league, ingest_leagues
+from betboard.models import EventOdds
+from betboard.storage import db
+
+
+def test_ingest_league_bumps_version_and_records_moves(
+    tmp_path: Path, sample_config: AppConfig, fake_provider: Any
+) -> None:
+    config, provider = sample_config, fake_provider
+    conn = db.connect(tmp_path / "betboard.db")
+
+    assert ingest_league(conn, config, provider, "americanfootball_nfl") == 1
+    assert ingest_league(conn, config, provider, "americanfootball_nfl") == 2
+
+    assert db.data_versions(conn) == {"americanfootball_nfl": 2}
+    (movement,) = db.list_movements(conn, "americanfootball_nfl")
+    assert movement.details["delta"] == 30
+
+
+def test_ingest_does_not_compare_with_older_snapshot_versions(
+    tmp_path: Path, sample_config: AppConfig, fake_provider: Any
+) -> None:
+    conn = db.connect(tmp_path / "betboard.db")
+    assert ingest_league(conn, sample_config, fake_provider, "americanfootball_nfl") == 1
+    snapshot = db.latest_snapshot(conn, "fake", "americanfootball_nfl", "h2h")
+    assert snapshot is not None
+    older = {"items": snapshot.payload["items"]}
+    later = snapshot.fetched_at + timedelta(seconds=1)
+    db.add_snapshot(conn, replace(snapshot, fetched_at=later, payload=older))
+
+    ingest_league(conn, sample_config, fake_provider, "americanfootball_nfl")
+    assert db.list_movements(conn, "americanfootball_nfl") == []
+
+
+class BulkProvider:
+    name = "fake"
+
+    def __init__(self, provider: Any) -> None:
+        self.get_odds = provider.get_odds
+        self.bulk_calls: list[list[str]] = []
+
+    def get_odds_bulk(
+        self,
+        league_keys: list[str],
+        markets: list[str],
+        regions: str,
+        books_filter: list[str] | None,
+    ) -> dict[str, list[EventOdds] | Exception]:
+        self.bulk_calls.append(league_keys)
+        nfl = self.get_odds("americanfootball_nfl", markets, regions, books_filter)
+        return {
+            "americanfootball_nfl": nfl,
+            "mma_mixed_martial_arts": RuntimeError("404"),
+        }
+
+
+def test_ingest_leagues_splits_one_bulk_fetch_per_league(
+    tmp_path: Path, sample_config: AppConfig, fake_provider: Any
+) -> None:
+    config = sample_config
+    conn = db.connect(tmp_path / "betboard.db")
+    provider = BulkProvider(fake_provider)
+
+    versions = ingest_leagues(
+        conn, config, provider, ["americanfootball_nfl", "americanfootball_ncaaf"]
+    )
+
+    assert versions == {"americanfootball_nfl": 1, "americanfootball_ncaaf": 1}
+    assert provider.bulk_calls == [["americanfootball_nfl", "americanfootball_ncaaf"]]
+    nfl = db.latest_snapshot(conn, "fake", "americanfootball_nfl", "h2h")
+    cfb = db.latest_snapshot(conn, "fake", "americanfootball_ncaaf", "h2h")
+    assert nfl is not None and len(nfl.payload["items"]) == 1
+    assert cfb is not None and cfb.payload["items"] == []
+
+
+def test_ingester_heartbeat_expires(tmp_path: Path) -> None:
+    conn = db.connect(tmp_path / "betboard.db")
+    db.heartbeat_ingester(conn, "fake:1", ttl_seconds=60)
+    assert db.active_ingester(conn) == "fake:1"
+    db.heartbeat_ingester(conn, "fake:1", ttl_seconds=-1)
+    assert db.active_ingester(conn) is None
+
+
+def test_ingest_leagues_stores_leagues_around_a_failed_one(
+    tmp_path: Path, sample_config: AppConfig, fake_provider: Any, capsys: Any
+) -> None:
+    conn = db.connect(tmp_path / "betboard.db")
+    provider = BulkProvider(fake_provider)
+
+    leagues = ["americanfootball_nfl", "mma_mixed_martial_arts"]
+
+    versions = ingest_leagues(conn, sample_config, provider, leagues)
+
+    assert versions == {"americanfootball_nfl": 1}
+    assert "mma_mixed_martial_arts: ingest failed: 404" in capsys.readouterr().out
+    assert db.latest_snapshot(conn, "fake", "americanfootball_nfl", "h2h") is not None
+    assert db.latest_snapshot(conn, "fake", "mma_mixed_martial_arts", "h2h") is None
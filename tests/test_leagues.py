@@ -0,0 +1,51 @@
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from betboard.config import load_config
+from betboard.core.leagues import LeagueCatalog
+from betboard.storage import db
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+class FakeSource:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def list_sports(self) -> list[dict[str, Any]]:
+        self.calls += 1
+        return [
+            {"key": "americanfootball_nfl", "group": "American Football", "title": "NFL", "active": True},
+            {"key": "mma_mixed_martial_arts", "group": "Mixed Martial Arts", "title": "MMA", "active": True},
+            {"key": "basketball_ncaab", "group": "Basketball", "title": "NCAAB", "active": False},
+        ]
+
+
+def test_catalog_persists_and_resolves(tmp_path: Path) -> None:
+    config = load_config(ROOT / "config.sample.toml")
+    conn = db.connect(tmp_path / "betboard.db")
+    source = FakeSource()
+
+    catalog = LeagueCatalog(conn, source, ttl_minutes=60)
+    assert catalog.resolve(config, "NFL") == ["americanfootball_nfl"]
+    assert source.calls == 0
+    assert catalog.resolve(config, "UFC") == ["mma_mixed_martial_arts"]
+    assert catalog.resolve(config, "basketball_ncaab") == ["basketball_ncaab"]
+    assert source.calls == 1
+
+    warm = LeagueCatalog(conn, source, ttl_minutes=60)
+    assert warm.resolve(config, None)[-1] == "mma_mixed_martial_arts"
+    assert source.calls == 1
+
+    with pytest.raises(ValueError):
+        warm.resolve(config, "curling")
+
+
+def test_catalog_refreshes_when_stale(tmp_path: Path) -> None:
+    conn = db.connect(tmp_path / "betboard.db")
+    source = FakeSource()
+    LeagueCatalog(conn, source, ttl_minutes=60).sports()
+    LeagueCatalog(conn, source, ttl_minutes=-1).sports()
+    assert source.calls == 2
@@ -0,0 +1,107 @@
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from betboard.core.linking import TeamIndex, link_headlines
+from betboard.models import Event, Headline
+from betboard.storage import db
+
+NOW = datetime(2026, 10, 18, 17, 0, tzinfo=timezone.utc)
+
+
+def _event(
+    event_id: str, home: str, away: str, league_key: str = "americanfootball_nfl"
+) -> Event:
+    return Event(
+        event_id=event_id,
+        league_key=league_key,
+        sport_title="NFL",
+        home_team=home,
+        away_team=away,
+        start_time=NOW,
+    )
+
+
+EVENTS = [
+    _event("1", "Kansas City Chiefs", "Buffalo Bills"),
+    _event("2", "New York Giants", "San Francisco 49ers"),
+    _event("3", "New York Jets", "New England Patriots"),
+]
+
+
+def test_team_index_matches_mascots_locations_and_aliases() -> None:
+    index = TeamIndex(EVENTS)
+    assert index.match("Chiefs' Mahomes limited at practice") == {"1"}
+    assert index.match("Kansas City weather could slow Buffalo") == {"1"}
+    assert index.match("Niners and Pats trade rumours heat up") == {"2", "3"}
+    assert index.match("New York sports roundup") == set()
+
+
+def _cfb(event_id: str, home: str, away: str) -> Event:
+    return _event(event_id, home, away, "americanfootball_ncaaf")
+
+
+CFB_EVENTS = [
+    _cfb("g1", "Georgia Bulldogs", "Auburn Tigers"),
+    _cfb("g2", "Georgia Tech Yellow Jackets", "Duke Blue Devils"),
+    _cfb("g3", "LSU Tigers", "Texas A&M Aggies"),
+    _cfb("g4", "Kansas Jayhawks", "Iowa State Cyclones"),
+]
+
+
+def test_team_index_splits_college_names_and_prefers_longest_keys() -> None:
+    index = TeamIndex(CFB_EVENTS)
+    assert index.match("Georgia Tech stuns Duke") == {"g2"}
+    assert index.match("Yellow Jackets, Blue Devils meet under the lights") == {"g2"}
+    assert index.match("Georgia rolls past Auburn") == {"g1"}
+    assert index.match("Tigers depth chart") == set()
+    assert index.match("LSU, Texas A&M kick off late") == {"g3"}
+    assert index.match("Kansas City Chiefs vs Texas") == set()
+    assert index.match("Kansas State upsets Baylor") == set()
+    assert index.match("Kansas rallies late") == {"g4"}
+
+
+def test_link_headlines_scopes_links_to_the_game_week(tmp_path: Path) -> None:
+    conn = db.connect(tmp_path / "betboard.db")
+    headlines = [
+        Headline(
+            title=title,
+            url=f"https://espn.com/{index}",
+            published_at=NOW - age,
+            source="ESPN",
+        )
+        for index, (title, age) in enumerate(
+            [
+                ("Georgia Tech stuns Duke", timedelta(hours=2)),
+                ("Georgia Tech routs Duke in last year's opener", timedelta(days=30)),
+            ]
+        )
+    ]
+    db.store_headlines(conn, "americanfootball_ncaaf", headlines)
+
+    linked = link_headlines(conn, "americanfootball_ncaaf", CFB_EVENTS)
+    assert {key: [item.title for item in items] for key, items in linked.items()} == {
+        "g2": ["Georgia Tech stuns Duke"]
+    }
+    link_headlines(conn, "americanfootball_ncaaf", CFB_EVENTS[:1])
+    assert db.linked_headlines(conn, "americanfootball_ncaaf") == {}
+
+
+def test_link_headlines_stores_links_for_event_lookup(tmp_path: Path) -> None:
+    conn = db.connect(tmp_path / "betboard.db")
+    headlines = [
+        Headline(
+            title=title,
+            url=f"https://espn.com/{index}",
+            published_at=datetime(2026, 10, 18, 12, index, tzinfo=timezone.utc),
+            source="ESPN",
+        )
+        for index, title in enumerate(
+            ["Jets name new starter", "Bills-Chiefs preview", "League roundup"]
+        )
+    ]
+    db.store_headlines(conn, "americanfootball_nfl", headlines)
+
+    linked = link_headlines(conn, "americanfootball_nfl", EVENTS)
+    titles = {event_id: [item.title for item in items] for event_id, items in linked.items()}
+    assert titles == {"1": ["Bills-Chiefs preview"], "3": ["Jets name new starter"]}
+    assert db.linked_headlines(conn, "americanfootball_nfl") == linked
@@ -0,0 +1,186 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from betboard.models import Event, EventOdds, MarketOdds, OddsPrice
+from betboard.providers.merged import MergedOddsProvider, merge_event_odds
+from betboard.providers.resilience import CircuitOpenError
+
+KICKOFF = datetime(2026, 10, 18, 17, 0, tzinfo=timezone.utc)
+
+
+def _odds(
+    event_id: str,
+    home: str,
+    away: str,
+    book: str,
+    price: int,
+    start: datetime = KICKOFF,
+    updated: datetime = KICKOFF,
+) -> EventOdds:
+    return EventOdds(
+        event=Event(
+            event_id=event_id,
+            league_key="americanfootball_nfl",
+            sport_title="NFL",
+            home_team=home,
+            away_team=away,
+            start_time=start,
+        ),
+        markets=(
+            MarketOdds(
+                market="h2h",
+                book=book,
+                last_update=updated,
+                prices=(OddsPrice(outcome=home, price=price),),
+            ),
+        ),
+    )
+
+
+class FakeProvider:
+    def __init__(self, name: str, odds: list[EventOdds]) -> None:
+        self.name = name
+        self.odds = odds
+
+    def list_events(self, league_key: str, hours: int) -> list[Event]:
+        return [odds.event for odds in self.odds]
+
+    def get_odds(
+        self,
+        league_key: str,
+        markets: list[str],
+        regions: str,
+        books_filter: list[str] | None,
+    ) -> list[EventOdds]:
+        return self.odds
+
+
+class FailingProvider(FakeProvider):
+    def get_odds(
+        self,
+        league_key: str,
+        markets: list[str],
+        regions: str,
+        books_filter: list[str] | None,
+    ) -> list[EventOdds]:
+        raise CircuitOpenError(self.name, 30)
+
+
+def test_merged_provider_unions_books_for_matching_games() -> None:
+    primary = FakeProvider(
+        "oddsapi",
+        [
+            _odds("a1", "Kansas City Chiefs", "Buffalo Bills", "fanduel", -120),
+            _odds("a2", "Dallas Cowboys", "New York Giants", "fanduel", -150),
+        ],
+    )
+    secondary = FakeProvider(
+        "therundown",
+        [
+            _odds(
+                "r1",
+                "Kansas City Chiefs",
+                "Buffalo Bills",
+                "fanduel",
+                -125,
+                start=KICKOFF + timedelta(minutes=5),
+                updated=KICKOFF + timedelta(minutes=1),
+            ),
+            _odds("r2", "Kansas City Chiefs", "Buffalo Bills", "pinnacle", -118),
+            _odds("r3", "Denver Broncos", "Las Vegas Raiders", "pinnacle", 105),
+        ],
+    )
+    provider = MergedOddsProvider([primary, secondary])
+
+    merged = {
+        odds.event.event_id: odds
+        for odds in provider.get_odds("nfl", ["h2h"], "us", None)
+    }
+
+    assert provider.name == "oddsapi+therundown"
+    assert list(merged) == ["a1", "a2", "r3"]
+    books = {m.book: m.prices[0] for m in merged["a1"].markets}
+    assert books["fanduel"].price == -125
+    assert books["pinnacle"] == OddsPrice(outcome="Kansas City Chiefs", price=-118)
+
+
+def test_merged_provider_tolerates_a_failing_provider() -> None:
+    provider = MergedOddsProvider(
+        [
+            FailingProvider("oddsapi", []),
+            FakeProvider("therundown", [_odds("r1", "Home", "Away", "pinnacle", 100)]),
+        ]
+    )
+    (odds,) = provider.get_odds("nfl", ["h2h"], "us", None)
+    assert odds.event.event_id == "r1"
+
+
+def test_merged_provider_raises_when_every_provider_fails() -> None:
+    provider = MergedOddsProvider(
+        [FailingProvider("oddsapi", []), FailingProvider("therundown", [])]
+    )
+    with pytest.raises(CircuitOpenError):
+        provider.get_odds("nfl", ["h2h"], "us", None)
+
+
+def test_merge_keeps_college_games_with_shared_mascots_apart() -> None:
+    merged = merge_event_odds(
+        [
+            [
+                _odds("a1", "Georgia Bulldogs", "Auburn Tigers", "fanduel", -300),
+                _odds("a2", "LSU Tigers", "Auburn Tigers", "fanduel", -150),
+            ],
+            [
+                _odds("r1", "Mississippi State Bulldogs", "LSU Tigers", "pinnacle", 140),
+                _odds("r2", "LSU Tigers", "Auburn Tigers", "pinnacle", -145),
+            ],
+        ]
+    )
+
+    assert [odds.event.event_id for odds in merged] == ["a1", "a2", "r1"]
+    by_id = {odds.event.event_id: odds for odds in merged}
+    assert [m.book for m in by_id["a1"].markets] == ["fanduel"]
+    pinnacle = {m.book: m for m in by_id["a2"].markets}["pinnacle"]
+    assert pinnacle.prices == (OddsPrice(outcome="LSU Tigers", price=-145),)
+
+
+def test_merge_maps_outcomes_by_team_when_home_and_away_are_swapped() -> None:
+    primary = _odds("a1", "Alabama Crimson Tide", "Michigan Wolverines", "fanduel", -200)
+    swapped = EventOdds(
+        event=Event(
+            event_id="r1",
+            league_key="americanfootball_ncaaf",
+            sport_title="NCAAF",
+            home_team="Michigan Wolverines",
+            away_team="Alabama Crimson Tide",
+            start_time=KICKOFF,
+        ),
+        markets=(
+            MarketOdds(
+                market="h2h",
+                book="pinnacle",
+                last_update=KICKOFF,
+                prices=(
+                    OddsPrice(outcome="Michigan Wolverines", price=165),
+                    OddsPrice(outcome="Alabama Crimson Tide", price=-190),
+                ),
+            ),
+            MarketOdds(
+                market="spreads",
+                book="pinnacle",
+                last_update=KICKOFF,
+                prices=(
+                    OddsPrice(outcome="Michigan Wolverines", price=-110),
+                    OddsPrice(outcome="Alabama Crimson Tide", price=-110),
+                ),
+                point=4.5,
+            ),
+        ),
+    )
+
+    (merged,) = merge_event_odds([[primary], [swapped]])
+    markets = {(m.market, m.book): m for m in merged.markets}
+    prices = {p.outcome: p.price for p in markets[("h2h", "pinnacle")].prices}
+    assert prices == {"Alabama Crimson Tide": -190, "Michigan Wolverines": 165}
+    assert markets[("spreads", "pinnacle")].point == -4.5
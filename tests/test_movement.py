@@ -1,8 +1,14 @@
 from datetime import datetime, timezone
+from pathlib import Path
 
-from betboard.core.movement import detect_notable_moves
+import pytest
+
+from betboard.config import MovementRuleConfig, load_config
+from betboard.core.movement import MovementRuleBook, compile_rules, detect_notable_moves
 from betboard.models import Event, EventOdds, MarketOdds, OddsPrice
 
+ROOT = Path(__file__).resolve().parents[1]
+
 
 def _event(event_id: str) -> Event:
     return Event(
@@ -73,3 +79,72 @@ def test_detect_notable_spread_move() -> None:
 
     moves = detect_notable_moves(prev, curr)
     assert moves, "Expected a notable spread move"
+
+
+def test_spread_moves_read_from_each_sides_own_point() -> None:
+    event = _event("3")
+
+    def odds(point: float) -> EventOdds:
+        return EventOdds(
+            event=event,
+            markets=(
+                MarketOdds(
+                    market="spreads",
+                    book="book1",
+                    last_update=datetime.now(timezone.utc),
+                    point=point,
+                    prices=(
+                        OddsPrice(outcome="Home", price=-110),
+                        OddsPrice(outcome="Away", price=-110),
+                    ),
+                ),
+            ),
+        )
+
+    moves = detect_notable_moves(odds(-3.0), odds(-4.5))
+    points = {
+        move.details["outcome"]: (
+            move.details["previous"]["point"],
+            move.details["current"]["point"],
+        )
+        for move in moves
+    }
+    assert points == {"Home": (-3.0, -4.5), "Away": (3.0, 4.5)}
+
+
+def test_rule_book_applies_specific_overrides_and_key_numbers(tmp_path: Path) -> None:
+    path = tmp_path / "config.toml"
+    path.write_text(
+        (ROOT / "config.sample.toml").read_text()
+        + '\n[[movement.rules]]\nbook = "pinnacle"\nmarket = "h2h"\nh2h_cents = 5\n'
+    )
+    rules = compile_rules(load_config(path).movement)
+    assert rules is compile_rules(load_config(path).movement)
+
+    nfl = "americanfootball_nfl"
+    move = ({"price": -110.0, "point": -2.5}, {"price": -110.0, "point": -3.0})
+    assert rules.check(nfl, "spreads", "fanduel")(*move)
+    assert not rules.check("americanfootball_ncaaf", "spreads", "fanduel")(*move)
+
+    small = ({"price": -110.0, "point": None}, {"price": -118.0, "point": None})
+    assert rules.check(nfl, "h2h", "pinnacle")(*small)
+    assert not rules.check(nfl, "h2h", "fanduel")(*small)
+
+
+def test_rule_book_rejects_unknown_settings() -> None:
+    rule = MovementRuleConfig(
+        league=None, market="h2h", book=None, settings=(("cents", 5),)
+    )
+    with pytest.raises(ValueError):
+        MovementRuleBook(overrides=(rule,))
+
+
+def test_load_config_rejects_invalid_movement_rules(tmp_path: Path) -> None:
+    path = tmp_path / "config.toml"
+    sample = (ROOT / "config.sample.toml").read_text()
+    path.write_text(sample + '\n[[movement.rules]]\nmarket = "h2h"\ncents = 5\n')
+    with pytest.raises(ValueError):
+        load_config(path)
+    path.write_text(sample + '\n[[movement.rules]]\nflag_sign_flip = "false"\n')
+    with pytest.raises(ValueError):
+        load_config(path)
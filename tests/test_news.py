@@ -0,0 +1,73 @@
+from datetime import datetime, timezone
+import shutil
+from pathlib import Path
+
+from betboard.core.ingest import ingest_headlines
+from betboard.models import Headline
+from betboard.storage import db
+
+
+def _headline(index: int, title: str) -> Headline:
+    return Headline(
+        title=title,
+        url=f"https://espn.com/story/{index}",
+        published_at=datetime(2026, 10, 18, 12, index, tzinfo=timezone.utc),
+        source="ESPN",
+        guid=f"espn-{index}",
+    )
+
+
+class FakeNews:
+    name = "fake"
+
+    def __init__(self) -> None:
+        self.stories = [
+            _headline(0, "Chiefs rally past Bills in overtime"),
+            _headline(1, "Injury report: Bills list two starters"),
+        ]
+
+    def fetch_headlines(self, league_key: str, limit: int) -> list[Headline]:
+        return self.stories[:limit]
+
+
+def test_ingest_headlines_only_inserts_unseen_items(tmp_path: Path) -> None:
+    conn = db.connect(tmp_path / "betboard.db")
+    news = FakeNews()
+    assert ingest_headlines(conn, news, ["americanfootball_nfl"]) == {
+        "americanfootball_nfl": 2
+    }
+    news.stories.append(_headline(2, "Ravens sign veteran kicker"))
+    assert ingest_headlines(conn, news, ["americanfootball_nfl", "ufc"]) == {
+        "americanfootball_nfl": 1,
+        "ufc": 3,
+    }
+
+    recent = db.recent_headlines(conn, "americanfootball_nfl", 2)
+    assert [headline.guid for headline in recent] == ["espn-2", "espn-1"]
+    assert recent[0].published_at == datetime(2026, 10, 18, 12, 2, tzinfo=timezone.utc)
+
+
+def test_search_headlines_matches_titles_across_leagues(tmp_path: Path) -> None:
+    conn = db.connect(tmp_path / "betboard.db")
+    news = FakeNews()
+    ingest_headlines(conn, news, ["americanfootball_nfl", "ufc"])
+
+    matches = db.search_headlines(conn, "bills")
+    assert sorted(headline.guid for headline in matches) == ["espn-0", "espn-1"]
+    (injury,) = db.search_headlines(conn, 'injury "bills')
+    assert injury.guid == "espn-1"
+    assert db.search_headlines(conn, "ravens") == []
+    assert len(db.search_headlines(conn, "bills", league_key="ufc", limit=1)) == 1
+
+
+def test_headline_index_backfills_rows_stored_without_fts(tmp_path: Path) -> None:
+    conn = db.connect(tmp_path / "betboard.db")
+    # As if stored by an SQLite without FTS5, then opened by one with it.
+    conn.executescript("DROP TRIGGER headlines_fts_insert; DROP TABLE headlines_fts;")
+    ingest_headlines(conn, FakeNews(), ["americanfootball_nfl"])
+    conn.close()
+    shutil.copy(tmp_path / "betboard.db", tmp_path / "upgraded.db")
+
+    conn = db.connect(tmp_path / "upgraded.db")
+    (match,) = db.search_headlines(conn, "overtime")
+    assert match.guid == "espn-0"
@@ -0,0 +1,55 @@
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from betboard.config import AppConfig, MovementConfig
+from betboard.core.ingest import ingest_league
+from betboard.core.replay import parse_rules, replay
+from betboard.storage import db
+
+
+def _seed(path: Path, config: AppConfig, provider: Any) -> None:
+    conn = db.connect(path)
+    provider.prices = [-120, -110, -90, 105]
+    for _ in range(4):
+        ingest_league(conn, config, provider, "americanfootball_nfl")
+    assert len(db.list_movements(conn, "americanfootball_nfl")) == 2
+    conn.close()
+
+
+def test_replay_matches_live_detection_and_counts_rule_sets(
+    tmp_path: Path, sample_config: AppConfig, fake_provider: Any
+) -> None:
+    path = tmp_path / "betboard.db"
+    _seed(path, sample_config, fake_provider)
+    base = MovementConfig()
+    rule_sets = dict(
+        [("default", base), parse_rules("tight:h2h_cents=5,flag_sign_flip=no", base)]
+    )
+
+    report = replay(rule_sets, db_path=path, workers=1)
+    assert report.alerts == {"default": 2, "tight": 3}
+    assert report.by_league == {"americanfootball_nfl": {"default": 2, "tight": 3}}
+    assert report.comparisons == 3
+    assert replay(rule_sets, db_path=path, workers=2) == report
+    # One time range per snapshot: every comparison crosses a shard boundary.
+    assert replay(rule_sets, db_path=path, workers=4) == report
+
+
+def test_parse_rules_rejects_unknown_settings() -> None:
+    with pytest.raises(ValueError):
+        parse_rules("loose:cents=30", MovementConfig())
+
+
+def test_replay_shards_never_compare_past_since(
+    tmp_path: Path, sample_config: AppConfig, fake_provider: Any
+) -> None:
+    path = tmp_path / "betboard.db"
+    _seed(path, sample_config, fake_provider)
+    times = db.snapshot_times(db.connect(path), "americanfootball_nfl")
+    rule_sets = {"default": MovementConfig()}
+
+    report = replay(rule_sets, db_path=path, workers=1, since=times[1])
+    assert report.comparisons == 2
+    assert replay(rule_sets, db_path=path, workers=3, since=times[1]) == report
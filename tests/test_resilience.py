@@ -0,0 +1,129 @@
+import threading
+from typing import Any
+
+import pytest
+
+from betboard.providers.resilience import (
+    HEDGE_PERCENTILE,
+    CircuitOpenError,
+    ResilientClient,
+    RetryPolicy,
+)
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, headers: dict[str, str] | None = None) -> None:
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_client_retries_transient_statuses_honoring_retry_after() -> None:
+    responses = [
+        FakeResponse(429, {"Retry-After": "2"}),
+        FakeResponse(503),
+        FakeResponse(200),
+    ]
+    sent = list(responses)
+    sleeps: list[float] = []
+    client = ResilientClient(
+        send=lambda url, **kwargs: responses.pop(0), sleep=sleeps.append
+    )
+
+    assert client.get("https://example.com/odds").status_code == 200
+    assert [response.closed for response in sent] == [True, True, False]
+    assert sleeps[0] == 2
+    assert 0 <= sleeps[1] <= RetryPolicy().max_delay
+
+
+def test_breaker_opens_and_half_opens_per_endpoint() -> None:
+    clock = FakeClock()
+    statuses = {"/odds": 500, "/events": 200}
+
+    def send(url: str, **kwargs: Any) -> FakeResponse:
+        return FakeResponse(statuses[url.removeprefix("https://example.com")])
+
+    client = ResilientClient(
+        retry=RetryPolicy(attempts=1),
+        failure_threshold=2,
+        reset_seconds=30,
+        send=send,
+        sleep=lambda seconds: None,
+        clock=clock,
+    )
+    for _ in range(2):
+        with pytest.raises(RuntimeError, match="HTTP 500"):
+            client.get("https://example.com/odds")
+
+    with pytest.raises(CircuitOpenError):
+        client.get("https://example.com/odds")
+    assert client.get("https://example.com/events").status_code == 200
+
+    clock.now = 31
+    statuses["/odds"] = 200
+    assert client.get("https://example.com/odds").status_code == 200
+    assert not client.breaker("/odds").is_open
+
+
+def test_breaker_counts_unexpected_errors_during_a_half_open_trial() -> None:
+    clock = FakeClock()
+    failures: list[BaseException] = [ValueError("bad body"), ValueError("bad body")]
+
+    def send(url: str, **kwargs: Any) -> FakeResponse:
+        if failures:
+            raise failures.pop(0)
+        return FakeResponse(200)
+
+    client = ResilientClient(
+        retry=RetryPolicy(attempts=1), failure_threshold=1, send=send, clock=clock
+    )
+    with pytest.raises(ValueError):
+        client.get("https://example.com/odds")
+    assert client.breaker("/odds").is_open
+
+    clock.now = 31
+    with pytest.raises(ValueError):
+        client.get("https://example.com/odds")
+    clock.now = 62
+    assert client.get("https://example.com/odds").status_code == 200
+
+
+def test_client_hedges_requests_slower_than_the_latency_percentile() -> None:
+    release = threading.Event()
+    calls: list[int] = []
+    slow = FakeResponse(200)
+
+    def send(url: str, **kwargs: Any) -> FakeResponse:
+        calls.append(1)
+        if len(calls) == 21:
+            release.wait(timeout=5)
+            return slow
+        return FakeResponse(200)
+
+    client = ResilientClient(
+        hedge_percentile=HEDGE_PERCENTILE, send=send, sleep=lambda seconds: None
+    )
+    for _ in range(20):
+        client.get("https://example.com/odds")
+
+    response = client.get("https://example.com/odds")
+    assert response is not slow and not response.closed
+    assert len(calls) == 22
+    release.set()
+    client._executor().shutdown(wait=True)
+    assert slow.closed
@@ -0,0 +1,55 @@
+from datetime import datetime
+
+from betboard.models import Event
+from betboard.ui.rows import Row, RowDiff, compile_filter, diff_rows
+
+
+def _apply(current: list[Row], target: list[Row], diff: RowDiff) -> list[Row]:
+    labels = dict(target)
+    rows = [row for row in current if row[0] not in diff.removed]
+    for index, key in diff.inserted:
+        rows.insert(index, (key, labels[key]))
+    return [(key, labels[key]) if key in diff.changed else (key, label) for key, label in rows]
+
+
+def test_diff_rows_patches_in_place() -> None:
+    current = [("a", "A"), ("b", "B"), ("c", "C")]
+    target = [("a", "A"), ("b", "B2"), ("c", "C")]
+    diff = diff_rows(current, target)
+    assert diff == RowDiff(removed=(), inserted=(), changed=("b",))
+
+
+def test_diff_rows_insert_remove_and_move() -> None:
+    current = [("a", "A"), ("b", "B"), ("c", "C"), ("d", "D")]
+    target = [("c", "C"), ("a", "A"), ("e", "E"), ("d", "D2")]
+    diff = diff_rows(current, target)
+    assert "b" in diff.removed
+    assert len(diff.removed) == 2
+    assert len(diff.inserted) == 2
+    assert diff.changed == ("d",)
+    assert _apply(current, target, diff) == target
+
+
+def test_diff_rows_unchanged_is_empty() -> None:
+    rows = [("a", "A"), ("b", "B")]
+    assert diff_rows(rows, rows).is_empty
+
+
+def test_compile_filter_matches_team_and_time() -> None:
+    # A Sunday, 17:00 in the local zone the filter compares against.
+    start = datetime(2026, 10, 18, 17, 0).astimezone()
+    event = Event(
+        event_id="1",
+        league_key="americanfootball_nfl",
+        sport_title="NFL",
+        home_team="Chicago Bears",
+        away_team="Green Bay Packers",
+        start_time=start,
+    )
+    assert compile_filter("")(event)
+    assert compile_filter("bears")(event)
+    assert compile_filter("PACK sun")(event)
+    assert compile_filter(">17:00")(event)
+    assert not compile_filter(">18:00")(event)
+    assert not compile_filter("lions")(event)
+    assert not compile_filter("mon")(event)
@@ -1,6 +1,10 @@
 from datetime import datetime, timezone
 
-from betboard.core.serialization import event_odds_to_payload, payload_to_event_odds
+from betboard.core.serialization import (
+    event_odds_to_payload,
+    partition_by_market,
+    payload_to_event_odds,
+)
 from betboard.models import Event, EventOdds, MarketOdds, OddsPrice
 
 
@@ -31,3 +35,39 @@ def test_event_odds_roundtrip() -> None:
     assert restored.event.event_id == odds.event.event_id
     assert restored.markets[0].book == odds.markets[0].book
     assert restored.markets[0].prices[0].price == odds.markets[0].prices[0].price
+
+
+def test_partition_by_market_keeps_only_each_markets_rows() -> None:
+    now = datetime.now(timezone.utc)
+    event = Event(
+        event_id="1",
+        league_key="americanfootball_nfl",
+        sport_title="NFL",
+        home_team="Home",
+        away_team="Away",
+        start_time=now,
+    )
+    odds = EventOdds(
+        event=event,
+        markets=tuple(
+            MarketOdds(
+                market=market,
+                book=book,
+                last_update=now,
+                prices=(OddsPrice(outcome="Home", price=-110),),
+                point=-3.5 if market == "spreads" else None,
+            )
+            for market in ("h2h", "spreads")
+            for book in ("book1", "book2")
+        ),
+    )
+
+    partitions = partition_by_market([odds], ["h2h", "spreads", "totals"])
+
+    assert partitions["totals"] == []
+    (h2h,) = partitions["h2h"]
+    assert [m["book"] for m in h2h["markets"]] == ["book1", "book2"]
+    assert {m["market"] for m in h2h["markets"]} == {"h2h"}
+    (spreads,) = partitions["spreads"]
+    assert payload_to_event_odds(spreads).markets[0].point == -3.5
+    assert h2h["event"] == event_odds_to_payload(odds)["event"]
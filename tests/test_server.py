@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import gzip
+import threading
+import urllib.error
+import urllib.request
+from collections.abc import Iterator
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from betboard.api.server import STREAM_PATH, BetBoardServer, ServeState
+from betboard.config import load_config
+from betboard.models import Headline, MovementEvent
+from betboard.storage import db
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+class FakeNews:
+    name = "fake"
+
+    def fetch_headlines(self, league_key: str, limit: int) -> list[Headline]:
+        return [
+            Headline(
+                title=f"Headline {index} for {league_key}",
+                url=f"https://example.com/{index}",
+                published_at=datetime(2026, 10, 18, 12, 0),
+                source="fake",
+            )
+            for index in range(limit)
+        ]
+
+
+@pytest.fixture
+def base_url(tmp_path: Path) -> Iterator[str]:
+    config = load_config(ROOT / "config.sample.toml")
+    state = ServeState(config, "oddsapi", FakeNews(), db_path=tmp_path / "betboard.db")
+    server = BetBoardServer(("127.0.0.1", 0), state, workers=2)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _get(url: str, **headers: str) -> tuple[int, dict[str, str], bytes]:
+    request = urllib.request.Request(url, headers=headers)
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status, dict(response.headers), response.read()
+    except urllib.error.HTTPError as exc:
+        return exc.code, dict(exc.headers), exc.read()
+
+
+def test_serve_returns_not_modified_for_matching_etag(base_url: str) -> None:
+    status, headers, body = _get(f"{base_url}/leagues/nfl/headlines")
+    assert status == 200
+    assert b"Headline 0 for americanfootball_nfl" in body
+
+    status, _, body = _get(
+        f"{base_url}/leagues/nfl/headlines", **{"If-None-Match": headers["ETag"]}
+    )
+    assert status == 304
+    assert body == b""
+
+
+def test_serve_gzips_large_bodies(base_url: str) -> None:
+    plain_status, plain_headers, plain = _get(f"{base_url}/leagues/nfl/headlines")
+    status, headers, body = _get(
+        f"{base_url}/leagues/nfl/headlines", **{"Accept-Encoding": "gzip"}
+    )
+    assert status == plain_status == 200
+    assert headers["Content-Encoding"] == "gzip"
+    assert headers["ETag"] != plain_headers["ETag"]
+    assert gzip.decompress(body) == plain
+
+
+def test_serve_reports_unknown_paths(base_url: str) -> None:
+    assert _get(f"{base_url}/nope")[0] == 404
+    assert _get(f"{base_url}/leagues/nfl/nope")[0] == 404
+
+
+def test_serve_streams_movements_from_cursor(tmp_path: Path, base_url: str) -> None:
+    conn = db.connect(tmp_path / "betboard.db")
+    (movement_id,) = db.record_movement_events(
+        conn,
+        [
+            MovementEvent(
+                league_key="americanfootball_nfl",
+                event_id="1",
+                created_at=datetime(2026, 10, 18, 17, 0),
+                details={"delta": 30},
+            )
+        ],
+    )
+
+    request = urllib.request.Request(
+        f"{base_url}/movements/stream?league=nfl", headers={"Last-Event-ID": "0"}
+    )
+    with urllib.request.urlopen(request, timeout=5) as response:
+        assert response.headers["Content-Type"] == "text/event-stream"
+        lines = [response.readline().decode().strip() for _ in range(3)]
+
+    assert lines[0] == f"id: {movement_id}"
+    assert lines[1] == "event: movement"
+    assert '"delta": 30' in lines[2]
+
+
+def test_streams_run_outside_the_request_pool_and_end_on_close(tmp_path: Path) -> None:
+    config = load_config(ROOT / "config.sample.toml")
+    state = ServeState(config, "oddsapi", FakeNews(), db_path=tmp_path / "betboard.db")
+    server = BetBoardServer(("127.0.0.1", 0), state, workers=1, max_streams=1)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    with urllib.request.urlopen(f"{base_url}{STREAM_PATH}", timeout=5) as stream:
+        assert _get(f"{base_url}{STREAM_PATH}")[0] == 503
+        assert _get(f"{base_url}/watchlist")[0] == 200
+        server.shutdown()
+        server.server_close()
+        assert stream.readline() == b""
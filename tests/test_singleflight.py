@@ -0,0 +1,145 @@
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from betboard.core.singleflight import CoalescingOddsProvider, SharedFlight, SingleFlight
+from betboard.models import EventOdds
+from betboard.storage import db
+
+
+def test_single_flight_shares_one_call_between_threads() -> None:
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls: list[int] = []
+
+    def fetch() -> str:
+        calls.append(1)
+        started.set()
+        release.wait(timeout=5)
+        return "odds"
+
+    results: list[str] = []
+    leader = threading.Thread(target=lambda: results.append(flight.do("k", fetch)))
+    leader.start()
+    started.wait(timeout=5)
+    follower = threading.Thread(target=lambda: results.append(flight.do("k", fetch)))
+    follower.start()
+    time.sleep(0.1)
+    release.set()
+    leader.join()
+    follower.join()
+
+    assert results == ["odds", "odds"]
+    assert len(calls) == 1
+
+
+def test_shared_flight_hands_the_result_to_waiting_processes(tmp_path: Path) -> None:
+    path = tmp_path / "betboard.db"
+    db.connect(path).close()
+    started = threading.Event()
+    waiting = threading.Event()
+    release = threading.Event()
+    calls: list[int] = []
+
+    def poll(seconds: float) -> None:
+        waiting.set()
+        time.sleep(seconds)
+
+    def flight() -> SharedFlight[list[int]]:
+        return SharedFlight(
+            lambda: db.connect(path),
+            encode=list,
+            decode=list,
+            poll_seconds=0.01,
+            sleep=poll,
+        )
+
+    def fetch() -> list[int]:
+        calls.append(1)
+        started.set()
+        release.wait(timeout=5)
+        return [1, 2, 3]
+
+    results: list[list[int]] = []
+    leader = threading.Thread(target=lambda: results.append(flight().do("k", fetch)))
+    leader.start()
+    started.wait(timeout=5)
+    waiter = threading.Thread(target=lambda: results.append(flight().do("k", fetch)))
+    waiter.start()
+    waiting.wait(timeout=5)
+    release.set()
+    leader.join()
+    waiter.join()
+
+    assert results == [[1, 2, 3], [1, 2, 3]]
+    assert len(calls) == 1
+    assert flight().do("k", lambda: [4]) == [4]
+
+
+class BulkProvider:
+    name = "bulk"
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def get_odds(
+        self,
+        league_key: str,
+        markets: list[str],
+        regions: str,
+        books_filter: list[str] | None,
+    ) -> list[EventOdds]:
+        self.calls.append(league_key)
+        if league_key == "mma_mixed_martial_arts":
+            raise RuntimeError("404")
+        self.started.set()
+        self.release.wait(timeout=5)
+        return []
+
+    def get_odds_bulk(
+        self,
+        league_keys: list[str],
+        markets: list[str],
+        regions: str,
+        books_filter: list[str] | None,
+    ) -> dict[str, list[EventOdds] | Exception]:
+        raise AssertionError("bulk fetches go through the per-league flights")
+
+
+def test_coalescing_provider_bulk_shares_per_league_fetches(
+    tmp_path: Path, fake_provider: Any
+) -> None:
+    path = tmp_path / "betboard.db"
+    db.connect(path).close()
+    inner = BulkProvider()
+    provider = CoalescingOddsProvider(inner, lambda: db.connect(path))
+    leagues = ["americanfootball_nfl", "mma_mixed_martial_arts"]
+
+    single: list[list[EventOdds]] = []
+    bulk: list[dict[str, list[EventOdds] | Exception]] = []
+    leader = threading.Thread(
+        target=lambda: single.append(
+            provider.get_odds("americanfootball_nfl", ["h2h"], "us", None)
+        )
+    )
+    leader.start()
+    inner.started.wait(timeout=5)
+    follower = threading.Thread(
+        target=lambda: bulk.append(provider.get_odds_bulk(leagues, ["h2h"], "us", None))
+    )
+    follower.start()
+    time.sleep(0.1)
+    inner.release.set()
+    leader.join()
+    follower.join()
+
+    assert single == [[]]
+    assert bulk[0]["americanfootball_nfl"] == []
+    assert isinstance(bulk[0]["mma_mixed_martial_arts"], RuntimeError)
+    assert sorted(inner.calls) == sorted(leagues)
+    single = CoalescingOddsProvider(fake_provider, lambda: db.connect(path))
+    assert not hasattr(single, "get_odds_bulk")